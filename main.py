@@ -8,18 +8,23 @@ import pygame
 import math
 import random
 import asyncio
+import struct
 import sys
+import time
 
 # Conditional imports for desktop vs web
 try:
     import socket
+    import selectors
     import threading
-    import pickle
     NETWORK_AVAILABLE = True
 except ImportError:
     NETWORK_AVAILABLE = False
 
+from collections import defaultdict
 from enum import Enum
+from itertools import compress
+from operator import attrgetter
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple, Any
 
@@ -355,6 +360,45 @@ sound_manager = SoundManager()
 SCREEN_WIDTH = 1400
 SCREEN_HEIGHT = 900
 FPS = 60
+MAX_FRAME_DT = 0.05  # Longer frames (window drag, GC pause, tab switch) are simulated as this
+FIXED_DT = 1 / FPS  # The simulation always steps by exactly this much
+CAMERA_SMOOTHING = 5.0  # Camera closes 1 - e^(-5t) of the gap to its target over t seconds
+GRID_SHIFT = 7  # Spatial hash cells are 128px (coordinate >> 7)
+WALL_GRID_SHIFT = 8  # Walls are binned into 256px cells for zombie targeting
+WALL_TARGET_RANGE = 200  # Zombies divert to a wall closer than this (and than their target)
+DECOR_CELL_SHIFT = 9  # Rocks/shrubs/craters are binned into 512px cells for culling
+BULLET_MAP_MARGIN = 100  # Bullets this far outside the world are discarded
+BULLET_PREWARM = 512  # Bullets built when a world starts, so early firefights never allocate
+ZOMBIE_DRAW_MARGIN = 50  # Zombie extras (scream rings, glows, arms) reach size * 2 + this
+INV_SQRT2 = 0.7071067811865476  # 1/sqrt(2), scales diagonal movement to unit speed
+
+# Coarse cos/sin lookup for purely visual placement (arms, bumps, shells, flashes).
+# 64 bins = ~5.6 degrees, invisible at these sizes; aiming/physics keep math.cos/sin.
+TRIG_BINS = 64
+TRIG_SCALE = TRIG_BINS / (2 * math.pi)
+COS_LUT = [math.cos(i / TRIG_SCALE) for i in range(TRIG_BINS)]
+SIN_LUT = [math.sin(i / TRIG_SCALE) for i in range(TRIG_BINS)]
+
+
+def fast_cos_sin(angle):
+    """Approximate (cos, sin) of angle from the lookup tables."""
+    i = int(round(angle * TRIG_SCALE)) & (TRIG_BINS - 1)
+    return COS_LUT[i], SIN_LUT[i]
+
+
+# Pre-rolled uniform [0, 1) samples consumed by particle bursts on the
+# pure-Python path, so each particle costs table loads instead of random calls
+BURST_NOISE_SIZE = 4096  # Power of two, indexed with a mask
+BURST_NOISE = [random.random() for _ in range(BURST_NOISE_SIZE)]
+# Generator for per-shot samples drawn as one batch (shotgun pellet spreads)
+SHOT_RNG = np.random.default_rng() if NUMPY_AVAILABLE else None
+
+# Main menu keys that start local play with that many players
+MENU_PLAYER_COUNT_KEYS = {pygame.K_1: 1, pygame.K_2: 2, pygame.K_3: 3}
+
+# Stand-in for a pygame.key.get_pressed() snapshot before the first frame:
+# reads as False for every key
+NO_KEYS = defaultdict(bool)
 
 # Colors
 BLACK = (0, 0, 0)
@@ -372,6 +416,86 @@ DARK_GREEN = (0, 100, 0)
 LIGHT_BLUE = (135, 206, 235)
 DARK_RED = (139, 0, 0)
 ZOMBIE_GREEN = (50, 120, 50)
+MUZZLE_COLORS = (YELLOW, ORANGE, (255, 200, 100))  # Muzzle flash particle palette
+SHELL_COLOR = (180, 140, 60)  # Brass casing
+EXPLOSION_COLORS = (ORANGE, RED, YELLOW)  # Explosion particle palette
+BLOOD_SHADES = tuple((r, 0, 0) for r in range(100, 181, 10))  # Blood particle palette
+
+def optimize_surface(surface):
+    """Convert a cached surface to the display's pixel format so blits take the fast path.
+
+    Surfaces built before the display exists (module-level sprites) are returned unchanged.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+# Fonts and labels used by entity draw code every frame - built once, not per call
+FONT_16 = pygame.font.Font(None, 16)
+FONT_18 = pygame.font.Font(None, 18)
+FONT_20 = pygame.font.Font(None, 20)
+FONT_24 = pygame.font.Font(None, 24)
+RELOADING_LABEL = FONT_18.render("RELOADING", True, YELLOW)
+RELOADING_LABEL_HALF_WIDTH = RELOADING_LABEL.get_width() // 2
+BUNKER_LABEL = FONT_24.render("BUNKER - Press B to change class", True, WHITE)
+BUNKER_LABEL_HALF_WIDTH = BUNKER_LABEL.get_width() // 2
+CRATE_LABEL = FONT_16.render("?", True, (255, 255, 0))
+# player_id -> rendered "P1", "P2", ...; the four local/network slots up front
+PLAYER_ID_LABELS = {i: FONT_20.render(f"P{i + 1}", True, WHITE) for i in range(4)}
+COIN_LABELS = {}  # coin size -> rendered "$"
+TEXT_CACHE = {}  # (font, text, color) -> rendered menu/HUD text
+CENTERED_TEXT_CACHE = {}  # (font, text, color, y) -> (rendered text, centered position)
+TEXT_CACHE_LIMIT = 512  # Changing HUD numbers keep adding keys; start over past this
+
+
+def render_text(font, text, color):
+    """Render antialiased text once and reuse the Surface on later frames."""
+    key = (font, text, color)
+    surface = TEXT_CACHE.get(key)
+    if surface is None:
+        if len(TEXT_CACHE) >= TEXT_CACHE_LIMIT:
+            TEXT_CACHE.clear()
+        surface = optimize_surface(font.render(text, True, color))
+        TEXT_CACHE[key] = surface
+    return surface
+
+
+def centered_text(font, text, color, y):
+    """Return (surface, position) for text centered across the screen at height y.
+
+    The centering is cached with the surface, so callers can blit(*centered_text(...)).
+    """
+    key = (font, text, color, y)
+    placed = CENTERED_TEXT_CACHE.get(key)
+    if placed is None:
+        if len(CENTERED_TEXT_CACHE) >= TEXT_CACHE_LIMIT:
+            CENTERED_TEXT_CACHE.clear()
+        surface = render_text(font, text, color)
+        placed = (surface, (SCREEN_WIDTH//2 - surface.get_width()//2, y))
+        CENTERED_TEXT_CACHE[key] = placed
+    return placed
+
+
+# Reload progress ring, pre-drawn in 36 steps from empty to full
+RELOAD_ARC_STEPS = 36
+
+
+def build_reload_arc_frames():
+    """Pre-render the reload ring at each progress step."""
+    frames = []
+    for i in range(RELOAD_ARC_STEPS):
+        frame = pygame.Surface((40, 40), pygame.SRCALPHA)
+        progress = i / (RELOAD_ARC_STEPS - 1)
+        pygame.draw.arc(frame, YELLOW, (0, 0, 40, 40),
+                        -math.pi/2, -math.pi/2 + progress * math.tau, 3)
+        frames.append(frame)
+    return frames
+
+
+RELOAD_ARC_FRAMES = build_reload_arc_frames()
 
 # Firebase configuration
 FIREBASE_URL = "https://zombie-survival-1da6c-default-rtdb.firebaseio.com"
@@ -634,6 +758,10 @@ class GameState(Enum):
     REGISTER = 10  # Registration screen
     LOGIN = 11  # Login screen
 
+# Screens that change without input (the world, network lobby status) and so
+# are redrawn every frame; the rest only redraw after an event or state change
+LIVE_DRAW_STATES = frozenset({GameState.PLAYING, GameState.HOST_GAME, GameState.JOIN_GAME})
+
 # Player Classes
 class PlayerClass(Enum):
     BUILDER = 1
@@ -642,13 +770,45 @@ class PlayerClass(Enum):
     TANK = 4
     TRAITOR = 5  # Betrays team, allied with zombies
 
+# HUD class indicator labels
+HUD_CLASS_NAMES = {
+    PlayerClass.BUILDER: "BUILDER",
+    PlayerClass.RANGER: "RANGER",
+    PlayerClass.HEALER: "HEALER",
+    PlayerClass.TANK: "TANK"
+}
+
 # Desert colors
 SAND = (210, 180, 140)
 DARK_SAND = (180, 150, 110)
 LIGHT_SAND = (230, 210, 170)
 
+def gun_draw_style(weapon_name):
+    """Pick which gun shape to draw for a weapon, from keywords in its name."""
+    weapon_name = weapon_name.lower()
+    if 'pistol' in weapon_name or 'deagle' in weapon_name:
+        return "pistol"
+    elif 'rifle' in weapon_name or 'assault' in weapon_name:
+        return "rifle"
+    elif 'sniper' in weapon_name or 'marksman' in weapon_name:
+        return "sniper"
+    elif 'shotgun' in weapon_name:
+        return "shotgun"
+    elif 'smg' in weapon_name or 'pdw' in weapon_name:
+        return "smg"
+    elif 'minigun' in weapon_name or 'cyclone' in weapon_name:
+        return "minigun"
+    elif 'rocket' in weapon_name or 'rpg' in weapon_name:
+        return "rocket"
+    elif 'grenade' in weapon_name or 'launcher' in weapon_name:
+        return "grenade"
+    elif 'knife' in weapon_name:
+        return "knife"
+    return "default"
+
+
 # Weapon Types - Realistic Stats
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WeaponStats:
     name: str
     damage: int
@@ -666,6 +826,25 @@ class WeaponStats:
     penetration: int = 1  # how many enemies bullet can hit
     caliber: str = "9mm"  # bullet type for display
     special: str = ""  # special effect: "burn", "freeze", "chain"
+    # Derived per-shot constants, filled in once by __post_init__
+    fire_period: float = field(init=False, repr=False)  # seconds between shots
+    range_sq: float = field(init=False, repr=False)  # range squared for distance checks
+    recoil_cap: float = field(init=False, repr=False)  # max accumulated recoil
+    draw_style: str = field(init=False, repr=False)  # key into GUN_DRAWERS
+    shell_size: int = field(init=False, repr=False)  # ejected casing size
+    flash_size: int = field(init=False, repr=False)  # muzzle flash radius
+
+    def __post_init__(self):
+        # Stats are shared, read-only templates; the derived fields are set
+        # once here, past the frozen __setattr__
+        name = self.name.lower()
+        for attr, value in (('fire_period', 1.0 / self.fire_rate),
+                            ('range_sq', self.range * self.range),
+                            ('recoil_cap', self.spread * 3),
+                            ('draw_style', gun_draw_style(self.name)),
+                            ('shell_size', 4 if 'pistol' in name or 'smg' in name else 6),
+                            ('flash_size', int(15 + self.damage / 10))):
+            object.__setattr__(self, attr, value)
 
 # Realistic weapon definitions based on real firearms
 WEAPONS = {
@@ -1148,12 +1327,471 @@ def get_weapon_rarity(weapon_key):
         return "Legendary", (255, 180, 0)  # Gold/Orange
 
 
+class EntityPool:
+    """Fixed-capacity pool: live entities packed at the front, dead ones kept for reuse."""
+    def __init__(self, entity_class, capacity):
+        self.entity_class = entity_class
+        self.capacity = capacity
+        self.items = []  # items[:count] are alive, the rest are recycled
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        items = self.items
+        for i in range(self.count):
+            yield items[i]
+
+    def spawn(self, *args):
+        """Reset a dead entity (or build a new one) and return it, None if full."""
+        count = self.count
+        if count >= self.capacity:
+            return None
+        if count < len(self.items):
+            entity = self.items[count]
+            entity.reset(*args)
+        else:
+            entity = self.entity_class(*args)
+            self.items.append(entity)
+        self.count = count + 1
+        return entity
+
+    def append(self, entity):
+        """Add an already-built entity."""
+        count = self.count
+        if count >= self.capacity:
+            return
+        if count < len(self.items):
+            self.items[count] = entity
+        else:
+            self.items.append(entity)
+        self.count = count + 1
+
+    def prewarm(self, count, *args):
+        """Build up to count dead entities ahead of time so spawn() never allocates."""
+        items = self.items
+        for _ in range(min(count, self.capacity) - len(items)):
+            items.append(self.entity_class(*args))
+
+    def kill(self, index):
+        """Remove the entity at index by swapping it with the last live one - O(1)."""
+        last = self.count - 1
+        items = self.items
+        items[index], items[last] = items[last], items[index]
+        self.count = last
+
+    def update(self, dt):
+        """Update every live entity, killing those whose update() returns False."""
+        items = self.items
+        # Walk backwards so the entity swapped in by kill() was already updated
+        for i in range(self.count - 1, -1, -1):
+            if not items[i].update(dt):
+                self.kill(i)
+
+    def clear(self):
+        self.count = 0
+
+
+class SpatialHash:
+    """Uniform grid of 128px cells; a circle is filed under every cell it touches."""
+    def __init__(self, shift=GRID_SHIFT):
+        self.shift = shift
+        self.cells = {}  # (cell_x, cell_y) -> objects
+
+    def clear(self):
+        self.cells = {}
+
+    def insert(self, obj, x, y, reach):
+        """File obj under every cell overlapped by the circle (x, y, reach)."""
+        shift = self.shift
+        cells = self.cells
+        x0 = int(x - reach) >> shift
+        x1 = int(x + reach) >> shift
+        y0 = int(y - reach) >> shift
+        y1 = int(y + reach) >> shift
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [obj]
+                else:
+                    bucket.append(obj)
+
+    def query_buckets(self, x, y, radius):
+        """Buckets of every cell the circle touches.
+
+        Cheaper than query_circle for point objects (filed with reach 0): each
+        one sits in exactly one bucket, so nothing needs de-duplicating.
+        """
+        shift = self.shift
+        cells = self.cells
+        buckets = []
+        for cx in range(int(x - radius) >> shift, (int(x + radius) >> shift) + 1):
+            for cy in range(int(y - radius) >> shift, (int(y + radius) >> shift) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    buckets.append(bucket)
+        return buckets
+
+    def query_circle(self, x, y, radius):
+        """Objects filed near the circle, each once (callers still test the distance)."""
+        shift = self.shift
+        cells = self.cells
+        found = {}  # dict rather than set keeps a stable iteration order
+        for cx in range(int(x - radius) >> shift, (int(x + radius) >> shift) + 1):
+            for cy in range(int(y - radius) >> shift, (int(y + radius) >> shift) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for obj in bucket:
+                        found[obj] = None
+        return found
+
+
+DOT_SPRITES = {}  # (color, radius) -> pre-drawn filled circle
+
+
+def get_dot_sprite(color, radius):
+    """Return a cached filled circle for batching small dots into one blits() call."""
+    key = (color, radius)
+    sprite = DOT_SPRITES.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        sprite = optimize_surface(sprite)
+        DOT_SPRITES[key] = sprite
+    return sprite
+
+
+MARKER_SPRITES = {}  # color -> minimap player dot with a white ring
+SHADOW_SPRITES = {}  # size -> elliptical character shadow
+SPLATTER_SPRITES = {}  # size -> ground blood splatter
+
+
+def get_marker_sprite(color):
+    sprite = MARKER_SPRITES.get(color)
+    if sprite is None:
+        sprite = pygame.Surface((8, 8), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (4, 4), 4)
+        pygame.draw.circle(sprite, WHITE, (4, 4), 4, 1)
+        sprite = optimize_surface(sprite)
+        MARKER_SPRITES[color] = sprite
+    return sprite
+
+
+def get_shadow_sprite(size):
+    sprite = SHADOW_SPRITES.get(size)
+    if sprite is None:
+        sprite = pygame.Surface((size * 2, size), pygame.SRCALPHA)
+        pygame.draw.ellipse(sprite, (0, 0, 0, 50), (0, 0, size * 2, size))
+        sprite = optimize_surface(sprite)
+        SHADOW_SPRITES[size] = sprite
+    return sprite
+
+
+def get_splatter_sprite(size):
+    """Irregular blood shape centered in a (2*size, 2*size) sprite."""
+    sprite = SPLATTER_SPRITES.get(size)
+    if sprite is None:
+        sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        color = (80, 0, 0)
+        pygame.draw.circle(sprite, color, (size, size), size)
+        pygame.draw.circle(sprite, color, (size + size//3, size - size//4), size//2)
+        pygame.draw.circle(sprite, color, (size - size//4, size + size//3), size//2)
+        sprite = optimize_surface(sprite)
+        SPLATTER_SPRITES[size] = sprite
+    return sprite
+
+
+PARTICLE_GRAVITY = 200  # Downward pull on particles, px/s^2
+
+
+class Particle:
+    """Particle effect for explosions, blood, etc."""
+    __slots__ = ('x', 'y', 'color', 'vx', 'vy', 'lifetime', 'max_lifetime', 'size')
+
+    def __init__(self, x, y, color, velocity, lifetime, size=3):
+        self.reset(x, y, color, velocity, lifetime, size)
+
+    def reset(self, x, y, color, velocity, lifetime, size=3):
+        self.x = x
+        self.y = y
+        self.color = color
+        self.vx, self.vy = velocity
+        self.lifetime = lifetime
+        self.max_lifetime = lifetime
+        self.size = size
+
+    def draw(self, screen, camera_offset):
+        alpha = self.lifetime / self.max_lifetime
+        size = int(self.size * alpha)
+        if size > 0:
+            pygame.draw.circle(screen, self.color,
+                             (int(self.x - camera_offset[0]), int(self.y - camera_offset[1])), size)
+
+
+class ParticleSystem:
+    """Structure-of-arrays particle store, updated with numpy when available.
+
+    Without numpy it falls back to an EntityPool of Particle objects. With
+    shrink set, particles are drawn smaller as they age; otherwise they keep
+    full size until they expire.
+    """
+    def __init__(self, capacity, shrink=True):
+        self.capacity = capacity
+        self.shrink = shrink
+        self.count = 0
+        self.palette = []  # color index -> RGB tuple
+        self.palette_ids = {}  # RGB tuple -> color index
+        self.palette_sets = {}  # colors tuple -> int16 array of their color indices
+        if NUMPY_AVAILABLE:
+            self.pool = None
+            self.x = np.empty(capacity, np.float32)
+            self.y = np.empty(capacity, np.float32)
+            self.vx = np.empty(capacity, np.float32)
+            self.vy = np.empty(capacity, np.float32)
+            self.life = np.empty(capacity, np.float32)
+            self.max_life = np.empty(capacity, np.float32)
+            self.size = np.empty(capacity, np.float32)
+            self.color = np.empty(capacity, np.int16)
+            self.arrays = (self.x, self.y, self.vx, self.vy, self.life, self.max_life, self.size, self.color)
+            self.scratch = np.empty(capacity, np.float32)  # Reused temporary for update()
+            # Uniform samples for burst(): angle, speed, life, size and color rows
+            self.rng = np.random.default_rng()
+            self.noise = np.empty(5 * capacity, np.float32)
+        else:
+            self.pool = EntityPool(Particle, capacity)
+            self.noise_cursor = 0  # Next BURST_NOISE sample
+
+    def __len__(self):
+        return self.count if self.pool is None else len(self.pool)
+
+    def color_id(self, color):
+        color_id = self.palette_ids.get(color)
+        if color_id is None:
+            color_id = len(self.palette)
+            self.palette.append(color)
+            self.palette_ids[color] = color_id
+        return color_id
+
+    def burst(self, x, y, colors, count, speed_range, life_range, size_range, angle=0.0, spread=math.pi):
+        """Spawn count particles from (x, y) heading within angle +- spread.
+
+        Each particle picks a random color from colors and a random size in
+        the inclusive size_range.
+        """
+        if self.pool is not None:
+            spawn = self.pool.spawn
+            noise = BURST_NOISE
+            mask = BURST_NOISE_SIZE - 1
+            k = self.noise_cursor
+            speed_lo, speed_span = speed_range[0], speed_range[1] - speed_range[0]
+            life_lo, life_span = life_range[0], life_range[1] - life_range[0]
+            size_lo, size_count = size_range[0], size_range[1] - size_range[0] + 1
+            color_count = len(colors)
+            for _ in range(count):
+                cos_a, sin_a = fast_cos_sin(angle + spread * (2 * noise[k & mask] - 1))
+                p_speed = speed_lo + speed_span * noise[(k + 1) & mask]
+                spawn(x, y, colors[int(noise[(k + 2) & mask] * color_count)],
+                      (cos_a * p_speed, sin_a * p_speed),
+                      life_lo + life_span * noise[(k + 3) & mask],
+                      size_lo + int(noise[(k + 4) & mask] * size_count))
+                k += 5
+            self.noise_cursor = k & mask
+            return
+
+        start = self.count
+        count = min(count, self.capacity - start)
+        if count <= 0:
+            return
+        end = start + count
+        # Draw every sample into the preallocated noise rows, then scale them in
+        # place and write straight into the backing arrays
+        noise = self.noise[:5 * count].reshape(5, count)
+        self.rng.random(out=noise, dtype=np.float32)
+        angles, speeds, lives, sizes, picks = noise
+        angles *= 2 * spread
+        angles += angle - spread
+        speeds *= speed_range[1] - speed_range[0]
+        speeds += speed_range[0]
+        self.x[start:end] = x
+        self.y[start:end] = y
+        vx = self.vx[start:end]
+        np.cos(angles, out=vx)
+        vx *= speeds
+        vy = self.vy[start:end]
+        np.sin(angles, out=vy)
+        vy *= speeds
+        life = self.life[start:end]
+        np.multiply(lives, life_range[1] - life_range[0], out=life)
+        life += life_range[0]
+        self.max_life[start:end] = life
+        # Inclusive integer sizes; the clamp guards float32 rounding up to 1.0
+        size = self.size[start:end]
+        size_count = size_range[1] - size_range[0] + 1
+        np.multiply(sizes, size_count, out=size)
+        np.floor(size, out=size)
+        np.minimum(size, size_count - 1, out=size)
+        size += size_range[0]
+        if len(colors) == 1:
+            self.color[start:end] = self.color_id(colors[0])
+        else:
+            # Multi-color bursts reuse the same few tuples (blood shades,
+            # muzzle flash, explosion), so their index arrays are built once
+            color_ids = self.palette_sets.get(colors)
+            if color_ids is None:
+                color_ids = np.array([self.color_id(c) for c in colors], np.int16)
+                self.palette_sets[colors] = color_ids
+            picks *= len(colors)
+            self.color[start:end] = color_ids[np.minimum(picks.astype(np.intp), len(colors) - 1)]
+        self.count = end
+
+    def update(self, dt):
+        if self.pool is not None:
+            # One loop over the pooled Particles: no method call per particle,
+            # dead ones swapped out backwards as EntityPool.update does
+            pool = self.pool
+            items = pool.items
+            gravity = PARTICLE_GRAVITY * dt
+            for i in range(pool.count - 1, -1, -1):
+                particle = items[i]
+                particle.x += particle.vx * dt
+                particle.y += particle.vy * dt
+                particle.vy += gravity
+                particle.lifetime -= dt
+                if particle.lifetime <= 0:
+                    pool.kill(i)
+            return
+        n = self.count
+        if n == 0:
+            return
+        # Write products into the scratch buffer rather than allocating temporaries
+        step = self.scratch[:n]
+        np.multiply(self.vx[:n], dt, out=step)
+        self.x[:n] += step
+        np.multiply(self.vy[:n], dt, out=step)
+        self.y[:n] += step
+        self.vy[:n] += PARTICLE_GRAVITY * dt
+        life = self.life[:n]
+        life -= dt
+        # Compact survivors to the front in one gather per array
+        alive = np.flatnonzero(life > 0)
+        kept = len(alive)
+        if kept != n:
+            for array in self.arrays:
+                array[:kept] = array[alive]
+            self.count = kept
+
+    def draw(self, screen, camera_offset):
+        """Draw every particle as one batched blit of cached dots."""
+        dots = []
+        cam_x, cam_y = camera_offset
+        if self.pool is not None:
+            shrink = self.shrink
+            for particle in self.pool:
+                if shrink:
+                    radius = int(particle.size * (particle.lifetime / particle.max_lifetime))
+                else:
+                    radius = int(particle.size)
+                if radius > 0:
+                    left = int(particle.x - cam_x) - radius
+                    top = int(particle.y - cam_y) - radius
+                    if -2 * radius < left < SCREEN_WIDTH and -2 * radius < top < SCREEN_HEIGHT:
+                        dots.append((get_dot_sprite(particle.color, radius), (left, top)))
+        elif self.count:
+            n = self.count
+            if self.shrink:
+                radius = (self.size[:n] * (self.life[:n] / self.max_life[:n])).astype(np.int32)
+            else:
+                radius = self.size[:n].astype(np.int32)
+            left = (self.x[:n] - cam_x).astype(np.int32) - radius
+            top = (self.y[:n] - cam_y).astype(np.int32) - radius
+            # Cull dead-sized and off-screen dots before dropping back to Python
+            diameter = radius * 2
+            shown = np.flatnonzero((radius > 0) & (left > -diameter) & (left < SCREEN_WIDTH)
+                                   & (top > -diameter) & (top < SCREEN_HEIGHT))
+            palette = self.palette
+            for r, px, py, c in zip(radius[shown].tolist(), left[shown].tolist(),
+                                    top[shown].tolist(), self.color[shown].tolist()):
+                dots.append((get_dot_sprite(palette[c], r), (px, py)))
+        screen.blits(dots, doreturn=False)
+
+    def clear(self):
+        self.count = 0
+        if self.pool is not None:
+            self.pool.clear()
+
+
+DEBRIS_TYPES = ('rock', 'crack', 'rubble', 'bones')
+BLOOD_SPLATTER_LIMIT = 100  # Ground splatters kept before the oldest is reused
+
+
+def build_debris_sprite(d):
+    """Pre-draw one ground debris item; returns (sprite, offset of its top-left from the item)."""
+    size = d['size']
+    half = size + 12  # Room for rubble spread and line widths around the item
+    sprite = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    c = d['color_var']
+    if d['type'] == 'rock':
+        pygame.draw.circle(sprite, (150 + c, 140 + c, 130 + c), (half, half), size // 2)
+    elif d['type'] == 'crack':
+        color = (160 + c, 140 + c, 100 + c)
+        pygame.draw.line(sprite, color, (half - size, half), (half + size, half + size//2), 2)
+        pygame.draw.line(sprite, color, (half, half), (half + size//2, half + size), 2)
+    elif d['type'] == 'rubble':
+        color = (140 + c, 130 + c, 110 + c)
+        for i in range(3):
+            pygame.draw.circle(sprite, color, (half + i*5, half + i*3), size // 4)
+    elif d['type'] == 'bones':
+        color = (220, 210, 190)
+        pygame.draw.line(sprite, color, (half - size//2, half), (half + size//2, half), 3)
+        pygame.draw.circle(sprite, color, (half - size//2, half), 3)
+    return optimize_surface(sprite), (-half, -half)
+
+
+MUZZLE_FLASH_LIFE = 0.08  # Seconds a muzzle flash shrinks over
+
+
+class MuzzleFlash:
+    """Short-lived flash at a gun's muzzle; pooled in VisualEffects."""
+    __slots__ = ('x', 'y', 'angle', 'size', 'life')
+
+    def __init__(self, x, y, angle, size):
+        self.reset(x, y, angle, size)
+
+    def reset(self, x, y, angle, size):
+        self.x = x
+        self.y = y
+        self.angle = angle
+        self.size = size
+        self.life = MUZZLE_FLASH_LIFE
+
+    def update(self, dt):
+        self.life -= dt
+        return self.life > 0
+
+
+def age_timed_effects(effects, dt):
+    """Count down each effect's 'life', sliding live ones over expired ones.
+
+    One pass and one truncation, without building a new list per frame.
+    """
+    write = 0
+    for effect in effects:
+        effect['life'] -= dt
+        if effect['life'] > 0:
+            effects[write] = effect
+            write += 1
+    del effects[write:]
+
+
 class VisualEffects:
     """Manages visual effects like particles, blood splatters, screen shake."""
     def __init__(self):
-        self.particles = []  # General particles
-        self.blood_splatters = []  # Blood on ground
-        self.muzzle_flashes = []  # Muzzle flash effects
+        self.particles = ParticleSystem(1024, shrink=False)  # Blood/spark particles
+        self.blood_splatters = []  # Blood on ground, a ring of BLOOD_SPLATTER_LIMIT
+        self.blood_splatter_next = 0  # Oldest splatter, recycled once the ring is full
+        self.muzzle_flashes = EntityPool(MuzzleFlash, 64)  # Muzzle flash effects
         self.bullet_trails = []  # Bullet trail lines
         self.screen_shake = 0  # Screen shake intensity
         self.screen_shake_offset = (0, 0)
@@ -1166,42 +1804,32 @@ class VisualEffects:
             self.debris.append({
                 'x': random.randint(-500, 4500),
                 'y': random.randint(-500, 4500),
-                'type': random.choice(['rock', 'crack', 'rubble', 'bones']),
+                'type': random.choice(DEBRIS_TYPES),
                 'size': random.randint(5, 20),
                 'color_var': random.randint(-20, 20)
             })
 
     def add_muzzle_flash(self, x, y, angle, size=15):
         """Add a muzzle flash effect."""
-        self.muzzle_flashes.append({
-            'x': x, 'y': y, 'angle': angle,
-            'size': size, 'life': 0.08
-        })
+        self.muzzle_flashes.spawn(x, y, angle, size)
 
     def add_blood_splatter(self, x, y, amount=5):
         """Add blood particles and ground splatter."""
         # Blood particles that fly out
-        for _ in range(amount):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(50, 150)
-            self.particles.append({
-                'x': x, 'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': random.uniform(0.3, 0.6),
-                'size': random.randint(2, 5),
-                'color': (random.randint(100, 180), 0, 0),
-                'type': 'blood'
-            })
-        # Permanent ground splatter
-        self.blood_splatters.append({
-            'x': x, 'y': y,
-            'size': random.randint(8, 20),
-            'alpha': 200
-        })
-        # Limit ground splatters
-        if len(self.blood_splatters) > 100:
-            self.blood_splatters.pop(0)
+        self.particles.burst(x, y, BLOOD_SHADES, amount, (50, 150), (0.3, 0.6), (2, 5))
+        # Permanent ground splatter; once the ring is full the oldest one is
+        # overwritten in place instead of popping the list head and allocating
+        splatters = self.blood_splatters
+        size = random.randint(8, 20)
+        if len(splatters) < BLOOD_SPLATTER_LIMIT:
+            splatters.append({'x': x, 'y': y, 'size': size, 'alpha': 200})
+        else:
+            splat = splatters[self.blood_splatter_next]
+            splat['x'] = x
+            splat['y'] = y
+            splat['size'] = size
+            splat['alpha'] = 200
+            self.blood_splatter_next = (self.blood_splatter_next + 1) % BLOOD_SPLATTER_LIMIT
 
     def add_bullet_trail(self, start_x, start_y, end_x, end_y, color=(255, 255, 150)):
         """Add a bullet trail effect."""
@@ -1214,18 +1842,7 @@ class VisualEffects:
 
     def add_hit_particles(self, x, y, color=(200, 200, 200), amount=3):
         """Add impact particles."""
-        for _ in range(amount):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(30, 80)
-            self.particles.append({
-                'x': x, 'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': random.uniform(0.2, 0.4),
-                'size': random.randint(2, 4),
-                'color': color,
-                'type': 'spark'
-            })
+        self.particles.burst(x, y, (color,), amount, (30, 80), (0.2, 0.4), (2, 4))
 
     def shake_screen(self, intensity):
         """Trigger screen shake."""
@@ -1235,73 +1852,48 @@ class VisualEffects:
         """Update all visual effects."""
         # Update screen shake
         if self.screen_shake > 0:
-            self.screen_shake_offset = (
-                random.uniform(-self.screen_shake, self.screen_shake),
-                random.uniform(-self.screen_shake, self.screen_shake)
-            )
+            amp = self.screen_shake
+            rnd = random.random
+            self.screen_shake_offset = ((rnd() * 2 - 1) * amp, (rnd() * 2 - 1) * amp)
             self.screen_shake = max(0, self.screen_shake - dt * 50)
         else:
             self.screen_shake_offset = (0, 0)
 
-        # Update particles
-        for p in self.particles[:]:
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            p['vy'] += 200 * dt  # Gravity
-            p['life'] -= dt
-            if p['life'] <= 0:
-                self.particles.remove(p)
-
-        # Update muzzle flashes
-        for m in self.muzzle_flashes[:]:
-            m['life'] -= dt
-            if m['life'] <= 0:
-                self.muzzle_flashes.remove(m)
-
-        # Update bullet trails
-        for t in self.bullet_trails[:]:
-            t['life'] -= dt
-            if t['life'] <= 0:
-                self.bullet_trails.remove(t)
+        # Update particles (pooled, so dead ones are recycled rather than freed)
+        self.particles.update(dt)
+
+        # Age muzzle flashes (recycled by their pool) and bullet trails,
+        # dropping expired ones in place
+        self.muzzle_flashes.update(dt)
+        age_timed_effects(self.bullet_trails, dt)
 
         # Fade blood splatters slowly
-        for b in self.blood_splatters[:]:
+        for b in self.blood_splatters:
             b['alpha'] = max(50, b['alpha'] - dt * 2)
 
     def draw_ground_effects(self, screen, camera_offset):
         """Draw effects that appear on the ground (under characters)."""
-        # Draw debris
+        # Debris and blood splatters are cached sprites, so the whole ground
+        # layer goes out as one batched blit (debris first, splatters on top)
+        splats = []
         for d in self.debris:
             dx = int(d['x'] - camera_offset[0])
             dy = int(d['y'] - camera_offset[1])
             if -50 < dx < SCREEN_WIDTH + 50 and -50 < dy < SCREEN_HEIGHT + 50:
-                if d['type'] == 'rock':
-                    color = (150 + d['color_var'], 140 + d['color_var'], 130 + d['color_var'])
-                    pygame.draw.circle(screen, color, (dx, dy), d['size'] // 2)
-                elif d['type'] == 'crack':
-                    color = (160 + d['color_var'], 140 + d['color_var'], 100 + d['color_var'])
-                    pygame.draw.line(screen, color, (dx - d['size'], dy), (dx + d['size'], dy + d['size']//2), 2)
-                    pygame.draw.line(screen, color, (dx, dy), (dx + d['size']//2, dy + d['size']), 2)
-                elif d['type'] == 'rubble':
-                    color = (140 + d['color_var'], 130 + d['color_var'], 110 + d['color_var'])
-                    for i in range(3):
-                        pygame.draw.circle(screen, color, (dx + i*5, dy + i*3), d['size'] // 4)
-                elif d['type'] == 'bones':
-                    color = (220, 210, 190)
-                    pygame.draw.line(screen, color, (dx - d['size']//2, dy), (dx + d['size']//2, dy), 3)
-                    pygame.draw.circle(screen, color, (dx - d['size']//2, dy), 3)
-
-        # Draw blood splatters on ground
+                # Built on first sight: debris is generated before the display exists
+                sprite = d.get('sprite')
+                if sprite is None:
+                    sprite = d['sprite'] = build_debris_sprite(d)
+                image, (ox, oy) = sprite
+                splats.append((image, (dx + ox, dy + oy)))
+
         for b in self.blood_splatters:
             bx = int(b['x'] - camera_offset[0])
             by = int(b['y'] - camera_offset[1])
             if -50 < bx < SCREEN_WIDTH + 50 and -50 < by < SCREEN_HEIGHT + 50:
-                alpha = int(b['alpha'])
-                # Draw irregular blood shape
-                color = (80, 0, 0)
-                pygame.draw.circle(screen, color, (bx, by), b['size'])
-                pygame.draw.circle(screen, color, (bx + b['size']//3, by - b['size']//4), b['size']//2)
-                pygame.draw.circle(screen, color, (bx - b['size']//4, by + b['size']//3), b['size']//2)
+                size = b['size']
+                splats.append((get_splatter_sprite(size), (bx - size, by - size)))
+        screen.blits(splats, doreturn=False)
 
     def draw_effects(self, screen, camera_offset):
         """Draw effects that appear above ground (particles, trails, flashes)."""
@@ -1312,36 +1904,33 @@ class VisualEffects:
             end = (int(t['end'][0] - camera_offset[0]), int(t['end'][1] - camera_offset[1]))
             pygame.draw.line(screen, t['color'], start, end, 2)
 
-        # Draw particles
-        for p in self.particles:
-            px = int(p['x'] - camera_offset[0])
-            py = int(p['y'] - camera_offset[1])
-            if 0 < px < SCREEN_WIDTH and 0 < py < SCREEN_HEIGHT:
-                pygame.draw.circle(screen, p['color'], (px, py), p['size'])
+        # Draw particles (full size until they expire) in one batched blit
+        self.particles.draw(screen, camera_offset)
 
         # Draw muzzle flashes
         for m in self.muzzle_flashes:
-            mx = int(m['x'] - camera_offset[0])
-            my = int(m['y'] - camera_offset[1])
+            mx = int(m.x - camera_offset[0])
+            my = int(m.y - camera_offset[1])
             if 0 < mx < SCREEN_WIDTH and 0 < my < SCREEN_HEIGHT:
                 # Draw bright flash
-                flash_size = int(m['size'] * (m['life'] / 0.08))
+                flash_size = int(m.size * (m.life / MUZZLE_FLASH_LIFE))
                 # Core (white/yellow)
                 pygame.draw.circle(screen, (255, 255, 200), (mx, my), flash_size)
                 pygame.draw.circle(screen, (255, 200, 50), (mx, my), flash_size + 3)
                 # Directional flash
-                end_x = mx + math.cos(m['angle']) * flash_size * 2
-                end_y = my + math.sin(m['angle']) * flash_size * 2
+                end_x = mx + math.cos(m.angle) * flash_size * 2
+                end_y = my + math.sin(m.angle) * flash_size * 2
                 pygame.draw.line(screen, (255, 255, 150), (mx, my), (int(end_x), int(end_y)), 4)
 
-    def draw_shadow(self, screen, x, y, size, camera_offset):
-        """Draw a shadow under a character."""
-        sx = int(x - camera_offset[0])
-        sy = int(y - camera_offset[1] + size * 0.7)
-        # Elliptical shadow
-        shadow_surface = pygame.Surface((size * 2, size), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surface, (0, 0, 0, 50), (0, 0, size * 2, size))
-        screen.blit(shadow_surface, (sx - size, sy - size // 2))
+    def draw_shadows(self, screen, characters, camera_offset):
+        """Draw shadows under characters in one batched blit."""
+        shadows = []
+        for character in characters:
+            size = character.size
+            sx = int(character.x - camera_offset[0])
+            sy = int(character.y - camera_offset[1] + size * 0.7)
+            shadows.append((get_shadow_sprite(size), (sx - size, sy - size // 2)))
+        screen.blits(shadows, doreturn=False)
 
 
 # Global visual effects manager
@@ -1361,8 +1950,10 @@ class VirtualJoystick:
         self.touch_id = None
 
     def handle_touch_down(self, touch_id, x, y):
-        dist = math.sqrt((x - self.base_x)**2 + (y - self.base_y)**2)
-        if dist < self.radius * 1.5:
+        dx = x - self.base_x
+        dy = y - self.base_y
+        reach = self.radius * 1.5
+        if dx * dx + dy * dy < reach * reach:
             self.active = True
             self.touch_id = touch_id
             self.update_knob(x, y)
@@ -1387,10 +1978,11 @@ class VirtualJoystick:
     def update_knob(self, x, y):
         dx = x - self.base_x
         dy = y - self.base_y
-        dist = math.sqrt(dx**2 + dy**2)
-        if dist > self.radius:
-            dx = dx / dist * self.radius
-            dy = dy / dist * self.radius
+        dist_sq = dx * dx + dy * dy
+        if dist_sq > self.radius * self.radius:
+            scale = self.radius / math.sqrt(dist_sq)
+            dx *= scale
+            dy *= scale
         self.knob_x = self.base_x + dx
         self.knob_y = self.base_y + dy
 
@@ -1419,8 +2011,9 @@ class TouchButton:
         self.touch_id = None
 
     def handle_touch_down(self, touch_id, x, y):
-        dist = math.sqrt((x - self.x)**2 + (y - self.y)**2)
-        if dist < self.radius:
+        dx = x - self.x
+        dy = y - self.y
+        if dx * dx + dy * dy < self.radius * self.radius:
             self.pressed = True
             self.touch_id = touch_id
             return True
@@ -1437,7 +2030,7 @@ class TouchButton:
         color = WHITE if self.pressed else self.color
         pygame.draw.circle(screen, color, (int(self.x), int(self.y)), self.radius)
         pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.radius, 3)
-        text = font.render(self.label, True, BLACK if self.pressed else WHITE)
+        text = render_text(font, self.label, BLACK if self.pressed else WHITE)
         screen.blit(text, (self.x - text.get_width()//2, self.y - text.get_height()//2))
 
 
@@ -1556,41 +2149,52 @@ class VirtualKeyboard:
 
                 # Draw key label
                 label = key if len(key) == 1 else key[:3]
-                text = font.render(label, True, text_color)
+                text = render_text(font, label, text_color)
                 screen.blit(text, (key_x + kw//2 - text.get_width()//2, key_y + self.key_height//2 - text.get_height()//2))
 
         self.pressed_key = None
 
 
-class Particle:
-    """Particle effect for explosions, blood, etc."""
-    def __init__(self, x, y, color, velocity, lifetime, size=3):
+class ShellCasing:
+    """Brass casing ejected from a gun; pooled per player."""
+    __slots__ = ('x', 'y', 'vx', 'vy', 'rotation', 'rot_speed', 'lifetime', 'size')
+
+    def __init__(self, x, y, vx, vy, size):
+        self.reset(x, y, vx, vy, size)
+
+    def reset(self, x, y, vx, vy, size):
         self.x = x
         self.y = y
-        self.color = color
-        self.vx, self.vy = velocity
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
+        self.vx = vx
+        self.vy = vy
+        self.rotation = random.uniform(0, 360)
+        self.rot_speed = random.uniform(-500, 500)
+        self.lifetime = 1.0
         self.size = size
 
     def update(self, dt):
         self.x += self.vx * dt
         self.y += self.vy * dt
-        self.vy += 200 * dt  # gravity
+        self.vy += 300 * dt  # Gravity
+        self.rotation += self.rot_speed * dt
         self.lifetime -= dt
         return self.lifetime > 0
 
-    def draw(self, screen, camera_offset):
-        alpha = self.lifetime / self.max_lifetime
-        size = int(self.size * alpha)
-        if size > 0:
-            pygame.draw.circle(screen, self.color,
-                             (int(self.x - camera_offset[0]), int(self.y - camera_offset[1])), size)
-
 
 class Bullet:
     """Projectile class for all weapons with realistic ballistics."""
+    __slots__ = ('x', 'y', 'angle', 'speed', 'damage', 'explosive', 'explosion_radius', 'range',
+                 'distance_traveled', 'owner_id', 'vx', 'vy', 'active', 'penetration', 'hits',
+                 'caliber', 'gravity', 'hit_zombies', 'head', 'trail_color', 'trail_length')
+
     def __init__(self, x, y, angle, stats: WeaponStats, owner_id):
+        # Zombies already pierced. Penetration tops out at 5, so a short list
+        # beats a set of id()s; it is cleared rather than reallocated. Zombie
+        # list positions shift as zombies die, so they can't key a bitmask.
+        self.hit_zombies = []
+        self.reset(x, y, angle, stats, owner_id)
+
+    def reset(self, x, y, angle, stats: WeaponStats, owner_id):
         self.x = x
         self.y = y
         self.angle = angle
@@ -1609,14 +2213,27 @@ class Bullet:
         self.caliber = stats.caliber
         # Bullet drop for realism (gravity effect)
         self.gravity = 50 if not stats.explosive else 80  # Rockets drop more
+        self.hit_zombies.clear()
+        # Look: (dot sprite, radius) layers for the head, plus the trail
+        if self.explosive:
+            # Rocket/grenade - larger, red-orange
+            self.head = ((get_dot_sprite(RED, 6), 6), (get_dot_sprite(ORANGE, 4), 4))
+        elif ".50" in self.caliber or "7.62" in self.caliber:
+            # Large caliber - bigger bullet
+            self.head = ((get_dot_sprite(YELLOW, 5), 5),)
+        else:
+            # Standard bullet
+            self.head = ((get_dot_sprite(YELLOW, 3), 3),)
+        self.trail_color = RED if self.explosive else ORANGE
+        # Trail effect - longer for faster bullets
+        self.trail_length = 0.03 if self.speed > 2000 else 0.02
 
     def update(self, dt):
-        move_dist = self.speed * dt
         self.x += self.vx * dt
         self.y += self.vy * dt
         # Apply bullet drop (gravity)
         self.vy += self.gravity * dt
-        self.distance_traveled += move_dist
+        self.distance_traveled += self.speed * dt
         # Damage falloff at range
         if self.distance_traveled > self.range:
             self.active = False
@@ -1628,34 +2245,25 @@ class Bullet:
         self.damage *= 0.7  # Damage reduction per penetration
         return self.hits < self.penetration
 
-    def draw(self, screen, camera_offset):
-        draw_x = int(self.x - camera_offset[0])
-        draw_y = int(self.y - camera_offset[1])
 
-        # Different bullet visuals based on caliber
-        if self.explosive:
-            # Rocket/grenade - larger, red-orange
-            pygame.draw.circle(screen, RED, (draw_x, draw_y), 6)
-            pygame.draw.circle(screen, ORANGE, (draw_x, draw_y), 4)
-        elif ".50" in self.caliber or "7.62" in self.caliber:
-            # Large caliber - bigger bullet
-            pygame.draw.circle(screen, YELLOW, (draw_x, draw_y), 5)
-        else:
-            # Standard bullet
-            pygame.draw.circle(screen, YELLOW, (draw_x, draw_y), 3)
+# Builder wall footprint per block rotation (90/270 swap width and height)
+WALL_DIMS = {0: (320, 80), 90: (80, 320), 180: (320, 80), 270: (80, 320)}
+
+
+def build_wall_preview(width, height):
+    """Semi-transparent blue blueprint shown before placing a wall."""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    surface.fill((0, 100, 255, 100))
+    return surface
 
-        # Trail effect - longer for faster bullets
-        trail_length = 0.03 if self.speed > 2000 else 0.02
-        trail_x = self.x - self.vx * trail_length
-        trail_y = self.y - self.vy * trail_length
-        trail_color = RED if self.explosive else ORANGE
-        pygame.draw.line(screen, trail_color,
-                        (int(trail_x - camera_offset[0]), int(trail_y - camera_offset[1])),
-                        (draw_x, draw_y), 2)
+
+WALL_PREVIEWS = {rotation: build_wall_preview(*dims) for rotation, dims in WALL_DIMS.items()}
 
 
 class Wall:
     """Buildable wall for Builder class."""
+    __slots__ = ('x', 'y', 'width', 'height', 'health', 'max_health', 'active', 'rect')
+
     def __init__(self, x, y, width=320, height=80, health=1000):
         self.x = x
         self.y = y
@@ -1664,6 +2272,8 @@ class Wall:
         self.health = health
         self.max_health = health
         self.active = True
+        # Walls never move, so their footprint is built once (don't mutate it)
+        self.rect = pygame.Rect(x - width//2, y - height//2, width, height)
 
     def take_damage(self, damage):
         self.health -= damage
@@ -1671,7 +2281,7 @@ class Wall:
             self.active = False
 
     def get_rect(self):
-        return pygame.Rect(self.x - self.width//2, self.y - self.height//2, self.width, self.height)
+        return self.rect
 
     def draw(self, screen, camera_offset):
         rect = self.get_rect()
@@ -1690,12 +2300,30 @@ class Wall:
             pygame.draw.rect(screen, GREEN, (draw_rect.x, draw_rect.y - 8, bar_width, 5))
 
 
+HEAL_ZONE_FADE_STEPS = 16  # Fade-out levels a heal zone sprite is cached at
+HEAL_ZONE_SPRITES = {}  # (radius, fade level) -> translucent green disc with its ring
+
+
+def get_heal_zone_sprite(radius, level):
+    key = (radius, level)
+    sprite = HEAL_ZONE_SPRITES.get(key)
+    if sprite is None:
+        alpha = level / HEAL_ZONE_FADE_STEPS
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (0, 255, 0, int(50 * alpha)), (radius, radius), radius)
+        pygame.draw.circle(sprite, (0, 255, 0, int(100 * alpha)), (radius, radius), radius, 3)
+        sprite = optimize_surface(sprite)
+        HEAL_ZONE_SPRITES[key] = sprite
+    return sprite
+
+
 class HealZone:
     """Healing area created by Healer class."""
     def __init__(self, x, y, radius=100, duration=10, heal_rate=20):
         self.x = x
         self.y = y
         self.radius = radius
+        self.radius_sq = radius * radius  # For sqrt-free range checks
         self.duration = duration
         self.heal_rate = heal_rate  # HP per second
         self.active = True
@@ -1707,12 +2335,10 @@ class HealZone:
         return self.active
 
     def draw(self, screen, camera_offset):
-        alpha = min(1.0, self.duration / 3)
-        # Draw healing zone
-        surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(surface, (0, 255, 0, int(50 * alpha)), (self.radius, self.radius), self.radius)
-        pygame.draw.circle(surface, (0, 255, 0, int(100 * alpha)), (self.radius, self.radius), self.radius, 3)
-        screen.blit(surface, (self.x - self.radius - camera_offset[0], self.y - self.radius - camera_offset[1]))
+        # Fades out over its last 3 seconds, in HEAL_ZONE_FADE_STEPS cached steps
+        level = round(min(1.0, self.duration / 3) * HEAL_ZONE_FADE_STEPS)
+        screen.blit(get_heal_zone_sprite(self.radius, level),
+                    (self.x - self.radius - camera_offset[0], self.y - self.radius - camera_offset[1]))
 
 
 class Pickup:
@@ -1723,7 +2349,7 @@ class Pickup:
         self.pickup_type = pickup_type
         self.active = True
         self.size = 20
-        self.bob_offset = random.uniform(0, math.pi * 2)  # For floating animation
+        self.bob_offset = random.uniform(0, math.tau)  # For floating animation
         self.rotation = 0
         self.spawn_time = 0
         self.lifetime = 30  # Despawn after 30 seconds
@@ -1841,8 +2467,10 @@ class Pickup:
             pygame.draw.circle(screen, self.color, (draw_x, draw_y), size)
             pygame.draw.circle(screen, (200, 170, 0), (draw_x, draw_y), size, 2)
             # $ symbol
-            font = pygame.font.Font(None, size + 8)
-            text = font.render("$", True, (150, 120, 0))
+            text = COIN_LABELS.get(size)
+            if text is None:
+                text = optimize_surface(pygame.font.Font(None, size + 8).render("$", True, (150, 120, 0)))
+                COIN_LABELS[size] = text
             screen.blit(text, (draw_x - text.get_width()//2, draw_y - text.get_height()//2))
 
         elif self.pickup_type == "weapon":
@@ -1869,225 +2497,230 @@ class Pickup:
             pygame.draw.rect(screen, (220, 220, 200), (draw_x - 6, draw_y - 5, 8, 10))   # Body
             pygame.draw.rect(screen, (220, 220, 200), (draw_x - 2, draw_y + 2, 4, 6))    # Grip
             # "?" to indicate random weapon
-            font = pygame.font.Font(None, 16)
-            q_text = font.render("?", True, (255, 255, 0))
-            screen.blit(q_text, (draw_x + 6, draw_y - 10))
+            screen.blit(CRATE_LABEL, (draw_x + 6, draw_y - 10))
+
+
+# Eye layouts per zombie type: (x offsets of each eye, [(color, radius) layers])
+ZOMBIE_EYE_LAYOUTS = {
+    "runner": ((-5, 5), [((255, 200, 200), 5), (RED, 2)]),  # Wide, frantic eyes
+    "tank": ((-6, 6), [((200, 50, 50), 4)]),  # Small, angry eyes
+    "spitter": ((-4, 4), [((200, 220, 50), 4)]),  # Glowing yellow eyes
+    "bloater": ((-5, 5), [((180, 180, 190), 5)]),  # Milky, dead eyes
+    "radioactive": ((-5, 5), [((150, 255, 150), 5), ((50, 255, 50), 3)]),  # Glowing green eyes
+    "cage_walker": ((-8, 8), [((255, 150, 50), 7), ((255, 50, 0), 4)]),  # Burning boss eyes
+    "screamer": ((-5, 5), [((220, 220, 220), 6), ((40, 40, 40), 3)]),  # Wide, hollow eyes
+    "leaper": ((-4, 4), [((220, 200, 50), 5), ((30, 30, 30), 2)]),  # Feral predator eyes
+    "necromancer": ((-5, 5), [((180, 100, 220), 5), ((255, 150, 255), 2)]),  # Glowing purple eyes
+    "horde_mother": ((-8, 0, 8), [((200, 150, 150), 5), ((100, 50, 50), 2)]),  # Multiple small eyes
+    "normal": ((-4, 4), [((200, 60, 60), 4)]),  # Normal red eyes
+}
+
+
+def build_eye_sprite(offsets, layers):
+    """Pre-render a set of eyes into one small alpha surface centered on the eye line."""
+    max_radius = max(radius for _, radius in layers)
+    half_w = max(abs(o) for o in offsets) + max_radius
+    sprite = pygame.Surface((half_w * 2 + 1, max_radius * 2 + 1), pygame.SRCALPHA)
+    for color, radius in layers:
+        for offset in offsets:
+            pygame.draw.circle(sprite, color, (half_w + offset, max_radius), radius)
+    return sprite
+
+
+ZOMBIE_EYE_SPRITES = {ztype: build_eye_sprite(offsets, layers)
+                      for ztype, (offsets, layers) in ZOMBIE_EYE_LAYOUTS.items()}
+
+
+# How close a zombie closes in on each kind of target before it stops moving,
+# and how close it must be to hit it (both squared, to compare with squared distances)
+ZOMBIE_STOP_DIST_SQ = {"player": 30 * 30, "wall": 50 * 50, "bunker": 80 * 80}
+ZOMBIE_ATTACK_RANGE_SQ = {"player": 40 * 40, "wall": 60 * 60, "bunker": 100 * 100}
+
+
+# Per-type stats: (health, health per wave, speed, speed per wave, damage,
+# damage per wave, size). The Zombie King scales by stage and is built apart.
+ZOMBIE_BASE_STATS = {
+    "normal": (50, 10, 80, 2, 10, 1, 20),
+    "runner": (30, 5, 150, 5, 8, 1, 16),
+    "tank": (200, 30, 40, 1, 25, 2, 35),
+    "spitter": (40, 8, 60, 2, 15, 1, 22),
+    "crawler": (25, 5, 100, 3, 12, 1, 14),  # Crawling zombie, low and fast
+    "bloater": (80, 15, 35, 1, 20, 1, 30),  # Explodes on death
+    "radioactive": (60, 12, 70, 2, 18, 1, 24),
+    "cage_walker": (500, 50, 50, 1, 50, 3, 45),  # Massive damage
+    "speed": (35, 6, 200, 5, 10, 1, 18),  # Very fast!
+    "screamer": (45, 8, 90, 2, 8, 1, 19),
+    "leaper": (40, 7, 70, 2, 20, 2, 17),  # Slower walk, but high pounce damage
+    "necromancer": (70, 10, 40, 1, 12, 1, 26),  # Slow, stays back
+    "horde_mother": (800, 80, 35, 1, 40, 2, 55),
+}
+
+# Per-type looks: (skin base colors, skin variance, detail color, detail
+# variance, wound color). Skin and detail are varied per zombie for realism.
+ZOMBIE_LOOKS = {
+    # Grayish-green rotting flesh tones
+    "normal": ([(85, 107, 85), (70, 90, 70), (95, 115, 80), (80, 100, 75)], 15,
+               (60, 75, 55), 10, (120, 50, 50)),  # Dark red wounds
+    # Pale, freshly turned - more skin-like
+    "runner": ([(160, 140, 130), (145, 130, 120), (155, 145, 135), (140, 125, 115)], 15,
+               (100, 85, 80), 10, (180, 70, 70)),  # Fresher blood
+    # Dark, bloated, heavily decayed
+    "tank": ([(50, 65, 50), (45, 55, 45), (55, 70, 55), (40, 50, 40)], 10,
+             (30, 40, 30), 8, (90, 40, 40)),  # Old dried blood
+    # Toxic green/yellow - infected with acid
+    "spitter": ([(100, 130, 50), (90, 140, 45), (110, 135, 55), (95, 125, 40)], 15,
+                (70, 100, 30), 10, (150, 180, 50)),  # Toxic ooze
+    "crawler": ([(75, 85, 75), (65, 80, 70), (80, 90, 75)], 12,
+                (50, 60, 45), 8, (100, 45, 45)),
+    # Swollen, purple-ish diseased look
+    "bloater": ([(90, 70, 100), (85, 65, 95), (95, 75, 105)], 12,
+                (60, 45, 70), 10, (130, 90, 140)),  # Purple ooze
+    # Glowing green radioactive look
+    "radioactive": ([(50, 255, 50), (40, 230, 40), (60, 240, 60)], 20,
+                    (30, 180, 30), 15, (100, 255, 100)),  # Glowing green wounds
+    # Dark armored look with cage-like patterns
+    "cage_walker": ([(40, 40, 50), (35, 35, 45), (45, 45, 55)], 10,
+                    (60, 60, 80), 10, (80, 20, 20)),  # Dark blood
+    # Lean, athletic zombie
+    "speed": ([(130, 115, 100), (120, 105, 95), (140, 125, 110)], 15,
+              (90, 75, 65), 10, (160, 60, 60)),
+    # Royal dark purple/black colors
+    "zombie_king": ([(60, 30, 80), (50, 25, 70), (70, 35, 90)], 10,
+                    (40, 20, 50), 8, (120, 40, 120)),  # Purple blood
+    # Pale white/gray - throat is red/exposed
+    "screamer": ([(180, 175, 170), (170, 165, 160), (190, 185, 180)], 10,
+                 (140, 135, 130), 8, (200, 80, 80)),  # Red throat
+    # Feral, hunched look - darker colors
+    "leaper": ([(70, 75, 65), (65, 70, 60), (75, 80, 70)], 12,
+               (50, 55, 45), 10, (130, 55, 55)),
+    # Dark robed appearance - purple/black
+    "necromancer": ([(50, 40, 60), (45, 35, 55), (55, 45, 65)], 8,
+                    (35, 25, 45), 6, (100, 50, 120)),  # Purple energy
+    # Bloated, maternal horror
+    "horde_mother": ([(80, 70, 75), (75, 65, 70), (85, 75, 80)], 10,
+                     (55, 45, 50), 8, (140, 60, 70)),
+}
 
 
 class Zombie:
     """Enemy zombie with different types."""
+    # Every attribute any zombie type sets; type-specific ones stay unset on
+    # other types, so draw/update code keeps reading them through getattr()
+    __slots__ = ('x', 'y', 'zombie_type', 'wave', 'king_stage', 'minimap_radius', 'minimap_sprite',
+                 'skin_color', 'detail_color', 'wound_color', 'mouth_color', 'health', 'speed',
+                 'damage', 'size', 'is_boss', 'max_health', 'active', 'attack_cooldown', 'target',
+                 '_angle', 'face_x', 'face_y', 'knockback_vx', 'knockback_vy', 'target_bunker',
+                 # Spitter, radioactive, cage walker, king
+                 'spit_cooldown', 'spit_range', 'radiation_damage', 'radiation_radius', 'glow_pulse',
+                 'cage_color', 'command_radius', 'roar_cooldown', 'crown_color', 'energy_color',
+                 'energy_pulse', 'slam_cooldown', 'slam_radius',
+                 # Screamer, leaper, necromancer, horde mother
+                 'scream_cooldown', 'scream_radius', 'has_screamed', 'leap_cooldown', 'leap_range',
+                 'leap_speed', 'is_leaping', 'leap_target_x', 'leap_target_y', 'robe_color',
+                 'resurrect_cooldown', 'resurrect_radius', 'resurrect_count', 'max_resurrects',
+                 'spawn_cooldown', 'spawn_rate', 'max_children', 'children', 'belly_pulse', 'belly_color')
+
     def __init__(self, x, y, zombie_type="normal", wave=1, king_stage=1):
         self.x = x
         self.y = y
         self.zombie_type = zombie_type
         self.wave = wave
         self.king_stage = king_stage  # For Zombie King boss
+        # Minimap dot for this type, resolved once rather than every HUD frame
+        dot_color, self.minimap_radius = MINIMAP_ZOMBIE_DOTS.get(zombie_type, MINIMAP_DEFAULT_DOT)
+        self.minimap_sprite = get_dot_sprite(dot_color, self.minimap_radius)
 
         # Random color variation for realism
         def vary_color(base_color, variance=20):
             return tuple(max(0, min(255, c + random.randint(-variance, variance))) for c in base_color)
 
-        # Type-specific stats with realistic zombie colors
-        if zombie_type == "normal":
+        # Base stats scale with the wave; the Zombie King scales with its stage
+        stats = ZOMBIE_BASE_STATS.get(zombie_type)
+        if stats is not None:
+            health, health_step, speed, speed_step, damage, damage_step, self.size = stats
+            self.health = health + wave * health_step
+            self.speed = speed + wave * speed_step
+            self.damage = damage + wave * damage_step
+        elif zombie_type == "zombie_king":
+            # Health and damage scale with stage
+            stage_multiplier = king_stage
+            self.health = 1000 * stage_multiplier + wave * 100
+            self.speed = 60 + stage_multiplier * 5
+            self.damage = 75 * stage_multiplier  # Massive damage
+            self.size = 60 + stage_multiplier * 5  # Gets bigger each stage
+        else:
+            # Default fallback
             self.health = 50 + wave * 10
             self.speed = 80 + wave * 2
             self.damage = 10 + wave
             self.size = 20
-            # Grayish-green rotting flesh tones
-            base_colors = [(85, 107, 85), (70, 90, 70), (95, 115, 80), (80, 100, 75)]
-            self.skin_color = vary_color(random.choice(base_colors), 15)
-            self.detail_color = vary_color((60, 75, 55), 10)
-            self.wound_color = (120, 50, 50)  # Dark red wounds
-        elif zombie_type == "runner":
-            self.health = 30 + wave * 5
-            self.speed = 150 + wave * 5
-            self.damage = 8 + wave
-            self.size = 16
-            # Pale, freshly turned - more skin-like
-            base_colors = [(160, 140, 130), (145, 130, 120), (155, 145, 135), (140, 125, 115)]
-            self.skin_color = vary_color(random.choice(base_colors), 15)
-            self.detail_color = vary_color((100, 85, 80), 10)
-            self.wound_color = (180, 70, 70)  # Fresher blood
-        elif zombie_type == "tank":
-            self.health = 200 + wave * 30
-            self.speed = 40 + wave
-            self.damage = 25 + wave * 2
-            self.size = 35
-            # Dark, bloated, heavily decayed
-            base_colors = [(50, 65, 50), (45, 55, 45), (55, 70, 55), (40, 50, 40)]
-            self.skin_color = vary_color(random.choice(base_colors), 10)
-            self.detail_color = vary_color((30, 40, 30), 8)
-            self.wound_color = (90, 40, 40)  # Old dried blood
-        elif zombie_type == "spitter":
-            self.health = 40 + wave * 8
-            self.speed = 60 + wave * 2
-            self.damage = 15 + wave
-            self.size = 22
-            # Toxic green/yellow - infected with acid
-            base_colors = [(100, 130, 50), (90, 140, 45), (110, 135, 55), (95, 125, 40)]
-            self.skin_color = vary_color(random.choice(base_colors), 15)
-            self.detail_color = vary_color((70, 100, 30), 10)
-            self.wound_color = (150, 180, 50)  # Toxic ooze
+
+        # Realistic zombie colors, varied per zombie
+        looks = ZOMBIE_LOOKS.get(zombie_type)
+        if looks is not None:
+            base_colors, skin_variance, detail_color, detail_variance, self.wound_color = looks
+            self.skin_color = vary_color(random.choice(base_colors), skin_variance)
+            self.detail_color = vary_color(detail_color, detail_variance)
+        else:
+            self.skin_color = (85, 107, 85)
+            self.detail_color = (60, 75, 55)
+            self.wound_color = (120, 50, 50)
+
+        # Type-specific abilities and extra colors
+        if zombie_type == "spitter":
             self.spit_cooldown = 0
             self.spit_range = 300
-        elif zombie_type == "crawler":
-            # New type: crawling zombie, low and fast
-            self.health = 25 + wave * 5
-            self.speed = 100 + wave * 3
-            self.damage = 12 + wave
-            self.size = 14
-            base_colors = [(75, 85, 75), (65, 80, 70), (80, 90, 75)]
-            self.skin_color = vary_color(random.choice(base_colors), 12)
-            self.detail_color = vary_color((50, 60, 45), 8)
-            self.wound_color = (100, 45, 45)
-        elif zombie_type == "bloater":
-            # New type: explodes on death
-            self.health = 80 + wave * 15
-            self.speed = 35 + wave
-            self.damage = 20 + wave
-            self.size = 30
-            # Swollen, purple-ish diseased look
-            base_colors = [(90, 70, 100), (85, 65, 95), (95, 75, 105)]
-            self.skin_color = vary_color(random.choice(base_colors), 12)
-            self.detail_color = vary_color((60, 45, 70), 10)
-            self.wound_color = (130, 90, 140)  # Purple ooze
         elif zombie_type == "radioactive":
             # Radioactive zombie - glows green, damages nearby players
-            self.health = 60 + wave * 12
-            self.speed = 70 + wave * 2
-            self.damage = 18 + wave
-            self.size = 24
             self.radiation_radius = 80  # Damages players in this radius
             self.radiation_damage = 5  # Damage per second to nearby players
-            # Glowing green radioactive look
-            base_colors = [(50, 255, 50), (40, 230, 40), (60, 240, 60)]
-            self.skin_color = vary_color(random.choice(base_colors), 20)
-            self.detail_color = vary_color((30, 180, 30), 15)
-            self.wound_color = (100, 255, 100)  # Glowing green wounds
             self.glow_pulse = 0  # For pulsing glow effect
         elif zombie_type == "cage_walker":
             # Cage Walker - boss zombie, very powerful, commands other zombies
-            self.health = 500 + wave * 50
-            self.speed = 50 + wave
-            self.damage = 50 + wave * 3  # Massive damage
-            self.size = 45
             self.is_boss = True
             self.command_radius = 300  # Radius to command other zombies
             self.roar_cooldown = 0  # Cooldown for commanding zombies
-            # Dark armored look with cage-like patterns
-            base_colors = [(40, 40, 50), (35, 35, 45), (45, 45, 55)]
-            self.skin_color = vary_color(random.choice(base_colors), 10)
-            self.detail_color = vary_color((60, 60, 80), 10)
-            self.wound_color = (80, 20, 20)  # Dark blood
             self.cage_color = (100, 100, 120)  # Metal cage color
-        elif zombie_type == "speed":
-            # Speed zombie - very fast, medium sized
-            self.health = 35 + wave * 6
-            self.speed = 200 + wave * 5  # Very fast!
-            self.damage = 10 + wave
-            self.size = 18
-            # Lean, athletic zombie
-            base_colors = [(130, 115, 100), (120, 105, 95), (140, 125, 110)]
-            self.skin_color = vary_color(random.choice(base_colors), 15)
-            self.detail_color = vary_color((90, 75, 65), 10)
-            self.wound_color = (160, 60, 60)
         elif zombie_type == "zombie_king":
             # ZOMBIE KING - Ultimate boss with stages
-            # Health and damage scale with stage
-            stage_multiplier = king_stage
-            self.health = 1000 * stage_multiplier + wave * 100
-            self.speed = 60 + stage_multiplier * 5
-            self.damage = 75 * stage_multiplier  # Massive damage
-            self.size = 60 + stage_multiplier * 5  # Gets bigger each stage
             self.is_boss = True
-            self.king_stage = king_stage
             self.slam_cooldown = 0  # Area attack cooldown
-            self.slam_radius = 150 + stage_multiplier * 20
+            self.slam_radius = 150 + king_stage * 20
             self.roar_cooldown = 0
             self.spawn_cooldown = 0  # Can spawn minions
-            # Royal dark purple/black colors
-            base_colors = [(60, 30, 80), (50, 25, 70), (70, 35, 90)]
-            self.skin_color = vary_color(random.choice(base_colors), 10)
-            self.detail_color = vary_color((40, 20, 50), 8)
-            self.wound_color = (120, 40, 120)  # Purple blood
             self.crown_color = (200, 170, 50)  # Golden crown
         elif zombie_type == "screamer":
             # Screamer - alerts and buffs nearby zombies when it sees a player
-            self.health = 45 + wave * 8
-            self.speed = 90 + wave * 2
-            self.damage = 8 + wave
-            self.size = 19
             self.scream_cooldown = 0
             self.scream_radius = 250  # Radius to alert other zombies
             self.has_screamed = False  # Track if alerted this encounter
-            # Pale white/gray - throat is red/exposed
-            base_colors = [(180, 175, 170), (170, 165, 160), (190, 185, 180)]
-            self.skin_color = vary_color(random.choice(base_colors), 10)
-            self.detail_color = vary_color((140, 135, 130), 8)
-            self.wound_color = (200, 80, 80)  # Red throat
             self.mouth_color = (180, 50, 50)  # Open screaming mouth
         elif zombie_type == "leaper":
             # Leaper - jumps at players from distance
-            self.health = 40 + wave * 7
-            self.speed = 70 + wave * 2  # Slower walk, but jumps
-            self.damage = 20 + wave * 2  # High pounce damage
-            self.size = 17
             self.leap_cooldown = 0
             self.leap_range = 200  # Distance to start leap
             self.leap_speed = 400  # Speed during leap
             self.is_leaping = False
             self.leap_target_x = 0
             self.leap_target_y = 0
-            # Feral, hunched look - darker colors
-            base_colors = [(70, 75, 65), (65, 70, 60), (75, 80, 70)]
-            self.skin_color = vary_color(random.choice(base_colors), 12)
-            self.detail_color = vary_color((50, 55, 45), 10)
-            self.wound_color = (130, 55, 55)
         elif zombie_type == "necromancer":
             # Necromancer - resurrects dead zombies, stays back
-            self.health = 70 + wave * 10
-            self.speed = 40 + wave  # Slow, stays back
-            self.damage = 12 + wave
-            self.size = 26
             self.resurrect_cooldown = 0
             self.resurrect_radius = 200
             self.max_resurrects = 3  # Max zombies to resurrect per cooldown
             self.resurrect_count = 0
-            # Dark robed appearance - purple/black
-            base_colors = [(50, 40, 60), (45, 35, 55), (55, 45, 65)]
-            self.skin_color = vary_color(random.choice(base_colors), 8)
-            self.detail_color = vary_color((35, 25, 45), 6)
-            self.wound_color = (100, 50, 120)  # Purple energy
             self.robe_color = (30, 20, 40)  # Dark robe
             self.energy_color = (150, 80, 200)  # Purple magic
             self.energy_pulse = 0
         elif zombie_type == "horde_mother":
             # HORDE MOTHER - Boss that spawns mini zombies
-            self.health = 800 + wave * 80
-            self.speed = 35 + wave
-            self.damage = 40 + wave * 2
-            self.size = 55
             self.is_boss = True
             self.spawn_cooldown = 0
             self.spawn_rate = 3.0  # Spawn every 3 seconds
             self.max_children = 8  # Max active children at once
             self.children = []  # Track spawned children
             self.belly_pulse = 0  # Animation for spawning
-            # Bloated, maternal horror
-            base_colors = [(80, 70, 75), (75, 65, 70), (85, 75, 80)]
-            self.skin_color = vary_color(random.choice(base_colors), 10)
-            self.detail_color = vary_color((55, 45, 50), 8)
-            self.wound_color = (140, 60, 70)
             self.belly_color = (100, 85, 90)  # Distended belly
-        else:
-            # Default fallback
-            self.health = 50 + wave * 10
-            self.speed = 80 + wave * 2
-            self.damage = 10 + wave
-            self.size = 20
-            self.skin_color = (85, 107, 85)
-            self.detail_color = (60, 75, 55)
-            self.wound_color = (120, 50, 50)
 
         self.max_health = self.health
         self.active = True
@@ -2097,7 +2730,22 @@ class Zombie:
         self.knockback_vx = 0
         self.knockback_vy = 0
 
-    def update(self, dt, players, walls, bunker=None, all_zombies=None):
+    @property
+    def angle(self):
+        # update() only keeps the unit facing vector; the angle itself is
+        # derived (and cached) the first time drawing asks for it
+        angle = self._angle
+        if angle is None:
+            angle = self._angle = math.atan2(self.face_y, self.face_x)
+        return angle
+
+    @angle.setter
+    def angle(self, value):
+        self._angle = value
+        self.face_x = math.cos(value)
+        self.face_y = math.sin(value)
+
+    def update(self, dt, players, wall_hash, bunker=None, all_zombies=None):
         # Apply knockback
         if abs(self.knockback_vx) > 1 or abs(self.knockback_vy) > 1:
             self.x += self.knockback_vx * dt
@@ -2107,12 +2755,15 @@ class Zombie:
 
         # Radioactive zombie - update glow and damage nearby players
         if self.zombie_type == "radioactive":
-            self.glow_pulse = (self.glow_pulse + dt * 3) % (math.pi * 2)
+            self.glow_pulse = (self.glow_pulse + dt * 3) % math.tau
             # Damage nearby players with radiation
+            x, y = self.x, self.y
+            radius_sq = self.radiation_radius * self.radiation_radius
             for player in players:
                 if player.health > 0:
-                    dist = math.sqrt((player.x - self.x)**2 + (player.y - self.y)**2)
-                    if dist < self.radiation_radius:
+                    dx = player.x - x
+                    dy = player.y - y
+                    if dx * dx + dy * dy < radius_sq:
                         player.take_damage(self.radiation_damage * dt)
 
         # Cage Walker - command nearby zombies to attack bunker
@@ -2120,10 +2771,13 @@ class Zombie:
             self.roar_cooldown -= dt
             if self.roar_cooldown <= 0:
                 # Command nearby zombies to target bunker
+                x, y = self.x, self.y
+                radius_sq = self.command_radius * self.command_radius
                 for zombie in all_zombies:
-                    if zombie != self and zombie.active:
-                        dist = math.sqrt((zombie.x - self.x)**2 + (zombie.y - self.y)**2)
-                        if dist < self.command_radius:
+                    if zombie is not self and zombie.active:
+                        dx = zombie.x - x
+                        dy = zombie.y - y
+                        if dx * dx + dy * dy < radius_sq:
                             zombie.target_bunker = True
                 self.roar_cooldown = 5.0  # Roar every 5 seconds
 
@@ -2133,10 +2787,13 @@ class Zombie:
             self.slam_cooldown -= dt
             if self.slam_cooldown <= 0:
                 # Area damage to all nearby players
+                x, y = self.x, self.y
+                radius_sq = self.slam_radius * self.slam_radius
                 for player in players:
                     if player.health > 0 and not getattr(player, 'is_traitor', False):
-                        dist = math.sqrt((player.x - self.x)**2 + (player.y - self.y)**2)
-                        if dist < self.slam_radius:
+                        dx = player.x - x
+                        dy = player.y - y
+                        if dx * dx + dy * dy < radius_sq:
                             player.take_damage(self.damage * 0.5)  # 50% of normal damage
                 self.slam_cooldown = 4.0  # Slam every 4 seconds
 
@@ -2152,15 +2809,19 @@ class Zombie:
         if self.zombie_type == "screamer" and all_zombies:
             self.scream_cooldown -= dt
             # Check if player is close enough to trigger scream
+            x, y = self.x, self.y
             for player in players:
                 if player.health > 0 and not getattr(player, 'is_traitor', False):
-                    dist = math.sqrt((player.x - self.x)**2 + (player.y - self.y)**2)
-                    if dist < 300 and self.scream_cooldown <= 0:
+                    dx = player.x - x
+                    dy = player.y - y
+                    if dx * dx + dy * dy < 300 * 300 and self.scream_cooldown <= 0:
                         # Scream! Buff all nearby zombies
+                        radius_sq = self.scream_radius * self.scream_radius
                         for zombie in all_zombies:
-                            if zombie != self and zombie.active:
-                                z_dist = math.sqrt((zombie.x - self.x)**2 + (zombie.y - self.y)**2)
-                                if z_dist < self.scream_radius:
+                            if zombie is not self and zombie.active:
+                                dx = zombie.x - x
+                                dy = zombie.y - y
+                                if dx * dx + dy * dy < radius_sq:
                                     # Temporary speed boost
                                     zombie.speed *= 1.3
                                     zombie.target_bunker = False  # Redirect to players
@@ -2175,22 +2836,27 @@ class Zombie:
                 # Currently in mid-leap
                 dx = self.leap_target_x - self.x
                 dy = self.leap_target_y - self.y
-                dist = math.sqrt(dx**2 + dy**2)
-                if dist < 20:
+                dist_sq = dx * dx + dy * dy
+                if dist_sq < 20 * 20:
                     # Landed
                     self.is_leaping = False
                     self.leap_cooldown = 2.5
                 else:
                     # Continue leap
-                    self.x += (dx / dist) * self.leap_speed * dt
-                    self.y += (dy / dist) * self.leap_speed * dt
+                    step = self.leap_speed * dt / math.sqrt(dist_sq)
+                    self.x += dx * step
+                    self.y += dy * step
             else:
                 self.leap_cooldown -= dt
                 # Check for leap opportunity
+                x, y = self.x, self.y
+                range_sq = self.leap_range * self.leap_range
                 for player in players:
                     if player.health > 0 and not getattr(player, 'is_traitor', False):
-                        dist = math.sqrt((player.x - self.x)**2 + (player.y - self.y)**2)
-                        if dist < self.leap_range and dist > 60 and self.leap_cooldown <= 0:
+                        dx = player.x - x
+                        dy = player.y - y
+                        dist_sq = dx * dx + dy * dy
+                        if 60 * 60 < dist_sq < range_sq and self.leap_cooldown <= 0:
                             # Start leap
                             self.is_leaping = True
                             self.leap_target_x = player.x
@@ -2199,12 +2865,12 @@ class Zombie:
 
         # Necromancer - resurrect dead zombies (spawns new ones nearby)
         if self.zombie_type == "necromancer" and all_zombies is not None:
-            self.energy_pulse = (self.energy_pulse + dt * 2) % (math.pi * 2)
+            self.energy_pulse = (self.energy_pulse + dt * 2) % math.tau
             self.resurrect_cooldown -= dt
             if self.resurrect_cooldown <= 0:
                 # Spawn a "resurrected" zombie nearby
                 if len(all_zombies) < 50:  # Limit total zombies
-                    angle = random.uniform(0, math.pi * 2)
+                    angle = random.uniform(0, math.tau)
                     spawn_dist = random.uniform(50, 100)
                     new_x = self.x + math.cos(angle) * spawn_dist
                     new_y = self.y + math.sin(angle) * spawn_dist
@@ -2217,13 +2883,19 @@ class Zombie:
 
         # Horde Mother - spawn mini zombies
         if self.zombie_type == "horde_mother" and all_zombies is not None:
-            self.belly_pulse = (self.belly_pulse + dt * 3) % (math.pi * 2)
+            self.belly_pulse = (self.belly_pulse + dt * 3) % math.tau
             self.spawn_cooldown -= dt
-            # Clean up dead children
-            self.children = [c for c in self.children if c.active]
+            # Clean up dead children in place
+            children = self.children
+            write = 0
+            for child in children:
+                if child.active:
+                    children[write] = child
+                    write += 1
+            del children[write:]
             if self.spawn_cooldown <= 0 and len(self.children) < self.max_children:
                 # Spawn a mini zombie
-                angle = random.uniform(0, math.pi * 2)
+                angle = random.uniform(0, math.tau)
                 spawn_x = self.x + math.cos(angle) * 40
                 spawn_y = self.y + math.sin(angle) * 40
                 child = Zombie(spawn_x, spawn_y, "crawler", self.wave)
@@ -2234,8 +2906,10 @@ class Zombie:
                 all_zombies.append(child)
                 self.spawn_cooldown = self.spawn_rate
 
-        # Find nearest target (player, wall, or bunker)
-        nearest_dist = float('inf')
+        # Find nearest target (player, wall, or bunker), comparing squared
+        # distances so only the winner pays for a square root
+        x, y = self.x, self.y
+        nearest_sq = float('inf')
         nearest_target = None
         target_type = None
 
@@ -2244,80 +2918,98 @@ class Zombie:
 
         if should_target_bunker and bunker and bunker.health > 0:
             # Commanded zombies prioritize bunker
-            dist = math.sqrt((bunker.x - self.x)**2 + (bunker.y - self.y)**2)
-            nearest_dist = dist
+            dx = bunker.x - x
+            dy = bunker.y - y
+            nearest_sq = dx * dx + dy * dy
             nearest_target = bunker
             target_type = "bunker"
         else:
             # Normal zombies: find nearest player first (ignore traitors!)
             for player in players:
                 if player.health > 0 and not getattr(player, 'is_traitor', False):
-                    dist = math.sqrt((player.x - self.x)**2 + (player.y - self.y)**2)
-                    if dist < nearest_dist:
-                        nearest_dist = dist
+                    dx = player.x - x
+                    dy = player.y - y
+                    dist_sq = dx * dx + dy * dy
+                    if dist_sq < nearest_sq:
+                        nearest_sq = dist_sq
                         nearest_target = player
                         target_type = "player"
 
             # If no player nearby (within 400 units), target bunker instead
-            if bunker and bunker.health > 0 and (nearest_target is None or nearest_dist > 400):
-                bunker_dist = math.sqrt((bunker.x - self.x)**2 + (bunker.y - self.y)**2)
-                if nearest_target is None or bunker_dist < nearest_dist:
-                    nearest_dist = bunker_dist
+            if bunker and bunker.health > 0 and (nearest_target is None or nearest_sq > 400 * 400):
+                dx = bunker.x - x
+                dy = bunker.y - y
+                bunker_sq = dx * dx + dy * dy
+                if nearest_target is None or bunker_sq < nearest_sq:
+                    nearest_sq = bunker_sq
                     nearest_target = bunker
                     target_type = "bunker"
 
-        # Check walls in path (walls block path to target)
-        for wall in walls:
-            if wall.active:
-                dist = math.sqrt((wall.x - self.x)**2 + (wall.y - self.y)**2)
-                if dist < nearest_dist and dist < 200:
-                    nearest_dist = dist
-                    nearest_target = wall
-                    target_type = "wall"
+        # Check walls in path (walls block path to target); only the cells
+        # within wall range can hold a candidate, and a bounding-box test
+        # drops the far corners of those cells before any multiply
+        wall_range = WALL_TARGET_RANGE
+        wall_range_sq = wall_range * wall_range
+        for bucket in wall_hash.query_buckets(x, y, wall_range):
+            for wall in bucket:
+                if wall.active:
+                    dx = wall.x - x
+                    if not -wall_range < dx < wall_range:
+                        continue
+                    dy = wall.y - y
+                    if not -wall_range < dy < wall_range:
+                        continue
+                    dist_sq = dx * dx + dy * dy
+                    if dist_sq < nearest_sq and dist_sq < wall_range_sq:
+                        nearest_sq = dist_sq
+                        nearest_target = wall
+                        target_type = "wall"
 
         self.target = nearest_target
 
         if nearest_target:
-            # Calculate angle to target
-            dx = nearest_target.x - self.x
-            dy = nearest_target.y - self.y
-            self.angle = math.atan2(dy, dx)
-
-            # Move towards target
-            if target_type == "player" and nearest_dist > 30:
-                self.x += math.cos(self.angle) * self.speed * dt
-                self.y += math.sin(self.angle) * self.speed * dt
-            elif target_type == "wall" and nearest_dist > 50:
-                self.x += math.cos(self.angle) * self.speed * dt
-                self.y += math.sin(self.angle) * self.speed * dt
-            elif target_type == "bunker" and nearest_dist > 80:
-                self.x += math.cos(self.angle) * self.speed * dt
-                self.y += math.sin(self.angle) * self.speed * dt
+            # Face the target: sqrt(nearest_sq) is the length of (dx, dy), so
+            # the unit facing vector needs no atan2 and no cos/sin after it
+            if nearest_sq > 0:
+                inv_dist = 1.0 / math.sqrt(nearest_sq)
+                face_x = self.face_x = (nearest_target.x - x) * inv_dist
+                face_y = self.face_y = (nearest_target.y - y) * inv_dist
+                self._angle = None
+
+                # Move towards target
+                if nearest_sq > ZOMBIE_STOP_DIST_SQ[target_type]:
+                    step = self.speed * dt
+                    self.x += face_x * step
+                    self.y += face_y * step
 
             # Attack
             self.attack_cooldown -= dt
-            if self.attack_cooldown <= 0:
-                if target_type == "player" and nearest_dist < 40:
+            if self.attack_cooldown <= 0 and nearest_sq < ZOMBIE_ATTACK_RANGE_SQ[target_type]:
+                if target_type == "player":
                     nearest_target.take_damage(self.damage)
                     self.attack_cooldown = 1.0
-                elif target_type == "bunker" and nearest_dist < 100:
+                elif target_type == "bunker":
                     nearest_target.take_damage(self.damage)
                     self.attack_cooldown = 1.5
-                elif target_type == "wall" and nearest_dist < 60:
+                elif target_type == "wall":
                     nearest_target.take_damage(self.damage * 2)
                     self.attack_cooldown = 0.5
 
         return self.active
 
-    def take_damage(self, damage, knockback_angle=None):
+    def take_damage(self, damage, knockback_angle=None, knockback_dir=None):
         self.health -= damage
         # Add blood splatter effect
         blood_amount = min(int(damage / 10) + 2, 8)
         visual_effects.add_blood_splatter(self.x, self.y, blood_amount)
+        # Knockback comes either as an angle or, from callers that already
+        # have the offset and its length, as a unit (x, y) direction
         if knockback_angle is not None:
+            knockback_dir = (math.cos(knockback_angle), math.sin(knockback_angle))
+        if knockback_dir is not None:
             knockback_force = min(damage * 3, 200)
-            self.knockback_vx = math.cos(knockback_angle) * knockback_force
-            self.knockback_vy = math.sin(knockback_angle) * knockback_force
+            self.knockback_vx = knockback_dir[0] * knockback_force
+            self.knockback_vy = knockback_dir[1] * knockback_force
         if self.health <= 0:
             self.active = False
             # Extra blood on death
@@ -2328,6 +3020,9 @@ class Zombie:
     def draw(self, screen, camera_offset):
         draw_x = int(self.x - camera_offset[0])
         draw_y = int(self.y - camera_offset[1])
+        # Facing direction, shared by the mouth and eye offsets below
+        face_cos = self.face_x
+        face_sin = self.face_y
 
         # Body - main shape
         pygame.draw.circle(screen, self.skin_color, (draw_x, draw_y), self.size)
@@ -2352,28 +3047,29 @@ class Zombie:
         # Type-specific visual features
         if self.zombie_type == "tank":
             # Muscular arms
-            arm_angle1 = self.angle + 0.5
-            arm_angle2 = self.angle - 0.5
-            arm_x1 = draw_x + int(math.cos(arm_angle1) * self.size * 0.8)
-            arm_y1 = draw_y + int(math.sin(arm_angle1) * self.size * 0.8)
-            arm_x2 = draw_x + int(math.cos(arm_angle2) * self.size * 0.8)
-            arm_y2 = draw_y + int(math.sin(arm_angle2) * self.size * 0.8)
+            c1, s1 = fast_cos_sin(self.angle + 0.5)
+            c2, s2 = fast_cos_sin(self.angle - 0.5)
+            arm_reach = self.size * 0.8
+            arm_x1 = draw_x + int(c1 * arm_reach)
+            arm_y1 = draw_y + int(s1 * arm_reach)
+            arm_x2 = draw_x + int(c2 * arm_reach)
+            arm_y2 = draw_y + int(s2 * arm_reach)
             pygame.draw.circle(screen, self.skin_color, (arm_x1, arm_y1), 10)
             pygame.draw.circle(screen, self.skin_color, (arm_x2, arm_y2), 10)
 
         elif self.zombie_type == "spitter":
             # Glowing toxic mouth
-            mouth_x = draw_x + int(math.cos(self.angle) * self.size * 0.5)
-            mouth_y = draw_y + int(math.sin(self.angle) * self.size * 0.5)
+            mouth_x = draw_x + int(face_cos * self.size * 0.5)
+            mouth_y = draw_y + int(face_sin * self.size * 0.5)
             pygame.draw.circle(screen, (150, 200, 50), (mouth_x, mouth_y), 6)
             pygame.draw.circle(screen, (180, 230, 80), (mouth_x, mouth_y), 3)
 
         elif self.zombie_type == "bloater":
             # Bloated bumps
             for i in range(3):
-                bump_angle = self.angle + i * 2.1
-                bump_x = draw_x + int(math.cos(bump_angle) * self.size * 0.6)
-                bump_y = draw_y + int(math.sin(bump_angle) * self.size * 0.6)
+                c, s = fast_cos_sin(self.angle + i * 2.1)
+                bump_x = draw_x + int(c * self.size * 0.6)
+                bump_y = draw_y + int(s * self.size * 0.6)
                 pygame.draw.circle(screen, self.wound_color, (bump_x, bump_y), 5)
 
         elif self.zombie_type == "crawler":
@@ -2413,8 +3109,8 @@ class Zombie:
 
         elif self.zombie_type == "screamer":
             # Wide open mouth
-            mouth_x = draw_x + int(math.cos(self.angle) * self.size * 0.4)
-            mouth_y = draw_y + int(math.sin(self.angle) * self.size * 0.4)
+            mouth_x = draw_x + int(face_cos * self.size * 0.4)
+            mouth_y = draw_y + int(face_sin * self.size * 0.4)
             pygame.draw.circle(screen, self.mouth_color, (mouth_x, mouth_y), 8)
             pygame.draw.circle(screen, (50, 20, 20), (mouth_x, mouth_y), 5)
             # Sound wave effect when screaming
@@ -2486,67 +3182,11 @@ class Zombie:
 
         # Eyes (facing direction) - different for each type
         eye_offset = self.size * 0.4
-        eye_x = draw_x + math.cos(self.angle) * eye_offset
-        eye_y = draw_y + math.sin(self.angle) * eye_offset
-
-        if self.zombie_type == "runner":
-            # Wide, frantic eyes
-            pygame.draw.circle(screen, (255, 200, 200), (int(eye_x - 5), int(eye_y)), 5)
-            pygame.draw.circle(screen, (255, 200, 200), (int(eye_x + 5), int(eye_y)), 5)
-            pygame.draw.circle(screen, RED, (int(eye_x - 5), int(eye_y)), 2)
-            pygame.draw.circle(screen, RED, (int(eye_x + 5), int(eye_y)), 2)
-        elif self.zombie_type == "tank":
-            # Small, angry eyes
-            pygame.draw.circle(screen, (200, 50, 50), (int(eye_x - 6), int(eye_y)), 4)
-            pygame.draw.circle(screen, (200, 50, 50), (int(eye_x + 6), int(eye_y)), 4)
-        elif self.zombie_type == "spitter":
-            # Glowing yellow eyes
-            pygame.draw.circle(screen, (200, 220, 50), (int(eye_x - 4), int(eye_y)), 4)
-            pygame.draw.circle(screen, (200, 220, 50), (int(eye_x + 4), int(eye_y)), 4)
-        elif self.zombie_type == "bloater":
-            # Milky, dead eyes
-            pygame.draw.circle(screen, (180, 180, 190), (int(eye_x - 5), int(eye_y)), 5)
-            pygame.draw.circle(screen, (180, 180, 190), (int(eye_x + 5), int(eye_y)), 5)
-        elif self.zombie_type == "radioactive":
-            # Glowing bright green eyes
-            pygame.draw.circle(screen, (150, 255, 150), (int(eye_x - 5), int(eye_y)), 5)
-            pygame.draw.circle(screen, (150, 255, 150), (int(eye_x + 5), int(eye_y)), 5)
-            pygame.draw.circle(screen, (50, 255, 50), (int(eye_x - 5), int(eye_y)), 3)
-            pygame.draw.circle(screen, (50, 255, 50), (int(eye_x + 5), int(eye_y)), 3)
-        elif self.zombie_type == "cage_walker":
-            # Burning orange/red eyes - boss
-            pygame.draw.circle(screen, (255, 150, 50), (int(eye_x - 8), int(eye_y)), 7)
-            pygame.draw.circle(screen, (255, 150, 50), (int(eye_x + 8), int(eye_y)), 7)
-            pygame.draw.circle(screen, (255, 50, 0), (int(eye_x - 8), int(eye_y)), 4)
-            pygame.draw.circle(screen, (255, 50, 0), (int(eye_x + 8), int(eye_y)), 4)
-        elif self.zombie_type == "screamer":
-            # Wide, hollow eyes
-            pygame.draw.circle(screen, (220, 220, 220), (int(eye_x - 5), int(eye_y)), 6)
-            pygame.draw.circle(screen, (220, 220, 220), (int(eye_x + 5), int(eye_y)), 6)
-            pygame.draw.circle(screen, (40, 40, 40), (int(eye_x - 5), int(eye_y)), 3)
-            pygame.draw.circle(screen, (40, 40, 40), (int(eye_x + 5), int(eye_y)), 3)
-        elif self.zombie_type == "leaper":
-            # Feral, yellow predator eyes
-            pygame.draw.circle(screen, (220, 200, 50), (int(eye_x - 4), int(eye_y)), 5)
-            pygame.draw.circle(screen, (220, 200, 50), (int(eye_x + 4), int(eye_y)), 5)
-            pygame.draw.circle(screen, (30, 30, 30), (int(eye_x - 4), int(eye_y)), 2)
-            pygame.draw.circle(screen, (30, 30, 30), (int(eye_x + 4), int(eye_y)), 2)
-        elif self.zombie_type == "necromancer":
-            # Glowing purple eyes
-            pygame.draw.circle(screen, (180, 100, 220), (int(eye_x - 5), int(eye_y)), 5)
-            pygame.draw.circle(screen, (180, 100, 220), (int(eye_x + 5), int(eye_y)), 5)
-            pygame.draw.circle(screen, (255, 150, 255), (int(eye_x - 5), int(eye_y)), 2)
-            pygame.draw.circle(screen, (255, 150, 255), (int(eye_x + 5), int(eye_y)), 2)
-        elif self.zombie_type == "horde_mother":
-            # Multiple small eyes - boss
-            for i in range(3):
-                offset = (i - 1) * 8
-                pygame.draw.circle(screen, (200, 150, 150), (int(eye_x + offset), int(eye_y)), 5)
-                pygame.draw.circle(screen, (100, 50, 50), (int(eye_x + offset), int(eye_y)), 2)
-        else:
-            # Normal red eyes
-            pygame.draw.circle(screen, (200, 60, 60), (int(eye_x - 4), int(eye_y)), 4)
-            pygame.draw.circle(screen, (200, 60, 60), (int(eye_x + 4), int(eye_y)), 4)
+        eye_x = draw_x + face_cos * eye_offset
+        eye_y = draw_y + face_sin * eye_offset
+
+        eyes = ZOMBIE_EYE_SPRITES.get(self.zombie_type, ZOMBIE_EYE_SPRITES["normal"])
+        screen.blit(eyes, (int(eye_x) - eyes.get_width() // 2, int(eye_y) - eyes.get_height() // 2))
 
         # Health bar
         if self.health < self.max_health:
@@ -2555,6 +3195,308 @@ class Zombie:
             pygame.draw.rect(screen, (50, 180, 50), (draw_x - bar_width//2, draw_y - self.size - 10, int(bar_width * health_ratio), 5))
 
 
+# Gun colors
+GUN_BLACK = (30, 30, 30)
+GUN_DARK = (50, 50, 50)
+GUN_GRAY = (70, 70, 70)
+GUN_BROWN = (90, 60, 40)  # Wood/grip
+
+
+def draw_gun_pistol(screen, gun_x, gun_y, cos_a, sin_a, perp_x, perp_y, kick):
+    """Compact pistol with slide and grip."""
+    barrel_len = 18 - kick
+    # Barrel
+    muzzle = (int(gun_x + cos_a * barrel_len), int(gun_y + sin_a * barrel_len))
+    pygame.draw.line(screen, GUN_BLACK, (int(gun_x), int(gun_y)), muzzle, 6)
+    # Slide (top part)
+    pygame.draw.line(screen, GUN_DARK, (int(gun_x - cos_a*5), int(gun_y - sin_a*5)), muzzle, 8)
+    # Grip (angled down)
+    grip_root_x = gun_x - cos_a * 3
+    grip_root_y = gun_y - sin_a * 3
+    pygame.draw.line(screen, GUN_BROWN, (int(grip_root_x), int(grip_root_y)),
+                     (int(grip_root_x + perp_x * 8), int(grip_root_y + perp_y * 8)), 6)
+
+
+def draw_gun_rifle(screen, gun_x, gun_y, cos_a, sin_a, perp_x, perp_y, kick):
+    """Assault rifle with rail, magazine and stock."""
+    barrel_len = 35 - kick
+    muzzle = (int(gun_x + cos_a * barrel_len), int(gun_y + sin_a * barrel_len))
+    rear = (int(gun_x - cos_a*10), int(gun_y - sin_a*10))
+    # Main body
+    pygame.draw.line(screen, GUN_BLACK, rear, muzzle, 7)
+    # Upper rail
+    pygame.draw.line(screen, GUN_GRAY, (int(gun_x - cos_a*5), int(gun_y - sin_a*5 - perp_y*2)), (int(gun_x + cos_a*15), int(gun_y + sin_a*15 - perp_y*2)), 3)
+    # Magazine
+    mag_x = gun_x + cos_a * 5
+    mag_y = gun_y + sin_a * 5
+    pygame.draw.line(screen, GUN_DARK, (int(mag_x), int(mag_y)), (int(mag_x + perp_x*12), int(mag_y + perp_y*12)), 5)
+    # Stock
+    pygame.draw.line(screen, GUN_BROWN, rear, (int(gun_x - cos_a*15), int(gun_y - sin_a*15)), 6)
+
+
+def draw_gun_sniper(screen, gun_x, gun_y, cos_a, sin_a, perp_x, perp_y, kick):
+    """Long sniper rifle with scope."""
+    barrel_len = 45 - kick
+    rear = (int(gun_x - cos_a*12), int(gun_y - sin_a*12))
+    # Long barrel
+    pygame.draw.line(screen, GUN_BLACK, rear, (int(gun_x + cos_a * barrel_len), int(gun_y + sin_a * barrel_len)), 5)
+    # Scope
+    scope = (int(gun_x + cos_a * 8), int(gun_y + sin_a * 8 - perp_y * 5))
+    pygame.draw.circle(screen, GUN_GRAY, scope, 4)
+    pygame.draw.circle(screen, (100, 150, 200), scope, 2)  # Lens
+    # Stock
+    pygame.draw.line(screen, GUN_BROWN, rear, (int(gun_x - cos_a*22), int(gun_y - sin_a*22)), 7)
+
+
+def draw_gun_shotgun(screen, gun_x, gun_y, cos_a, sin_a, perp_x, perp_y, kick):
+    """Thick-barreled shotgun with pump grip."""
+    barrel_len = 30 - kick
+    # Thick barrel
+    pygame.draw.line(screen, GUN_BLACK, (int(gun_x), int(gun_y)), (int(gun_x + cos_a * barrel_len), int(gun_y + sin_a * barrel_len)), 9)
+    # Pump grip
+    pump_x = gun_x + cos_a * 12
+    pump_y = gun_y + sin_a * 12
+    pygame.draw.line(screen, GUN_BROWN, (int(pump_x - perp_x*4), int(pump_y - perp_y*4)), (int(pump_x + perp_x*6), int(pump_y + perp_y*6)), 6)
+    # Stock
+    pygame.draw.line(screen, GUN_BROWN, (int(gun_x - cos_a*5), int(gun_y - sin_a*5)), (int(gun_x - cos_a*18), int(gun_y - sin_a*18)), 7)
+
+
+def draw_gun_smg(screen, gun_x, gun_y, cos_a, sin_a, perp_x, perp_y, kick):
+    """Compact SMG with magazine in the grip."""
+    barrel_len = 22 - kick
+    rear = (int(gun_x - cos_a*8), int(gun_y - sin_a*8))
+    # Body
+    pygame.draw.line(screen, GUN_BLACK, rear, (int(gun_x + cos_a * barrel_len), int(gun_y + sin_a * barrel_len)), 6)
+    # Magazine (in grip)
+    pygame.draw.line(screen, GUN_DARK, (int(gun_x), int(gun_y)), (int(gun_x + perp_x*10), int(gun_y + perp_y*10)), 5)
+    # Folding stock
+    pygame.draw.line(screen, GUN_GRAY, rear, (int(gun_x - cos_a*14), int(gun_y - sin_a*14)), 4)
+
+
+def draw_gun_minigun(screen, gun_x, gun_y, cos_a, sin_a, perp_x, perp_y, kick):
+    """Multi-barrel minigun with housing and ammo box."""
+    barrel_len = 40 - kick
+    barrel_end_x = gun_x + cos_a * barrel_len
+    barrel_end_y = gun_y + sin_a * barrel_len
+    # Multiple barrels
+    for i in range(-2, 3):
+        offset = i * 3
+        pygame.draw.line(screen, GUN_BLACK,
+            (int(gun_x + perp_x*offset), int(gun_y + perp_y*offset)),
+            (int(barrel_end_x + perp_x*offset), int(barrel_end_y + perp_y*offset)), 3)
+    # Housing
+    pygame.draw.circle(screen, GUN_DARK, (int(gun_x), int(gun_y)), 10)
+    # Ammo box
+    pygame.draw.rect(screen, GUN_GRAY, (int(gun_x - cos_a*15 - 8), int(gun_y - sin_a*15 - 8), 16, 16))
+
+
+def draw_gun_rocket(screen, gun_x, gun_y, cos_a, sin_a, perp_x, perp_y, kick):
+    """Rocket launcher tube with sight."""
+    barrel_len = 38 - kick
+    muzzle = (int(gun_x + cos_a * barrel_len), int(gun_y + sin_a * barrel_len))
+    rear = (int(gun_x - cos_a*10), int(gun_y - sin_a*10))
+    # Tube
+    pygame.draw.line(screen, (60, 80, 60), rear, muzzle, 12)
+    pygame.draw.line(screen, (80, 100, 80), rear, muzzle, 8)
+    # Sight
+    sight_x = gun_x + cos_a*5
+    sight_y = gun_y + sin_a*5
+    pygame.draw.line(screen, GUN_BLACK, (int(sight_x - perp_x*8), int(sight_y - perp_y*8)), (int(sight_x - perp_x*14), int(sight_y - perp_y*14)), 3)
+    # Grip
+    pygame.draw.line(screen, GUN_BROWN, (int(gun_x), int(gun_y)), (int(gun_x + perp_x*10), int(gun_y + perp_y*10)), 5)
+
+
+def draw_gun_grenade(screen, gun_x, gun_y, cos_a, sin_a, perp_x, perp_y, kick):
+    """Grenade launcher with drum magazine."""
+    barrel_len = 28 - kick
+    # Barrel
+    pygame.draw.line(screen, GUN_BLACK, (int(gun_x), int(gun_y)), (int(gun_x + cos_a * barrel_len), int(gun_y + sin_a * barrel_len)), 10)
+    # Drum magazine
+    drum = (int(gun_x + cos_a * 8 + perp_x * 8), int(gun_y + sin_a * 8 + perp_y * 8))
+    pygame.draw.circle(screen, GUN_DARK, drum, 8)
+    pygame.draw.circle(screen, GUN_GRAY, drum, 5)
+    # Stock
+    pygame.draw.line(screen, GUN_BROWN, (int(gun_x - cos_a*5), int(gun_y - sin_a*5)), (int(gun_x - cos_a*15), int(gun_y - sin_a*15)), 6)
+
+
+def draw_gun_knife(screen, gun_x, gun_y, cos_a, sin_a, perp_x, perp_y, kick):
+    """Combat knife blade with guard and handle."""
+    blade_len = 25 - kick
+    blade_tip = (int(gun_x + cos_a * blade_len), int(gun_y + sin_a * blade_len))
+    # Blade (silver/metallic)
+    blade_color = (180, 180, 190)
+    blade_edge = (140, 140, 150)
+    # Main blade
+    pygame.draw.line(screen, blade_color, (int(gun_x), int(gun_y)), blade_tip, 5)
+    # Sharp edge highlight
+    pygame.draw.line(screen, blade_edge,
+        (int(gun_x + perp_x*2), int(gun_y + perp_y*2)),
+        blade_tip, 2)
+    # Handle/grip (brown), starting at the guard
+    guard_x = gun_x - cos_a * 2
+    guard_y = gun_y - sin_a * 2
+    pygame.draw.line(screen, GUN_BROWN, (int(guard_x), int(guard_y)), (int(gun_x - cos_a * 12), int(gun_y - sin_a * 12)), 7)
+    # Guard (cross piece between blade and handle)
+    pygame.draw.line(screen, GUN_DARK,
+        (int(guard_x - perp_x*5), int(guard_y - perp_y*5)),
+        (int(guard_x + perp_x*5), int(guard_y + perp_y*5)), 3)
+
+
+def draw_gun_default(screen, gun_x, gun_y, cos_a, sin_a, perp_x, perp_y, kick):
+    """Simple generic gun shape."""
+    barrel_len = 25 - kick
+    origin = (int(gun_x), int(gun_y))
+    pygame.draw.line(screen, GUN_BLACK, origin, (int(gun_x + cos_a * barrel_len), int(gun_y + sin_a * barrel_len)), 6)
+    pygame.draw.line(screen, GUN_BROWN, origin, (int(gun_x + perp_x*8), int(gun_y + perp_y*8)), 5)
+
+
+# Weapon draw_style -> gun drawing function, used by Player.draw
+GUN_DRAWERS = {
+    "pistol": draw_gun_pistol,
+    "rifle": draw_gun_rifle,
+    "sniper": draw_gun_sniper,
+    "shotgun": draw_gun_shotgun,
+    "smg": draw_gun_smg,
+    "minigun": draw_gun_minigun,
+    "rocket": draw_gun_rocket,
+    "grenade": draw_gun_grenade,
+    "knife": draw_gun_knife,
+    "default": draw_gun_default,
+}
+
+# Rotated gun sprites keyed by (draw_style, angle bucket), baked on first use
+GUN_ANGLE_STEP = 3  # Degrees per cached rotation
+GUN_SPRITE_HALF = 48  # Sprites are 96x96, gun origin at the center
+GUN_SPRITES = {}
+
+
+def get_gun_sprite(draw_style, angle):
+    """Return the cached sprite of a resting gun at the nearest angle bucket."""
+    bucket = int(round(math.degrees(angle) / GUN_ANGLE_STEP)) % (360 // GUN_ANGLE_STEP)
+    key = (draw_style, bucket)
+    sprite = GUN_SPRITES.get(key)
+    if sprite is None:
+        bucket_angle = math.radians(bucket * GUN_ANGLE_STEP)
+        cos_a = math.cos(bucket_angle)
+        sin_a = math.sin(bucket_angle)
+        sprite = pygame.Surface((GUN_SPRITE_HALF * 2, GUN_SPRITE_HALF * 2), pygame.SRCALPHA)
+        GUN_DRAWERS[draw_style](sprite, GUN_SPRITE_HALF, GUN_SPRITE_HALF, cos_a, sin_a, -sin_a, cos_a, 0)
+        sprite = optimize_surface(sprite)
+        GUN_SPRITES[key] = sprite
+    return sprite
+
+
+MUZZLE_FLASH_SPRITES = {}  # flash radius -> pre-drawn flash
+
+
+def get_muzzle_flash_sprite(flash_size):
+    """Return the cached three-ring muzzle flash of the given radius."""
+    sprite = MUZZLE_FLASH_SPRITES.get(flash_size)
+    if sprite is None:
+        sprite = pygame.Surface((flash_size * 2, flash_size * 2), pygame.SRCALPHA)
+        center = (flash_size, flash_size)
+        # Outer flash (orange)
+        pygame.draw.circle(sprite, ORANGE, center, flash_size)
+        # Inner flash (yellow/white)
+        pygame.draw.circle(sprite, YELLOW, center, flash_size // 2)
+        pygame.draw.circle(sprite, WHITE, center, flash_size // 4)
+        sprite = optimize_surface(sprite)
+        MUZZLE_FLASH_SPRITES[flash_size] = sprite
+    return sprite
+
+
+# Per-class starting stats, loadout and ability cooldown
+CLASS_STATS = {
+    PlayerClass.BUILDER: {
+        "max_health": 120,
+        "speed": 200,
+        # Builder: Nail gun + sidearm + knife
+        "weapons": ["nail_gun", "glock", "knife"],
+        "color": ORANGE,
+        "ability_max_cooldown": 3,  # Wall building cooldown
+        "extras": {"max_walls": 10},
+    },
+    PlayerClass.RANGER: {
+        "max_health": 100,
+        "speed": 220,
+        # Ranger: Full weapon arsenal + knife
+        "weapons": ["rifle", "ak47", "shotgun", "sniper", "pistol", "knife"],
+        "color": GREEN,
+        "ability_max_cooldown": 15,  # Speed boost
+        "extras": {},
+    },
+    PlayerClass.HEALER: {
+        "max_health": 90,
+        "speed": 210,
+        # Healer: SMGs and pistol + knife
+        "weapons": ["smg", "p90", "tranq_pistol", "knife"],
+        "color": LIGHT_BLUE,
+        "ability_max_cooldown": 12,  # Heal zone
+        # Bandages heal other players 30 HP (1 use each), medkits heal to full
+        "extras": {"bandages": 5, "medkits": 3},
+    },
+    PlayerClass.TANK: {
+        "max_health": 180,
+        "speed": 140,
+        # Tank: Heavy weapons + Desert Eagle + Knife
+        "weapons": ["minigun", "rpg", "grenade_launcher", "spas12", "deagle", "knife"],
+        "color": RED,
+        "ability_max_cooldown": 20,  # Ground slam
+        "extras": {},
+    },
+    PlayerClass.TRAITOR: {
+        "max_health": 100,
+        "speed": 200,
+        # Traitor: Basic weapons, allied with zombies + Knife
+        "weapons": ["pistol", "smg", "knife"],
+        "color": PURPLE,
+        "ability_max_cooldown": 8,  # Spawn zombie cooldown
+        "extras": {"is_traitor": True},
+    },
+}
+
+
+def build_class_icons():
+    """Pre-render the small icon drawn on each class's player body."""
+    c = CLASS_ICON_HALF  # Icon center
+    icons = {}
+    for player_class in CLASS_STATS:
+        icon = pygame.Surface((c * 2, c * 2), pygame.SRCALPHA)
+        if player_class == PlayerClass.BUILDER:
+            # Hammer icon
+            pygame.draw.rect(icon, BROWN, (c - 5, c - 8, 10, 16))
+        elif player_class == PlayerClass.RANGER:
+            # Crosshair
+            pygame.draw.line(icon, WHITE, (c - 8, c), (c + 8, c), 2)
+            pygame.draw.line(icon, WHITE, (c, c - 8), (c, c + 8), 2)
+        elif player_class == PlayerClass.HEALER:
+            # Cross
+            pygame.draw.rect(icon, WHITE, (c - 8, c - 3, 16, 6))
+            pygame.draw.rect(icon, WHITE, (c - 3, c - 8, 6, 16))
+        elif player_class == PlayerClass.TANK:
+            # Explosion symbol
+            pygame.draw.polygon(icon, YELLOW, [
+                (c, c - 10), (c + 5, c - 3),
+                (c + 10, c - 5), (c + 5, c),
+                (c + 8, c + 8), (c, c + 4),
+                (c - 8, c + 8), (c - 5, c),
+                (c - 10, c - 5), (c - 5, c - 3)
+            ])
+        elif player_class == PlayerClass.TRAITOR:
+            # Skull icon (traitor)
+            pygame.draw.circle(icon, WHITE, (c, c - 2), 6)  # Skull
+            pygame.draw.circle(icon, DARK_GRAY, (c - 2, c - 3), 2)  # Left eye
+            pygame.draw.circle(icon, DARK_GRAY, (c + 2, c - 3), 2)  # Right eye
+            pygame.draw.line(icon, DARK_GRAY, (c - 2, c + 2), (c + 2, c + 2), 1)  # Teeth
+        icons[player_class] = icon
+    return icons
+
+
+CLASS_ICON_HALF = 12  # Icons are 24x24, centered on the player
+PLAYER_DRAW_MARGIN = 80  # Off-screen distance at which a player (gun, bars, label) is culled
+CLASS_ICONS = build_class_icons()
+
+
 class Player:
     """Player class with class-specific abilities."""
     def __init__(self, x, y, player_id=0, player_class=PlayerClass.RANGER):
@@ -2579,7 +3521,7 @@ class Player:
         self.recoil_offset = 0  # Current recoil affecting accuracy
         self.screen_shake = 0  # Visual feedback for heavy weapons
         self.muzzle_flash_timer = 0  # Muzzle flash effect
-        self.shell_casings = []  # Ejected shell casings
+        self.shell_casings = EntityPool(ShellCasing, 64)  # Ejected shell casings
         self.gun_kick = 0  # Visual gun kickback
         self.reload_anim_angle = 0  # Gun rotation during reload
         self.recoil_angle = 0  # Visual angle kick when shooting
@@ -2591,14 +3533,14 @@ class Player:
         # Abilities
         self.ability_cooldown = 0
         self.walls_built = []
-        self.heal_zones = []
+        self.heal_zones = EntityPool(HealZone, 8)
         self.speed_boost_timer = 0  # For Ranger speed boost
 
         # Currency
         self.coins = 0
 
         # Input state
-        self.keys_pressed = set()
+        self.keys_pressed = NO_KEYS  # This frame's pygame.key.get_pressed(), set by Game
         self.mouse_pos = (0, 0)
         self.mouse_buttons = [False, False, False]
         self.auto_aim = False  # For P2+ who can't use mouse
@@ -2624,73 +3566,15 @@ class Player:
     def setup_class(self, player_class):
         self.player_class = player_class
 
-        if player_class == PlayerClass.BUILDER:
-            self.max_health = 120
-            self.speed = 200
-            # Builder: Nail gun + sidearm + knife
-            self.weapons = [WEAPONS["nail_gun"], WEAPONS["glock"], WEAPONS["knife"]]
-            self.color = ORANGE
-            self.ability_max_cooldown = 3  # Wall building cooldown
-            self.max_walls = 10
-
-        elif player_class == PlayerClass.RANGER:
-            self.max_health = 100
-            self.speed = 220
-            # Ranger: Full weapon arsenal + knife
-            self.weapons = [
-                WEAPONS["rifle"],      # Assault Rifle - Primary
-                WEAPONS["ak47"],       # Heavy Rifle
-                WEAPONS["shotgun"],    # Shotgun
-                WEAPONS["sniper"],     # Sniper Rifle
-                WEAPONS["pistol"],     # Pistol backup
-                WEAPONS["knife"],      # Combat Knife
-            ]
-            self.color = GREEN
-            self.ability_max_cooldown = 15  # Speed boost
-
-        elif player_class == PlayerClass.HEALER:
-            self.max_health = 90
-            self.speed = 210
-            # Healer: SMGs and pistol + knife
-            self.weapons = [
-                WEAPONS["smg"],        # SMG
-                WEAPONS["p90"],        # PDW
-                WEAPONS["tranq_pistol"],
-                WEAPONS["knife"],      # Combat Knife
-            ]
-            self.color = LIGHT_BLUE
-            self.ability_max_cooldown = 12  # Heal zone
-            # Healer items
-            self.bandages = 5  # Heals other players 30 HP, 1 use each
-            self.medkits = 3   # Heals to full, 3 uses total
-
-        elif player_class == PlayerClass.TANK:
-            self.max_health = 180
-            self.speed = 140
-            # Tank: Heavy weapons + Desert Eagle + Knife
-            self.weapons = [
-                WEAPONS["minigun"],         # Minigun
-                WEAPONS["rpg"],             # Rocket Launcher
-                WEAPONS["grenade_launcher"], # Grenade Launcher
-                WEAPONS["spas12"],          # Auto Shotgun
-                WEAPONS["deagle"],          # Desert Eagle backup
-                WEAPONS["knife"],           # Combat Knife
-            ]
-            self.color = RED
-            self.ability_max_cooldown = 20  # Ground slam
-
-        elif player_class == PlayerClass.TRAITOR:
-            self.max_health = 100
-            self.speed = 200
-            # Traitor: Basic weapons, allied with zombies + Knife
-            self.weapons = [
-                WEAPONS["pistol"],     # Basic pistol
-                WEAPONS["smg"],        # SMG
-                WEAPONS["knife"],      # Combat Knife
-            ]
-            self.color = PURPLE
-            self.ability_max_cooldown = 8  # Spawn zombie cooldown
-            self.is_traitor = True
+        stats = CLASS_STATS[player_class]
+        self.max_health = stats["max_health"]
+        self.speed = stats["speed"]
+        self.weapons = [WEAPONS[name] for name in stats["weapons"]]
+        self.color = stats["color"]
+        self.ability_max_cooldown = stats["ability_max_cooldown"]
+        # Class-only fields (max_walls, healer items, traitor flag)
+        for attr, value in stats["extras"].items():
+            setattr(self, attr, value)
 
         self.health = self.max_health
         self.current_weapon_index = 0
@@ -2739,41 +3623,42 @@ class Player:
 
         # Each player has their own keys based on player_id
         # P1 (id=0): WASD/Arrows, P2 (id=1): IJKL, P3 (id=2): TFGH
+        keys = self.keys_pressed
         if self.player_id == 0:
             # Player 1: WASD or Arrow keys
-            if pygame.K_w in self.keys_pressed or pygame.K_UP in self.keys_pressed:
+            if keys[pygame.K_w] or keys[pygame.K_UP]:
                 move_y -= 1
-            if pygame.K_s in self.keys_pressed or pygame.K_DOWN in self.keys_pressed:
+            if keys[pygame.K_s] or keys[pygame.K_DOWN]:
                 move_y += 1
-            if pygame.K_a in self.keys_pressed or pygame.K_LEFT in self.keys_pressed:
+            if keys[pygame.K_a] or keys[pygame.K_LEFT]:
                 move_x -= 1
-            if pygame.K_d in self.keys_pressed or pygame.K_RIGHT in self.keys_pressed:
+            if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
                 move_x += 1
         elif self.player_id == 1:
             # Player 2: IJKL keys
-            if pygame.K_i in self.keys_pressed:
+            if keys[pygame.K_i]:
                 move_y -= 1
-            if pygame.K_k in self.keys_pressed:
+            if keys[pygame.K_k]:
                 move_y += 1
-            if pygame.K_j in self.keys_pressed:
+            if keys[pygame.K_j]:
                 move_x -= 1
-            if pygame.K_l in self.keys_pressed:
+            if keys[pygame.K_l]:
                 move_x += 1
         elif self.player_id == 2:
             # Player 3: TFGH keys
-            if pygame.K_t in self.keys_pressed:
+            if keys[pygame.K_t]:
                 move_y -= 1
-            if pygame.K_g in self.keys_pressed:
+            if keys[pygame.K_g]:
                 move_y += 1
-            if pygame.K_f in self.keys_pressed:
+            if keys[pygame.K_f]:
                 move_x -= 1
-            if pygame.K_h in self.keys_pressed:
+            if keys[pygame.K_h]:
                 move_x += 1
 
-        # Normalize diagonal movement
-        if move_x != 0 and move_y != 0:
-            move_x *= 0.707
-            move_y *= 0.707
+        # Normalize diagonal movement (axis inputs are -1/0/1, so length is 1 or sqrt(2))
+        if move_x and move_y:
+            move_x *= INV_SQRT2
+            move_y *= INV_SQRT2
 
         # Apply speed boost for Ranger
         current_speed = self.speed
@@ -2781,8 +3666,8 @@ class Player:
             current_speed = self.speed * 1.5  # 50% speed boost
             self.speed_boost_timer -= dt
 
-        # Sprint with Shift key (40% faster)
-        if pygame.K_LSHIFT in self.keys_pressed or pygame.K_RSHIFT in self.keys_pressed:
+        # Sprint with Shift key (40% faster) - Player 1's keyboard side only
+        if self.player_id == 0 and (keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]):
             current_speed *= 1.4
 
         self.x += move_x * current_speed * dt
@@ -2802,27 +3687,46 @@ class Player:
         elif self.player_id == 1:
             # Player 2: Manual aim with 8/9 keys (continuous rotation while held)
             aim_speed = 3.0  # Radians per second
-            if pygame.K_8 in self.keys_pressed:
+            if keys[pygame.K_8]:
                 self.angle -= aim_speed * dt  # Rotate left
-            if pygame.K_9 in self.keys_pressed:
+            if keys[pygame.K_9]:
                 self.angle += aim_speed * dt  # Rotate right
         elif self.player_id == 2:
             # Player 3: Auto-aim at nearest zombie
             if self.auto_aim and game_world.zombies:
                 nearest_zombie = None
-                nearest_dist = float('inf')
-                shooting_range = self.current_weapon.range  # Use weapon range
-                for zombie in game_world.zombies:
-                    dist = math.sqrt((zombie.x - self.x)**2 + (zombie.y - self.y)**2)
-                    if dist < nearest_dist:
-                        nearest_dist = dist
-                        nearest_zombie = zombie
+                nearest_dist_sq = float('inf')
+                weapon_range = self.current_weapon.range
+                range_sq = self.current_weapon.range_sq  # Use weapon range
+                px, py = self.x, self.y
+                # Every zombie within range is filed in a cell the range circle
+                # touches, so a hit there is the global nearest. Only worth it
+                # while the circle covers fewer cells than there are zombies;
+                # otherwise, or with nothing in range, scan the whole horde
+                span = (int(2 * weapon_range) >> GRID_SHIFT) + 2
+                if span * span < len(game_world.zombies):
+                    for zombie in game_world.zombie_hash.query_circle(px, py, weapon_range):
+                        if zombie.active:
+                            dx = zombie.x - px
+                            dy = zombie.y - py
+                            dist_sq = dx * dx + dy * dy  # Squared - no sqrt needed to compare
+                            if dist_sq < nearest_dist_sq:
+                                nearest_dist_sq = dist_sq
+                                nearest_zombie = zombie
+                if nearest_dist_sq > range_sq:
+                    for zombie in game_world.zombies:
+                        dx = zombie.x - px
+                        dy = zombie.y - py
+                        dist_sq = dx * dx + dy * dy
+                        if dist_sq < nearest_dist_sq:
+                            nearest_dist_sq = dist_sq
+                            nearest_zombie = zombie
                 if nearest_zombie:
                     dx = nearest_zombie.x - self.x
                     dy = nearest_zombie.y - self.y
                     self.angle = math.atan2(dy, dx)
                     # Only auto-fire if zombie is in shooting range
-                    if nearest_dist <= shooting_range:
+                    if nearest_dist_sq <= range_sq:
                         self.mouse_buttons[0] = True
                     else:
                         self.mouse_buttons[0] = False
@@ -2835,9 +3739,9 @@ class Player:
                     self.mouse_buttons[0] = False
                 # Manual aim with 6/7 keys (continuous rotation while held)
                 aim_speed = 3.0  # Radians per second
-                if pygame.K_6 in self.keys_pressed:
+                if keys[pygame.K_6]:
                     self.angle -= aim_speed * dt  # Rotate left
-                if pygame.K_7 in self.keys_pressed:
+                if keys[pygame.K_7]:
                     self.angle += aim_speed * dt  # Rotate right
 
         # Cooldowns
@@ -2868,14 +3772,7 @@ class Player:
                 self.recoil_angle = 0
 
         # Update shell casings
-        for shell in self.shell_casings[:]:
-            shell['x'] += shell['vx'] * dt
-            shell['y'] += shell['vy'] * dt
-            shell['vy'] += 300 * dt  # Gravity
-            shell['rotation'] += shell['rot_speed'] * dt
-            shell['lifetime'] -= dt
-            if shell['lifetime'] <= 0:
-                self.shell_casings.remove(shell)
+        self.shell_casings.update(dt)
 
         # Reloading with animation
         if self.is_reloading:
@@ -2903,9 +3800,7 @@ class Player:
                 self.shoot(game_world)
 
         # Update heal zones
-        for zone in self.heal_zones[:]:
-            if not zone.update(dt):
-                self.heal_zones.remove(zone)
+        self.heal_zones.update(dt)
 
     def shoot(self, game_world):
         # Dead players can't shoot
@@ -2913,7 +3808,7 @@ class Player:
             return
 
         weapon = self.current_weapon
-        self.fire_cooldown = 1.0 / weapon.fire_rate
+        self.fire_cooldown = weapon.fire_period
 
         # Check if this is a melee weapon (knife)
         if 'knife' in weapon.name.lower() or weapon.bullet_speed == 0:
@@ -2925,9 +3820,12 @@ class Player:
             slash_x = self.x + math.cos(self.angle) * melee_range
             slash_y = self.y + math.sin(self.angle) * melee_range
 
-            for zombie in game_world.zombies[:]:
-                dist = math.sqrt((zombie.x - slash_x)**2 + (zombie.y - slash_y)**2)
-                if dist < 50:  # Hit range
+            for zombie in game_world.zombie_hash.query_circle(slash_x, slash_y, 50):
+                if not zombie.active:
+                    continue
+                dx = zombie.x - slash_x
+                dy = zombie.y - slash_y
+                if dx * dx + dy * dy < 2500:  # Hit range (50 squared)
                     # Calculate knife damage based on zombie type
                     if zombie.zombie_type == "tank":
                         # 3 shots to kill
@@ -2974,14 +3872,8 @@ class Player:
                         game_world.score += 100
 
             # Slash particles (white/silver)
-            for _ in range(8):
-                angle = self.angle + random.uniform(-0.8, 0.8)
-                speed = random.uniform(150, 300)
-                game_world.particles.append(Particle(
-                    slash_x, slash_y, (200, 200, 220),
-                    (math.cos(angle) * speed, math.sin(angle) * speed),
-                    random.uniform(0.1, 0.2), 3
-                ))
+            game_world.particles.burst(slash_x, slash_y, ((200, 200, 220),), 8,
+                                       (150, 300), (0.1, 0.2), (3, 3), self.angle, 0.8)
             return  # Don't shoot bullets for melee
 
         # Regular gun shooting
@@ -2992,7 +3884,7 @@ class Player:
         effective_spread = weapon.spread + self.recoil_offset
 
         # Add recoil from this shot (accumulates with rapid fire)
-        self.recoil_offset = min(self.recoil_offset + weapon.recoil, weapon.spread * 3)
+        self.recoil_offset = min(self.recoil_offset + weapon.recoil, weapon.recoil_cap)
 
         # Gun kick visual effect (gun moves back then returns)
         self.gun_kick = min(weapon.recoil * 4, 20)
@@ -3006,37 +3898,37 @@ class Player:
         # Screen shake for all weapons (scaled by recoil)
         self.screen_shake = min(weapon.recoil * 1.5, 10)
 
-        # Create bullets
-        for _ in range(weapon.bullet_count):
-            spread = math.radians(random.uniform(-effective_spread, effective_spread))
-            bullet_angle = self.angle + spread
-
-            # Bullet starts at gun position
-            gun_dist = self.size + 10
-            bx = self.x + math.cos(self.angle) * gun_dist
-            by = self.y + math.sin(self.angle) * gun_dist
-
-            bullet = Bullet(bx, by, bullet_angle, weapon, self.player_id)
-            game_world.bullets.append(bullet)
+        # Aim direction, shared by the bullets and the shell casing below
+        aim_cos = math.cos(self.angle)
+        aim_sin = math.sin(self.angle)
+
+        # Create bullets; every pellet starts at the same gun position
+        gun_dist = self.size + 10
+        bx = self.x + aim_cos * gun_dist
+        by = self.y + aim_sin * gun_dist
+        spawn_bullet = game_world.bullets.spawn
+        pellets = weapon.bullet_count
+        spread = math.radians(effective_spread)
+        if pellets > 1 and NUMPY_AVAILABLE:
+            # Multi-pellet weapons draw every spread in one generator call
+            angles = (SHOT_RNG.uniform(-spread, spread, pellets) + self.angle).tolist()
+        else:
+            angles = [self.angle + random.uniform(-spread, spread) for _ in range(pellets)]
+        for angle in angles:
+            spawn_bullet(bx, by, angle, weapon, self.player_id)
 
         # Muzzle flash particles (more intense)
         flash_intensity = min(weapon.damage / 30, 3)  # Bigger guns = bigger flash
-        flash_x = self.x + math.cos(self.angle) * (self.size + 15)
-        flash_y = self.y + math.sin(self.angle) * (self.size + 15)
+        flash_cos, flash_sin = fast_cos_sin(self.angle)
+        flash_x = self.x + flash_cos * (self.size + 15)
+        flash_y = self.y + flash_sin * (self.size + 15)
 
         # Add visual effect muzzle flash
         visual_effects.add_muzzle_flash(flash_x, flash_y, self.angle, int(10 + flash_intensity * 5))
 
-        for _ in range(int(5 * flash_intensity)):
-            angle = self.angle + random.uniform(-0.5, 0.5)
-            speed = random.uniform(100, 300) * flash_intensity
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            color = random.choice([YELLOW, ORANGE, (255, 200, 100)])
-            game_world.particles.append(Particle(
-                flash_x, flash_y,
-                color, (vx, vy), random.uniform(0.05, 0.15), random.randint(3, 6)
-            ))
+        game_world.particles.burst(flash_x, flash_y, MUZZLE_COLORS, int(5 * flash_intensity),
+                                   (100 * flash_intensity, 300 * flash_intensity), (0.05, 0.15), (3, 6),
+                                   self.angle, 0.5)
 
         # Play weapon sound
         sound_manager.play_weapon(weapon.name)
@@ -3045,16 +3937,14 @@ class Player:
         if not weapon.explosive:
             shell_angle = self.angle + math.pi/2 + random.uniform(-0.3, 0.3)  # Eject to the side
             shell_speed = random.uniform(80, 150)
-            self.shell_casings.append({
-                'x': self.x + math.cos(self.angle) * self.size,
-                'y': self.y + math.sin(self.angle) * self.size,
-                'vx': math.cos(shell_angle) * shell_speed,
-                'vy': math.sin(shell_angle) * shell_speed + random.uniform(-50, 0),
-                'rotation': random.uniform(0, 360),
-                'rot_speed': random.uniform(-500, 500),
-                'lifetime': 1.0,
-                'size': 4 if 'pistol' in weapon.name.lower() or 'smg' in weapon.name.lower() else 6
-            })
+            shell_cos, shell_sin = fast_cos_sin(shell_angle)
+            self.shell_casings.spawn(
+                self.x + aim_cos * self.size,
+                self.y + aim_sin * self.size,
+                shell_cos * shell_speed,
+                shell_sin * shell_speed + random.uniform(-50, 0),
+                weapon.shell_size
+            )
 
         # Auto-reload when empty
         if self.current_ammo <= 0 and self.reserve_ammo > 0:
@@ -3077,15 +3967,14 @@ class Player:
 
         if self.player_class == PlayerClass.BUILDER:
             # Build wall with rotation
-            if len([w for w in game_world.walls if w.active]) < self.max_walls:
+            if game_world.active_wall_count < self.max_walls:
                 wall_x = self.x + math.cos(self.angle) * 80
                 wall_y = self.y + math.sin(self.angle) * 80
                 # Apply rotation to wall dimensions
-                if self.block_rotation == 0 or self.block_rotation == 180:
-                    wall = Wall(wall_x, wall_y, width=320, height=80)
-                else:  # 90 or 270 degrees - swap width/height
-                    wall = Wall(wall_x, wall_y, width=80, height=320)
+                wall_w, wall_h = WALL_DIMS[self.block_rotation]
+                wall = Wall(wall_x, wall_y, width=wall_w, height=wall_h)
                 game_world.walls.append(wall)
+                game_world.active_wall_count += 1
                 self.walls_built.append(wall)
                 self.ability_cooldown = self.ability_max_cooldown
                 # Hide blueprint preview after placing
@@ -3105,22 +3994,11 @@ class Player:
 
         elif self.player_class == PlayerClass.TANK:
             # Ground slam - damages nearby zombies
-            for zombie in game_world.zombies:
-                dist = math.sqrt((zombie.x - self.x)**2 + (zombie.y - self.y)**2)
-                if dist < 150:
-                    damage = 100 * (1 - dist / 150)
-                    angle = math.atan2(zombie.y - self.y, zombie.x - self.x)
-                    zombie.take_damage(damage, angle)
+            for zombie, damage, direction in game_world.blast_targets(self.x, self.y, 150, 100):
+                zombie.take_damage(damage, knockback_dir=direction)
 
             # Slam particles
-            for _ in range(30):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(200, 400)
-                game_world.particles.append(Particle(
-                    self.x, self.y, ORANGE,
-                    (math.cos(angle) * speed, math.sin(angle) * speed),
-                    random.uniform(0.3, 0.6), 6
-                ))
+            game_world.spawn_burst(self.x, self.y, ORANGE, 30, (200, 400), (0.3, 0.6), 6)
             self.ability_cooldown = self.ability_max_cooldown
 
         elif self.player_class == PlayerClass.TRAITOR:
@@ -3131,14 +4009,7 @@ class Player:
             game_world.zombies.append(zombie)
             self.ability_cooldown = self.ability_max_cooldown
             # Purple particle effect
-            for _ in range(15):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(100, 200)
-                game_world.particles.append(Particle(
-                    spawn_x, spawn_y, PURPLE,
-                    (math.cos(angle) * speed, math.sin(angle) * speed),
-                    random.uniform(0.2, 0.4), 5
-                ))
+            game_world.spawn_burst(spawn_x, spawn_y, PURPLE, 15, (100, 200), (0.2, 0.4), 5)
 
     def rotate_block(self):
         """Rotate block placement direction for Builder."""
@@ -3150,6 +4021,13 @@ class Player:
         draw_x = int(self.x - camera_offset[0])
         draw_y = int(self.y - camera_offset[1])
 
+        # Skip players well outside the view (the wall preview reaches further out)
+        if not self.show_block_preview:
+            margin = PLAYER_DRAW_MARGIN
+            if (draw_x < -margin or draw_x > SCREEN_WIDTH + margin or
+                    draw_y < -margin or draw_y > SCREEN_HEIGHT + margin):
+                return
+
         # Speed boost visual effect (glowing ring)
         if self.speed_boost_timer > 0:
             pygame.draw.circle(screen, YELLOW, (draw_x, draw_y), self.size + 8, 3)
@@ -3159,55 +4037,28 @@ class Player:
         pygame.draw.circle(screen, self.color, (draw_x, draw_y), self.size)
         pygame.draw.circle(screen, WHITE, (draw_x, draw_y), self.size, 2)
 
-        # Class indicator
-        if self.player_class == PlayerClass.BUILDER:
-            # Hammer icon
-            pygame.draw.rect(screen, BROWN, (draw_x - 5, draw_y - 8, 10, 16))
-        elif self.player_class == PlayerClass.RANGER:
-            # Crosshair
-            pygame.draw.line(screen, WHITE, (draw_x - 8, draw_y), (draw_x + 8, draw_y), 2)
-            pygame.draw.line(screen, WHITE, (draw_x, draw_y - 8), (draw_x, draw_y + 8), 2)
-        elif self.player_class == PlayerClass.HEALER:
-            # Cross
-            pygame.draw.rect(screen, WHITE, (draw_x - 8, draw_y - 3, 16, 6))
-            pygame.draw.rect(screen, WHITE, (draw_x - 3, draw_y - 8, 6, 16))
-        elif self.player_class == PlayerClass.TANK:
-            # Explosion symbol
-            pygame.draw.polygon(screen, YELLOW, [
-                (draw_x, draw_y - 10), (draw_x + 5, draw_y - 3),
-                (draw_x + 10, draw_y - 5), (draw_x + 5, draw_y),
-                (draw_x + 8, draw_y + 8), (draw_x, draw_y + 4),
-                (draw_x - 8, draw_y + 8), (draw_x - 5, draw_y),
-                (draw_x - 10, draw_y - 5), (draw_x - 5, draw_y - 3)
-            ])
-        elif self.player_class == PlayerClass.TRAITOR:
-            # Skull icon (traitor)
-            pygame.draw.circle(screen, WHITE, (draw_x, draw_y - 2), 6)  # Skull
-            pygame.draw.circle(screen, DARK_GRAY, (draw_x - 2, draw_y - 3), 2)  # Left eye
-            pygame.draw.circle(screen, DARK_GRAY, (draw_x + 2, draw_y - 3), 2)  # Right eye
-            pygame.draw.line(screen, DARK_GRAY, (draw_x - 2, draw_y + 2), (draw_x + 2, draw_y + 2), 1)  # Teeth
+        # Class indicator (pre-rendered icon)
+        icon = CLASS_ICONS.get(self.player_class)
+        if icon:
+            screen.blit(icon, (draw_x - CLASS_ICON_HALF, draw_y - CLASS_ICON_HALF))
 
         # Builder block preview
         if self.player_class == PlayerClass.BUILDER and self.show_block_preview:
             preview_x = int(self.x + math.cos(self.angle) * 80 - camera_offset[0])
             preview_y = int(self.y + math.sin(self.angle) * 80 - camera_offset[1])
-            if self.block_rotation == 0 or self.block_rotation == 180:
-                preview_w, preview_h = 320, 80
-            else:
-                preview_w, preview_h = 80, 320
+            preview_w, preview_h = WALL_DIMS[self.block_rotation]
             # Blue highlight preview
-            preview_surface = pygame.Surface((preview_w, preview_h), pygame.SRCALPHA)
-            preview_surface.fill((0, 100, 255, 100))  # Semi-transparent blue
-            screen.blit(preview_surface, (preview_x - preview_w//2, preview_y - preview_h//2))
+            screen.blit(WALL_PREVIEWS[self.block_rotation], (preview_x - preview_w//2, preview_y - preview_h//2))
             pygame.draw.rect(screen, BLUE, (preview_x - preview_w//2, preview_y - preview_h//2, preview_w, preview_h), 2)
 
         # Draw shell casings
-        for shell in self.shell_casings:
-            shell_x = int(shell['x'] - camera_offset[0])
-            shell_y = int(shell['y'] - camera_offset[1])
-            # Draw shell as small rectangle
-            shell_color = (180, 140, 60)  # Brass color
-            pygame.draw.circle(screen, shell_color, (shell_x, shell_y), shell['size'] // 2)
+        if self.shell_casings.count:
+            shells = []
+            for shell in self.shell_casings:
+                radius = shell.size // 2
+                shells.append((get_dot_sprite(SHELL_COLOR, radius),
+                               (int(shell.x - camera_offset[0]) - radius, int(shell.y - camera_offset[1]) - radius)))
+            screen.blits(shells, doreturn=False)
 
         # Draw realistic gun based on weapon type
         weapon = self.current_weapon
@@ -3228,179 +4079,23 @@ class Player:
         perp_x = -sin_a
         perp_y = cos_a
 
-        # Gun colors
-        gun_black = (30, 30, 30)
-        gun_dark = (50, 50, 50)
-        gun_gray = (70, 70, 70)
-        gun_brown = (90, 60, 40)  # Wood/grip
-
-        # Determine gun type and draw appropriate shape
-        weapon_name = weapon.name.lower()
-
-        if 'pistol' in weapon_name or 'deagle' in weapon_name:
-            # PISTOL - compact with grip
-            barrel_len = 18 - kick
-            # Barrel
-            barrel_end_x = gun_x + cos_a * barrel_len
-            barrel_end_y = gun_y + sin_a * barrel_len
-            pygame.draw.line(screen, gun_black, (int(gun_x), int(gun_y)), (int(barrel_end_x), int(barrel_end_y)), 6)
-            # Slide (top part)
-            pygame.draw.line(screen, gun_dark, (int(gun_x - cos_a*5), int(gun_y - sin_a*5)), (int(barrel_end_x), int(barrel_end_y)), 8)
-            # Grip (angled down)
-            grip_x = gun_x - cos_a * 3 + perp_x * 8
-            grip_y = gun_y - sin_a * 3 + perp_y * 8
-            pygame.draw.line(screen, gun_brown, (int(gun_x - cos_a*3), int(gun_y - sin_a*3)), (int(grip_x), int(grip_y)), 6)
-
-        elif 'rifle' in weapon_name or 'assault' in weapon_name or 'heavy rifle' in weapon_name:
-            # ASSAULT RIFLE - long barrel, stock, magazine
-            barrel_len = 35 - kick
-            barrel_end_x = gun_x + cos_a * barrel_len
-            barrel_end_y = gun_y + sin_a * barrel_len
-            # Main body
-            pygame.draw.line(screen, gun_black, (int(gun_x - cos_a*10), int(gun_y - sin_a*10)), (int(barrel_end_x), int(barrel_end_y)), 7)
-            # Upper rail
-            pygame.draw.line(screen, gun_gray, (int(gun_x - cos_a*5), int(gun_y - sin_a*5 - perp_y*2)), (int(gun_x + cos_a*15), int(gun_y + sin_a*15 - perp_y*2)), 3)
-            # Magazine
-            mag_x = gun_x + cos_a * 5
-            mag_y = gun_y + sin_a * 5
-            pygame.draw.line(screen, gun_dark, (int(mag_x), int(mag_y)), (int(mag_x + perp_x*12), int(mag_y + perp_y*12)), 5)
-            # Stock
-            stock_x = gun_x - cos_a * 15
-            stock_y = gun_y - sin_a * 15
-            pygame.draw.line(screen, gun_brown, (int(gun_x - cos_a*10), int(gun_y - sin_a*10)), (int(stock_x), int(stock_y)), 6)
-
-        elif 'sniper' in weapon_name or 'marksman' in weapon_name:
-            # SNIPER RIFLE - very long, scope
-            barrel_len = 45 - kick
-            barrel_end_x = gun_x + cos_a * barrel_len
-            barrel_end_y = gun_y + sin_a * barrel_len
-            # Long barrel
-            pygame.draw.line(screen, gun_black, (int(gun_x - cos_a*12), int(gun_y - sin_a*12)), (int(barrel_end_x), int(barrel_end_y)), 5)
-            # Scope
-            scope_x = gun_x + cos_a * 8
-            scope_y = gun_y + sin_a * 8 - perp_y * 5
-            pygame.draw.circle(screen, gun_gray, (int(scope_x), int(scope_y)), 4)
-            pygame.draw.circle(screen, (100, 150, 200), (int(scope_x), int(scope_y)), 2)  # Lens
-            # Stock
-            pygame.draw.line(screen, gun_brown, (int(gun_x - cos_a*12), int(gun_y - sin_a*12)), (int(gun_x - cos_a*22), int(gun_y - sin_a*22)), 7)
-
-        elif 'shotgun' in weapon_name:
-            # SHOTGUN - thick barrel, pump
-            barrel_len = 30 - kick
-            barrel_end_x = gun_x + cos_a * barrel_len
-            barrel_end_y = gun_y + sin_a * barrel_len
-            # Thick barrel
-            pygame.draw.line(screen, gun_black, (int(gun_x), int(gun_y)), (int(barrel_end_x), int(barrel_end_y)), 9)
-            # Pump grip
-            pump_x = gun_x + cos_a * 12
-            pump_y = gun_y + sin_a * 12
-            pygame.draw.line(screen, gun_brown, (int(pump_x - perp_x*4), int(pump_y - perp_y*4)), (int(pump_x + perp_x*6), int(pump_y + perp_y*6)), 6)
-            # Stock
-            pygame.draw.line(screen, gun_brown, (int(gun_x - cos_a*5), int(gun_y - sin_a*5)), (int(gun_x - cos_a*18), int(gun_y - sin_a*18)), 7)
-
-        elif 'smg' in weapon_name or 'pdw' in weapon_name:
-            # SMG - compact, magazine in front
-            barrel_len = 22 - kick
-            barrel_end_x = gun_x + cos_a * barrel_len
-            barrel_end_y = gun_y + sin_a * barrel_len
-            # Body
-            pygame.draw.line(screen, gun_black, (int(gun_x - cos_a*8), int(gun_y - sin_a*8)), (int(barrel_end_x), int(barrel_end_y)), 6)
-            # Magazine (in grip)
-            mag_x = gun_x
-            mag_y = gun_y
-            pygame.draw.line(screen, gun_dark, (int(mag_x), int(mag_y)), (int(mag_x + perp_x*10), int(mag_y + perp_y*10)), 5)
-            # Folding stock
-            pygame.draw.line(screen, gun_gray, (int(gun_x - cos_a*8), int(gun_y - sin_a*8)), (int(gun_x - cos_a*14), int(gun_y - sin_a*14)), 4)
-
-        elif 'minigun' in weapon_name or 'cyclone' in weapon_name:
-            # MINIGUN - multiple barrels, huge
-            barrel_len = 40 - kick
-            barrel_end_x = gun_x + cos_a * barrel_len
-            barrel_end_y = gun_y + sin_a * barrel_len
-            # Multiple barrels
-            for i in range(-2, 3):
-                offset = i * 3
-                pygame.draw.line(screen, gun_black,
-                    (int(gun_x + perp_x*offset), int(gun_y + perp_y*offset)),
-                    (int(barrel_end_x + perp_x*offset), int(barrel_end_y + perp_y*offset)), 3)
-            # Housing
-            pygame.draw.circle(screen, gun_dark, (int(gun_x), int(gun_y)), 10)
-            # Ammo box
-            pygame.draw.rect(screen, gun_gray, (int(gun_x - cos_a*15 - 8), int(gun_y - sin_a*15 - 8), 16, 16))
-
-        elif 'rocket' in weapon_name or 'rpg' in weapon_name:
-            # ROCKET LAUNCHER - tube
-            barrel_len = 38 - kick
-            barrel_end_x = gun_x + cos_a * barrel_len
-            barrel_end_y = gun_y + sin_a * barrel_len
-            # Tube
-            pygame.draw.line(screen, (60, 80, 60), (int(gun_x - cos_a*10), int(gun_y - sin_a*10)), (int(barrel_end_x), int(barrel_end_y)), 12)
-            pygame.draw.line(screen, (80, 100, 80), (int(gun_x - cos_a*10), int(gun_y - sin_a*10)), (int(barrel_end_x), int(barrel_end_y)), 8)
-            # Sight
-            pygame.draw.line(screen, gun_black, (int(gun_x + cos_a*5 - perp_x*8), int(gun_y + sin_a*5 - perp_y*8)), (int(gun_x + cos_a*5 - perp_x*14), int(gun_y + sin_a*5 - perp_y*14)), 3)
-            # Grip
-            pygame.draw.line(screen, gun_brown, (int(gun_x), int(gun_y)), (int(gun_x + perp_x*10), int(gun_y + perp_y*10)), 5)
-
-        elif 'grenade' in weapon_name or 'launcher' in weapon_name:
-            # GRENADE LAUNCHER - drum magazine
-            barrel_len = 28 - kick
-            barrel_end_x = gun_x + cos_a * barrel_len
-            barrel_end_y = gun_y + sin_a * barrel_len
-            # Barrel
-            pygame.draw.line(screen, gun_black, (int(gun_x), int(gun_y)), (int(barrel_end_x), int(barrel_end_y)), 10)
-            # Drum magazine
-            drum_x = gun_x + cos_a * 8 + perp_x * 8
-            drum_y = gun_y + sin_a * 8 + perp_y * 8
-            pygame.draw.circle(screen, gun_dark, (int(drum_x), int(drum_y)), 8)
-            pygame.draw.circle(screen, gun_gray, (int(drum_x), int(drum_y)), 5)
-            # Stock
-            pygame.draw.line(screen, gun_brown, (int(gun_x - cos_a*5), int(gun_y - sin_a*5)), (int(gun_x - cos_a*15), int(gun_y - sin_a*15)), 6)
-
-        elif 'knife' in weapon_name:
-            # COMBAT KNIFE - blade with handle
-            blade_len = 25 - kick
-            blade_end_x = gun_x + cos_a * blade_len
-            blade_end_y = gun_y + sin_a * blade_len
-            # Blade (silver/metallic)
-            blade_color = (180, 180, 190)
-            blade_edge = (140, 140, 150)
-            # Main blade
-            pygame.draw.line(screen, blade_color, (int(gun_x), int(gun_y)), (int(blade_end_x), int(blade_end_y)), 5)
-            # Sharp edge highlight
-            pygame.draw.line(screen, blade_edge,
-                (int(gun_x + perp_x*2), int(gun_y + perp_y*2)),
-                (int(blade_end_x), int(blade_end_y)), 2)
-            # Handle/grip (brown)
-            handle_x = gun_x - cos_a * 12
-            handle_y = gun_y - sin_a * 12
-            pygame.draw.line(screen, gun_brown, (int(gun_x - cos_a*2), int(gun_y - sin_a*2)), (int(handle_x), int(handle_y)), 7)
-            # Guard (cross piece between blade and handle)
-            guard_x = gun_x - cos_a * 2
-            guard_y = gun_y - sin_a * 2
-            pygame.draw.line(screen, gun_dark,
-                (int(guard_x - perp_x*5), int(guard_y - perp_y*5)),
-                (int(guard_x + perp_x*5), int(guard_y + perp_y*5)), 3)
-
+        # Gun shape was picked once per weapon (WeaponStats.draw_style)
+        if kick == 0:
+            # Resting gun - blit the cached sprite for this angle bucket
+            sprite = get_gun_sprite(weapon.draw_style, gun_angle)
+            screen.blit(sprite, (int(gun_x) - GUN_SPRITE_HALF, int(gun_y) - GUN_SPRITE_HALF))
         else:
-            # DEFAULT - simple gun shape
-            barrel_len = 25 - kick
-            barrel_end_x = gun_x + cos_a * barrel_len
-            barrel_end_y = gun_y + sin_a * barrel_len
-            pygame.draw.line(screen, gun_black, (int(gun_x), int(gun_y)), (int(barrel_end_x), int(barrel_end_y)), 6)
-            pygame.draw.line(screen, gun_brown, (int(gun_x), int(gun_y)), (int(gun_x + perp_x*8), int(gun_y + perp_y*8)), 5)
+            # Kicking back after a shot - barrel length changes, draw live
+            GUN_DRAWERS[weapon.draw_style](screen, gun_x, gun_y, cos_a, sin_a, perp_x, perp_y, kick)
 
         # Muzzle flash effect (keep existing)
         gun_end_x = gun_x + cos_a * (30 - kick)
         gun_end_y = gun_y + sin_a * (30 - kick)
         if self.muzzle_flash_timer > 0:
-            flash_size = int(15 + self.current_weapon.damage / 10)
+            flash_size = self.current_weapon.flash_size
             flash_x = int(gun_end_x + math.cos(self.angle) * 5)
             flash_y = int(gun_end_y + math.sin(self.angle) * 5)
-            # Outer flash (orange)
-            pygame.draw.circle(screen, ORANGE, (flash_x, flash_y), flash_size)
-            # Inner flash (yellow/white)
-            pygame.draw.circle(screen, YELLOW, (flash_x, flash_y), flash_size // 2)
-            pygame.draw.circle(screen, WHITE, (flash_x, flash_y), flash_size // 4)
+            screen.blit(get_muzzle_flash_sprite(flash_size), (flash_x - flash_size, flash_y - flash_size))
 
         # Health bar
         bar_width = 50
@@ -3414,8 +4109,8 @@ class Player:
             reload_progress = 1 - (self.reload_timer / self.current_weapon.reload_time)
 
             # Circular progress indicator
-            pygame.draw.arc(screen, YELLOW, (draw_x - 20, draw_y - 20, 40, 40),
-                          -math.pi/2, -math.pi/2 + reload_progress * math.pi * 2, 3)
+            arc_frame = min(max(int(reload_progress * (RELOAD_ARC_STEPS - 1)), 0), RELOAD_ARC_STEPS - 1)
+            screen.blit(RELOAD_ARC_FRAMES[arc_frame], (draw_x - 20, draw_y - 20))
 
             # Magazine animation - magazine drops and new one slides in
             mag_offset_y = 0
@@ -3439,13 +4134,13 @@ class Player:
                 pygame.draw.rect(screen, (80, 80, 80), (mag_x - 4, mag_y - 6, 8, 12))
 
             # "RELOADING" text
-            font = pygame.font.Font(None, 18)
-            reload_text = font.render("RELOADING", True, YELLOW)
-            screen.blit(reload_text, (draw_x - reload_text.get_width()//2, draw_y - self.size - 30))
+            screen.blit(RELOADING_LABEL, (draw_x - RELOADING_LABEL_HALF_WIDTH, draw_y - self.size - 30))
 
         # Player ID
-        font = pygame.font.Font(None, 20)
-        id_text = font.render(f"P{self.player_id + 1}", True, WHITE)
+        id_text = PLAYER_ID_LABELS.get(self.player_id)
+        if id_text is None:
+            id_text = FONT_20.render(f"P{self.player_id + 1}", True, WHITE)
+            PLAYER_ID_LABELS[self.player_id] = id_text
         screen.blit(id_text, (draw_x - 10, draw_y + self.size + 5))
 
 
@@ -3458,12 +4153,14 @@ class Bunker:
         self.height = 150
         self.health = 1000
         self.max_health = 1000
+        # The bunker never moves, so its footprint is built once (don't mutate it)
+        self.rect = pygame.Rect(x - self.width//2, y - self.height//2, self.width, self.height)
 
     def get_rect(self):
-        return pygame.Rect(self.x - self.width//2, self.y - self.height//2, self.width, self.height)
+        return self.rect
 
     def is_player_inside(self, player):
-        return self.get_rect().collidepoint(player.x, player.y)
+        return self.rect.collidepoint(player.x, player.y)
 
     def take_damage(self, damage):
         self.health -= damage
@@ -3474,6 +4171,10 @@ class Bunker:
         rect = self.get_rect()
         draw_rect = rect.move(-camera_offset[0], -camera_offset[1])
 
+        # Skip when off-screen (inflated to include the roof, health bar and label)
+        if not screen.get_rect().colliderect(draw_rect.inflate(120, 100)):
+            return
+
         # Main structure
         pygame.draw.rect(screen, GRAY, draw_rect)
         pygame.draw.rect(screen, DARK_GRAY, draw_rect, 4)
@@ -3501,9 +4202,70 @@ class Bunker:
         pygame.draw.rect(screen, GREEN, (draw_rect.x, draw_rect.y - 20, bar_width * health_ratio, 10))
 
         # Label
-        font = pygame.font.Font(None, 24)
-        text = font.render("BUNKER - Press B to change class", True, WHITE)
-        screen.blit(text, (draw_rect.centerx - text.get_width()//2, draw_rect.y - 40))
+        screen.blit(BUNKER_LABEL, (draw_rect.centerx - BUNKER_LABEL_HALF_WIDTH, draw_rect.y - 40))
+
+
+GROUND_GRID_SIZE = 150  # Spacing of the sand grid lines
+ROCK_SHAPES = ('circle', 'polygon')
+# Dead shrub colors - browns and dark greens
+SHRUB_COLORS = ((100, 80, 50), (90, 70, 40), (80, 90, 50), (70, 60, 30))
+
+
+def build_rock_sprite(rock):
+    """Pre-render a rock; returns the sprite and its top-left offset from the rock center."""
+    if rock['shape'] == 'circle':
+        size = rock['size']
+        sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, rock['color'], (size, size), size)
+        pygame.draw.circle(sprite, rock['edge_color'], (size, size), size, 2)
+        return optimize_surface(sprite), (-size, -size)
+    # Shift the polygon by whole pixels so it rasterizes exactly as it would on screen
+    points = rock['points']
+    left = math.floor(min(px for px, _ in points))
+    top = math.floor(min(py for _, py in points))
+    width = math.ceil(max(px for px, _ in points)) - left + 1
+    height = math.ceil(max(py for _, py in points)) - top + 1
+    sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.polygon(sprite, rock['color'], [(px - left, py - top) for px, py in points])
+    return optimize_surface(sprite), (left, top)
+
+
+def build_shrub_sprite(shrub):
+    """Pre-render a shrub's branches; returns the sprite and its top-left offset from the shrub."""
+    # Branches reach size, sub-branches half that again, plus the line width
+    half = int(shrub['size'] * 1.5) + 3
+    sprite = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    color = shrub['color']
+    for x0, y0, x1, y1, width in shrub['lines']:
+        pygame.draw.line(sprite, color, (half + x0, half + y0), (half + x1, half + y1), width)
+    return optimize_surface(sprite), (-half, -half)
+
+
+def build_crater_sprite(crater):
+    """Pre-render a crater's rings centered in a (2r, 2r) sprite."""
+    radius = crater['radius']
+    sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    center = (radius, radius)
+    # Outer crater ring (darker)
+    pygame.draw.circle(sprite, crater['color'], center, radius)
+    # Inner darker area
+    pygame.draw.circle(sprite, (60, 50, 40), center, int(radius * 0.7))
+    # Scorched edge
+    pygame.draw.circle(sprite, (40, 35, 30), center, radius, 3)
+    return optimize_surface(sprite)
+
+
+def build_ground_surface():
+    """Sand sheet one grid cell larger than the screen, with the grid lines drawn in."""
+    width = SCREEN_WIDTH + GROUND_GRID_SIZE
+    height = SCREEN_HEIGHT + GROUND_GRID_SIZE
+    surface = pygame.Surface((width, height))
+    surface.fill(SAND)
+    for x in range(0, width, GROUND_GRID_SIZE):
+        pygame.draw.line(surface, DARK_SAND, (x, 0), (x, height), 1)
+    for y in range(0, height, GROUND_GRID_SIZE):
+        pygame.draw.line(surface, DARK_SAND, (0, y), (width, y), 1)
+    return optimize_surface(surface)
 
 
 class GameWorld:
@@ -3512,11 +4274,22 @@ class GameWorld:
         self.width = width
         self.height = height
         self.players = []
+        # Zombies stay a plain list rather than an EntityPool: each type sets up its
+        # own attributes in __init__, so a reset() would have to replay all of it,
+        # spawns are a few per second rather than hundreds, and the update loop
+        # already drops dead ones by swap-with-last instead of list.remove()
         self.zombies = []
-        self.bullets = []
+        # Zombie positions as numpy arrays, index-aligned with self.zombies after each update
+        self.zombies_x = np.empty(0, np.float32) if NUMPY_AVAILABLE else None
+        self.zombies_y = np.empty(0, np.float32) if NUMPY_AVAILABLE else None
+        self.zombie_hash = SpatialHash()  # Zombie broad phase, rebuilt each update
+        self.wall_hash = SpatialHash(WALL_GRID_SHIFT)  # Standing walls by center, rebuilt each update
+        self.bullets = EntityPool(Bullet, 1024)
+        self.bullets.prewarm(BULLET_PREWARM, 0, 0, 0, WEAPONS["pistol"], 0)
         self.walls = []
+        self.active_wall_count = 0  # Standing walls, checked against Builder max_walls
         self.heal_zones = []
-        self.particles = []
+        self.particles = ParticleSystem(2048)
         self.pickups = []  # Health, ammo, coins, weapons
         self.weapon_popup_queue = []  # Queue for weapon pickup popups
         self.bunker = Bunker(width // 2, height // 2)
@@ -3532,6 +4305,10 @@ class GameWorld:
         self.zombie_king = None
         self.zombie_king_stage = 1  # Starts at stage 1
         self.zombie_king_defeated_count = 0
+        # Boss spawn flags, reset by start_wave
+        self.mother_spawned_this_wave = False
+        self.king_spawned_this_wave = False
+        self.boss_spawned_this_wave = False
 
         # Scores
         self.kills = 0
@@ -3547,69 +4324,133 @@ class GameWorld:
         self.wrecked_vehicles = []
         self.craters = []
         self.generate_desert_environment()
+        self.ground_surface = build_ground_surface()
+        self.ground_area = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    def sample_positions(self, count, margin, safe_radius):
+        """Random integer map positions at least margin from the edges and outside
+        safe_radius around the bunker (map center)."""
+        cx, cy = self.width // 2, self.height // 2
+        safe_sq = safe_radius * safe_radius
+        positions = []
+        if NUMPY_AVAILABLE:
+            # Over-sample one batch and keep the points outside the safe zone
+            xs = np.random.randint(margin, self.width - margin + 1, count * 2)
+            ys = np.random.randint(margin, self.height - margin + 1, count * 2)
+            keep = (xs - cx) ** 2 + (ys - cy) ** 2 > safe_sq
+            positions = list(zip(xs[keep][:count].tolist(), ys[keep][:count].tolist()))
+        # Pure Python path (or top-up if the batch came up short)
+        while len(positions) < count:
+            x = random.randint(margin, self.width - margin)
+            y = random.randint(margin, self.height - margin)
+            dx = x - cx
+            dy = y - cy
+            if dx * dx + dy * dy > safe_sq:
+                positions.append((x, y))
+        return positions
 
     def generate_desert_environment(self):
         """Generate rocks and dead shrubs for desert background."""
         # Generate rocks (avoid center bunker area)
         bunker_safe_zone = 400  # Don't spawn rocks near bunker
-        for _ in range(80):  # 80 rocks scattered around
-            while True:
-                x = random.randint(50, self.width - 50)
-                y = random.randint(50, self.height - 50)
-                # Check not too close to bunker
-                dist_to_bunker = math.sqrt((x - self.width//2)**2 + (y - self.height//2)**2)
-                if dist_to_bunker > bunker_safe_zone:
-                    break
+        for x, y in self.sample_positions(80, 50, bunker_safe_zone):  # 80 rocks scattered around
             size = random.randint(20, 60)
             color_var = random.randint(-20, 20)
             rock_color = (120 + color_var, 110 + color_var, 100 + color_var)
-            self.rocks.append({
+            rock = {
                 'x': x, 'y': y, 'size': size, 'color': rock_color,
-                'shape': random.choice(['circle', 'polygon'])
-            })
+                'edge_color': (rock_color[0] - 20, rock_color[1] - 20, rock_color[2] - 20),
+                'shape': random.choice(ROCK_SHAPES)
+            }
+            if rock['shape'] == 'polygon':
+                # Jittered pentagon, relative to the rock center
+                points = []
+                for i in range(5):
+                    angle = i * (math.tau / 5) + random.random() * 0.3
+                    dist = size * (0.7 + random.random() * 0.3)
+                    points.append((math.cos(angle) * dist, math.sin(angle) * dist))
+                rock['points'] = points
+            rock['sprite'], rock['sprite_offset'] = build_rock_sprite(rock)
+            self.rocks.append(rock)
 
         # Generate dead shrubs
-        for _ in range(60):  # 60 shrubs
-            while True:
-                x = random.randint(50, self.width - 50)
-                y = random.randint(50, self.height - 50)
-                dist_to_bunker = math.sqrt((x - self.width//2)**2 + (y - self.height//2)**2)
-                if dist_to_bunker > bunker_safe_zone:
-                    break
+        for x, y in self.sample_positions(60, 50, bunker_safe_zone):  # 60 shrubs
             size = random.randint(15, 40)
-            # Dead shrub colors - browns and dark greens
-            shrub_color = random.choice([
-                (100, 80, 50), (90, 70, 40), (80, 90, 50), (70, 60, 30)
-            ])
-            self.shrubs.append({
+            shrub_color = random.choice(SHRUB_COLORS)
+            # Branch and sub-branch segments relative to the shrub center
+            branches = random.randint(3, 6)
+            lines = []
+            for i in range(branches):
+                angle = (i / branches) * math.tau + random.random() * 0.5
+                length = size * (0.6 + random.random() * 0.4)
+                end_x = math.cos(angle) * length
+                end_y = math.sin(angle) * length
+                lines.append((0, 0, end_x, end_y, 2))
+                if random.random() > 0.5:
+                    sub_angle = angle + random.uniform(-0.5, 0.5)
+                    sub_length = length * 0.5
+                    lines.append((end_x, end_y,
+                                  end_x + math.cos(sub_angle) * sub_length,
+                                  end_y + math.sin(sub_angle) * sub_length, 1))
+            shrub = {
                 'x': x, 'y': y, 'size': size, 'color': shrub_color,
-                'branches': random.randint(3, 6)
-            })
+                'branches': branches, 'lines': lines
+            }
+            shrub['sprite'], shrub['sprite_offset'] = build_shrub_sprite(shrub)
+            self.shrubs.append(shrub)
 
         # Generate bomb craters
-        for _ in range(20):
-            while True:
-                x = random.randint(100, self.width - 100)
-                y = random.randint(100, self.height - 100)
-                dist = math.sqrt((x - self.width//2)**2 + (y - self.height//2)**2)
-                if dist > 400:
-                    break
-            self.craters.append({
+        for x, y in self.sample_positions(20, 100, 400):
+            crater = {
                 'x': x, 'y': y,
                 'radius': random.randint(30, 80),
                 'color': (90, 80, 60)
-            })
+            }
+            crater['sprite'] = build_crater_sprite(crater)
+            self.craters.append(crater)
+
+        # Bin decorations by coarse cell so draw only visits the ones near the camera
+        self.rock_grid = self.bin_by_cell(self.rocks)
+        self.shrub_grid = self.bin_by_cell(self.shrubs)
+        self.crater_grid = self.bin_by_cell(self.craters)
+
+    def bin_by_cell(self, items):
+        """Group decoration dicts by the DECOR_CELL_SHIFT cell holding their center."""
+        grid = {}
+        for item in items:
+            grid.setdefault((item['x'] >> DECOR_CELL_SHIFT, item['y'] >> DECOR_CELL_SHIFT), []).append(item)
+        return grid
+
+    def visible_decor(self, grid, camera_offset, margin):
+        """Yield decorations from cells overlapping the view expanded by margin."""
+        x0 = int(camera_offset[0] - margin) >> DECOR_CELL_SHIFT
+        x1 = int(camera_offset[0] + SCREEN_WIDTH + margin) >> DECOR_CELL_SHIFT
+        y0 = int(camera_offset[1] - margin) >> DECOR_CELL_SHIFT
+        y1 = int(camera_offset[1] + SCREEN_HEIGHT + margin) >> DECOR_CELL_SHIFT
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                items = grid.get((cx, cy))
+                if items:
+                    yield from items
 
     def start_wave(self, wave_num):
         self.current_wave = wave_num
         self.zombies_to_spawn = 10 + wave_num * 5
         self.wave_active = True
         self.spawn_timer = 0
+        # Each boss can spawn once per wave
+        self.mother_spawned_this_wave = False
+        self.king_spawned_this_wave = False
+        self.boss_spawned_this_wave = False
         # Restore bunker health to full at start of each wave
         self.bunker.health = self.bunker.max_health
         # Play wave start sound
         sound_manager.play('wave_start')
 
+    def spawn_burst(self, x, y, color, count, speed_range, life_range, size):
+        """Spawn count particles flying out in random directions from (x, y)."""
+        self.particles.burst(x, y, (color,), count, speed_range, life_range, (size, size))
+
     def spawn_pickup(self, x, y, zombie_type="normal"):
         """Spawn pickups when zombie dies. Drop rates vary by zombie type."""
         # Base drop chance
@@ -3701,23 +4542,15 @@ class GameWorld:
 
         # Horde Mother boss every 8 waves (wave 8, 16, 24, etc.)
         if self.current_wave >= 8 and self.current_wave % 8 == 0:
-            if not hasattr(self, 'mother_spawned_this_wave'):
-                self.mother_spawned_this_wave = False
-
             if not self.mother_spawned_this_wave:
                 zombie_type = "horde_mother"
                 self.mother_spawned_this_wave = True
                 zombie = Zombie(x, y, zombie_type, self.current_wave)
                 self.zombies.append(zombie)
                 return
-        else:
-            self.mother_spawned_this_wave = False
 
         # Zombie King spawns every 7 waves (wave 7, 14, 21, etc.)
         if self.current_wave >= 7 and self.current_wave % 7 == 0:
-            if not hasattr(self, 'king_spawned_this_wave'):
-                self.king_spawned_this_wave = False
-
             if not self.king_spawned_this_wave and self.zombie_king is None:
                 # Spawn Zombie King at current stage
                 zombie_type = "zombie_king"
@@ -3726,26 +4559,55 @@ class GameWorld:
                 self.zombie_king = zombie
                 self.zombies.append(zombie)
                 return
-        else:
-            self.king_spawned_this_wave = False
 
         # Cage Walker boss every 5 waves (wave 5, 10, 15, etc.)
         if self.current_wave >= 5 and self.current_wave % 5 == 0:
-            if not hasattr(self, 'boss_spawned_this_wave'):
-                self.boss_spawned_this_wave = False
-
             if not self.boss_spawned_this_wave:
                 zombie_type = "cage_walker"
                 self.boss_spawned_this_wave = True
             else:
                 zombie_type = random.choices(zombie_types, weights)[0]
         else:
-            self.boss_spawned_this_wave = False
             zombie_type = random.choices(zombie_types, weights)[0]
 
         zombie = Zombie(x, y, zombie_type, self.current_wave)
         self.zombies.append(zombie)
 
+    def blast_targets(self, x, y, radius, damage):
+        """Active zombies within radius of (x, y) as (zombie, damage, knockback_dir).
+
+        Damage falls off linearly to nothing at the edge; the knockback
+        direction is the unit vector pointing away from the centre.
+        """
+        zombies = self.zombies
+        radius_sq = radius * radius
+        inv_radius = 1.0 / radius  # Falloff is a multiply per zombie, not a divide
+        if NUMPY_AVAILABLE and len(self.zombies_x) == len(zombies):
+            # One squared-distance sweep over the SoA positions; the square
+            # root (for falloff and direction) is only taken inside the blast
+            dx = self.zombies_x - x
+            dy = self.zombies_y - y
+            dist_sq = dx * dx + dy * dy
+            hit = np.flatnonzero(dist_sq < radius_sq)
+            dist = np.sqrt(dist_sq[hit])
+            damages = (damage * (1 - dist * inv_radius)).tolist()
+            inv_dist = 1.0 / np.maximum(dist, 1e-6)
+            dirs = zip((dx[hit] * inv_dist).tolist(), (dy[hit] * inv_dist).tolist())
+            return [(zombies[i], d, direction) for i, d, direction in zip(hit.tolist(), damages, dirs)
+                    if zombies[i].active]
+        targets = []
+        for zombie in self.zombie_hash.query_circle(x, y, radius):
+            if not zombie.active:
+                continue
+            dx = zombie.x - x
+            dy = zombie.y - y
+            dist_sq = dx * dx + dy * dy
+            if dist_sq < radius_sq:
+                dist = math.sqrt(dist_sq)
+                inv_dist = 1.0 / max(dist, 1e-6)
+                targets.append((zombie, damage * (1 - dist * inv_radius), (dx * inv_dist, dy * inv_dist)))
+        return targets
+
     def update(self, dt):
         # Update wave spawning
         if self.wave_active:
@@ -3764,9 +4626,24 @@ class GameWorld:
             if self.wave_cooldown <= 0:
                 self.start_wave(self.current_wave + 1)
 
-        # Update zombies
-        for zombie in self.zombies[:]:
-            if not zombie.update(dt, self.players, self.walls, self.bunker, self.zombies):
+        # Bin standing walls so each zombie only checks the ones near it
+        wall_hash = self.wall_hash
+        wall_hash.clear()
+        for wall in self.walls:
+            if wall.active:
+                wall_hash.insert(wall, wall.x, wall.y, 0)
+
+        # Update zombies. A dead zombie's slot is refilled from the back in O(1)
+        # instead of list.remove: [0, i) is done, [i, end) still to update and
+        # [end, len) holds zombies spawned this frame, which wait until next frame
+        zombies = self.zombies
+        i = 0
+        end = len(zombies)
+        while i < end:
+            zombie = zombies[i]
+            if zombie.update(dt, self.players, wall_hash, self.bunker, zombies):
+                i += 1
+            else:
                 # Check if this was the Zombie King
                 if zombie.zombie_type == "zombie_king":
                     self.zombie_king = None
@@ -3779,58 +4656,82 @@ class GameWorld:
                         # Increase stage for next spawn
                         self.zombie_king_stage += 1
 
-                self.zombies.remove(zombie)
+                end -= 1
+                zombies[i] = zombies[end]
+                zombies[end] = zombies[-1]
+                zombies.pop()
 
-        # Update bullets
-        for bullet in self.bullets[:]:
+        # Spatial hash for bullet collisions: each zombie is filed under every cell
+        # its hit circle touches, so a bullet only has to check its own cell
+        zombie_hash = self.zombie_hash
+        zombie_hash.clear()
+        for zombie in self.zombies:
+            zombie_hash.insert(zombie, zombie.x, zombie.y, zombie.size + 5)
+
+        # Refresh SoA zombie positions for vectorized area queries (tank slam)
+        if NUMPY_AVAILABLE:
+            zombie_count = len(self.zombies)
+            self.zombies_x = np.fromiter((z.x for z in self.zombies), np.float32, zombie_count)
+            self.zombies_y = np.fromiter((z.y for z in self.zombies), np.float32, zombie_count)
+
+        # Update bullets (backwards so swap-with-last removal is safe)
+        bullets = self.bullets
+        bullet_items = bullets.items
+        max_x = self.width + BULLET_MAP_MARGIN
+        max_y = self.height + BULLET_MAP_MARGIN
+        # Probe the hash's cells directly: most bullets are in flight over
+        # empty ground, and an inline dict miss is the cheapest way to say so
+        zombie_cells = zombie_hash.cells
+        shift = zombie_hash.shift
+        for i in range(bullets.count - 1, -1, -1):
+            bullet = bullet_items[i]
             if not bullet.update(dt):
-                self.bullets.remove(bullet)
+                bullets.kill(i)
+                continue
+            # Bullets that left the map can't hit anything - drop them before collision work
+            bx, by = bullet.x, bullet.y
+            if bx < -BULLET_MAP_MARGIN or bx > max_x or by < -BULLET_MAP_MARGIN or by > max_y:
+                bullets.kill(i)
                 continue
 
-            # Track which zombies this bullet already hit (for penetration)
-            if not hasattr(bullet, 'hit_zombies'):
-                bullet.hit_zombies = set()
-
-            # Check zombie collisions
-            for zombie in self.zombies[:]:
-                # Skip if already hit this zombie
-                if id(zombie) in bullet.hit_zombies:
+            # Check zombie collisions (only zombies sharing the bullet's grid cell)
+            cell = zombie_cells.get((int(bx) >> shift, int(by) >> shift))
+            if not cell:
+                continue
+            hit_zombies = bullet.hit_zombies
+            for zombie in cell:
+                # Skip zombies this bullet already hit, and ones killed earlier this
+                # frame (they stay in the hash until the next rebuild)
+                if not zombie.active or zombie in hit_zombies:
                     continue
 
-                dist = math.sqrt((bullet.x - zombie.x)**2 + (bullet.y - zombie.y)**2)
-                if dist < zombie.size + 5:
+                dx = bx - zombie.x
+                dy = by - zombie.y
+                hit_radius = zombie.size + 5
+                if dx * dx + dy * dy < hit_radius * hit_radius:
                     angle = math.atan2(bullet.vy, bullet.vx)
 
                     if bullet.explosive:
                         # Explosion damage - hits all nearby zombies
-                        for z in self.zombies:
-                            exp_dist = math.sqrt((bullet.x - z.x)**2 + (bullet.y - z.y)**2)
-                            if exp_dist < bullet.explosion_radius:
-                                exp_damage = bullet.damage * (1 - exp_dist / bullet.explosion_radius)
-                                exp_angle = math.atan2(z.y - bullet.y, z.x - bullet.x)
-                                if z.take_damage(exp_damage, exp_angle):
-                                    self.kills += 1
-                                    self.score += 100
-                                    sound_manager.play('zombie_death')
-                                    self.spawn_pickup(z.x, z.y, z.zombie_type)
+                        for z, exp_damage, direction in self.blast_targets(
+                                bx, by, bullet.explosion_radius, bullet.damage):
+                            # An earlier victim of this blast can't be hit again
+                            if z.active and z.take_damage(exp_damage, knockback_dir=direction):
+                                self.kills += 1
+                                self.score += 100
+                                sound_manager.play('zombie_death')
+                                self.spawn_pickup(z.x, z.y, z.zombie_type)
 
                         # Explosion sound
                         sound_manager.play('explosion')
 
                         # Explosion particles
-                        for _ in range(20):
-                            p_angle = random.uniform(0, math.pi * 2)
-                            p_speed = random.uniform(100, 300)
-                            self.particles.append(Particle(
-                                bullet.x, bullet.y, random.choice([ORANGE, RED, YELLOW]),
-                                (math.cos(p_angle) * p_speed, math.sin(p_angle) * p_speed),
-                                random.uniform(0.3, 0.6), 8
-                            ))
+                        self.particles.burst(bullet.x, bullet.y, EXPLOSION_COLORS, 20,
+                                             (100, 300), (0.3, 0.6), (8, 8))
 
                         # Explosives always stop on impact
                         bullet.active = False
-                        if bullet in self.bullets:
-                            self.bullets.remove(bullet)
+                        bullets.kill(i)
                         break
                     else:
                         # Regular bullet with penetration
@@ -3843,150 +4744,143 @@ class GameWorld:
                             sound_manager.play('zombie_hit')
 
                         # Blood particles
-                        for _ in range(5):
-                            p_angle = angle + random.uniform(-0.5, 0.5)
-                            p_speed = random.uniform(50, 150)
-                            self.particles.append(Particle(
-                                bullet.x, bullet.y, DARK_RED,
-                                (math.cos(p_angle) * p_speed, math.sin(p_angle) * p_speed),
-                                random.uniform(0.2, 0.4), 4
-                            ))
-
-                        # Mark this zombie as hit
-                        bullet.hit_zombies.add(id(zombie))
+                        self.particles.burst(bullet.x, bullet.y, (DARK_RED,), 5,
+                                             (50, 150), (0.2, 0.4), (4, 4), angle, 0.5)
 
                         # Check if bullet can continue (penetration)
                         if not bullet.hit_target():
                             # Bullet exhausted penetration
                             bullet.active = False
-                            if bullet in self.bullets:
-                                self.bullets.remove(bullet)
+                            bullets.kill(i)
                             break
 
-            # Bullets pass through builder walls (removed wall collision)
+                        # Only a bullet that flies on needs to remember the zombie
+                        hit_zombies.append(zombie)
 
-        # Update walls
-        for wall in self.walls[:]:
-            if not wall.active:
-                self.walls.remove(wall)
+            # Bullets pass through builder walls (removed wall collision)
 
-        # Update heal zones
-        for zone in self.heal_zones[:]:
-            if not zone.update(dt):
-                self.heal_zones.remove(zone)
-            else:
-                # Heal players in zone
-                for player in self.players:
-                    dist = math.sqrt((player.x - zone.x)**2 + (player.y - zone.y)**2)
-                    if dist < zone.radius:
-                        player.heal(zone.heal_rate * dt)
+        # Drop destroyed walls in one compacting pass
+        walls = self.walls
+        standing = [wall for wall in walls if wall.active]
+        if len(standing) != len(walls):
+            self.active_wall_count -= len(walls) - len(standing)
+            walls[:] = standing
+
+        # Update heal zones, sliding live ones down over expired ones in the
+        # same pass and truncating the tail once - no per-frame list copy
+        heal_zones = self.heal_zones
+        write = 0
+        players = self.players
+        for zone in heal_zones:
+            if zone.update(dt):
+                # Heal players in zone; the zone's numbers are read once, not per player
+                zx, zy = zone.x, zone.y
+                radius_sq = zone.radius_sq
+                heal_amount = zone.heal_rate * dt
+                for player in players:
+                    dx = player.x - zx
+                    dy = player.y - zy
+                    if dx * dx + dy * dy < radius_sq:
+                        player.heal(heal_amount)
+            if zone.active:
+                heal_zones[write] = zone
+                write += 1
+        del heal_zones[write:]
 
         # Update particles
-        for particle in self.particles[:]:
-            if not particle.update(dt):
-                self.particles.remove(particle)
+        self.particles.update(dt)
 
-        # Update pickups and check collection
-        for pickup in self.pickups[:]:
+        # Update pickups and check collection (backwards, so a used pickup is
+        # swapped with the last entry and popped in O(1))
+        pickups = self.pickups
+        for i in range(len(pickups) - 1, -1, -1):
+            pickup = pickups[i]
             if not pickup.update(dt):
-                self.pickups.remove(pickup)
+                pickups[i] = pickups[-1]
+                pickups.pop()
                 continue
             # Check if any player can collect
+            px, py = pickup.x, pickup.y
             for player in self.players:
                 if player.health > 0:
-                    dist = math.sqrt((player.x - pickup.x)**2 + (player.y - pickup.y)**2)
-                    if dist < player.size + pickup.size:
+                    dx = player.x - px
+                    dy = player.y - py
+                    reach = player.size + pickup.size
+                    if dx * dx + dy * dy < reach * reach:
                         result = pickup.collect(player)
                         if result:
                             pickup.active = False
-                            self.pickups.remove(pickup)
+                            pickups[i] = pickups[-1]
+                            pickups.pop()
                             # Check if it's a weapon pickup (returns tuple)
                             if isinstance(result, tuple):
                                 weapon, is_new = result
                                 self.weapon_popup_queue.append((weapon, is_new))
                             # Sparkle effect
-                            for _ in range(8):
-                                p_angle = random.uniform(0, math.pi * 2)
-                                p_speed = random.uniform(50, 150)
-                                self.particles.append(Particle(
-                                    pickup.x, pickup.y, pickup.color,
-                                    (math.cos(p_angle) * p_speed, math.sin(p_angle) * p_speed),
-                                    random.uniform(0.2, 0.4), 4
-                                ))
+                            self.spawn_burst(pickup.x, pickup.y, pickup.color, 8, (50, 150), (0.2, 0.4), 4)
                             break
 
-        # Update players
+        # Update players - kept serial on purpose: player updates are pure Python
+        # (GIL-bound, no speedup from threads) and the web build has no threads
         for player in self.players:
             player.update(dt, self)
 
     def draw(self, screen, camera_offset):
-        # Desert background
-        screen.fill(SAND)
-
-        # Draw subtle grid lines (sand dune patterns)
-        grid_size = 150
-        start_x = int(camera_offset[0] // grid_size) * grid_size
-        start_y = int(camera_offset[1] // grid_size) * grid_size
-        for x in range(start_x, int(camera_offset[0] + SCREEN_WIDTH + grid_size), grid_size):
-            pygame.draw.line(screen, DARK_SAND,
-                           (x - camera_offset[0], 0), (x - camera_offset[0], SCREEN_HEIGHT), 1)
-        for y in range(start_y, int(camera_offset[1] + SCREEN_HEIGHT + grid_size), grid_size):
-            pygame.draw.line(screen, DARK_SAND,
-                           (0, y - camera_offset[1]), (SCREEN_WIDTH, y - camera_offset[1]), 1)
-
-        # Draw rocks
-        for rock in self.rocks:
-            rx = int(rock['x'] - camera_offset[0])
-            ry = int(rock['y'] - camera_offset[1])
+        # Desert background with subtle grid lines (sand dune patterns): the grid
+        # repeats every GROUND_GRID_SIZE, so the screen-sized window of one pre-drawn
+        # sheet at the camera's phase within a cell is copied in
+        self.ground_area.topleft = (int(camera_offset[0]) % GROUND_GRID_SIZE,
+                                    int(camera_offset[1]) % GROUND_GRID_SIZE)
+        screen.blit(self.ground_surface, (0, 0), self.ground_area)
+
+        # Rocks, shrubs and craters are pre-rendered sprites: each layer is
+        # gathered as (sprite, screen position) pairs and handed to one blits() call
+        view_x, view_y = camera_offset
+
+        # Draw rocks (only cells near the screen)
+        sprites = []
+        add_sprite = sprites.append
+        for rock in self.visible_decor(self.rock_grid, camera_offset, 100):
+            rx = int(rock['x'] - view_x)
+            ry = int(rock['y'] - view_y)
             # Only draw if on screen
             if -100 < rx < SCREEN_WIDTH + 100 and -100 < ry < SCREEN_HEIGHT + 100:
-                if rock['shape'] == 'circle':
-                    pygame.draw.circle(screen, rock['color'], (rx, ry), rock['size'])
-                    pygame.draw.circle(screen, (rock['color'][0]-20, rock['color'][1]-20, rock['color'][2]-20), (rx, ry), rock['size'], 2)
-                else:
-                    # Polygon rock
-                    points = []
-                    for i in range(5):
-                        angle = i * (math.pi * 2 / 5) + random.random() * 0.3
-                        dist = rock['size'] * (0.7 + random.random() * 0.3)
-                        points.append((rx + math.cos(angle) * dist, ry + math.sin(angle) * dist))
-                    pygame.draw.polygon(screen, rock['color'], points)
+                # Circle or polygon, pre-rendered at generation
+                ox, oy = rock['sprite_offset']
+                add_sprite((rock['sprite'], (rx + ox, ry + oy)))
+        screen.blits(sprites, doreturn=False)
 
         # Draw dead shrubs
-        for shrub in self.shrubs:
-            sx = int(shrub['x'] - camera_offset[0])
-            sy = int(shrub['y'] - camera_offset[1])
+        sprites = []
+        add_sprite = sprites.append
+        for shrub in self.visible_decor(self.shrub_grid, camera_offset, 50):
+            sx = int(shrub['x'] - view_x)
+            sy = int(shrub['y'] - view_y)
             if -50 < sx < SCREEN_WIDTH + 50 and -50 < sy < SCREEN_HEIGHT + 50:
-                # Draw branches
-                for i in range(shrub['branches']):
-                    angle = (i / shrub['branches']) * math.pi * 2 + random.random() * 0.5
-                    length = shrub['size'] * (0.6 + random.random() * 0.4)
-                    end_x = sx + math.cos(angle) * length
-                    end_y = sy + math.sin(angle) * length
-                    pygame.draw.line(screen, shrub['color'], (sx, sy), (int(end_x), int(end_y)), 2)
-                    # Sub-branches
-                    if random.random() > 0.5:
-                        sub_angle = angle + random.uniform(-0.5, 0.5)
-                        sub_length = length * 0.5
-                        pygame.draw.line(screen, shrub['color'],
-                                       (int(end_x), int(end_y)),
-                                       (int(end_x + math.cos(sub_angle) * sub_length),
-                                        int(end_y + math.sin(sub_angle) * sub_length)), 1)
+                # Branches and sub-branches, pre-rendered at generation
+                ox, oy = shrub['sprite_offset']
+                add_sprite((shrub['sprite'], (sx + ox, sy + oy)))
+        screen.blits(sprites, doreturn=False)
 
         # Draw bomb craters
-        for crater in self.craters:
-            cx = int(crater['x'] - camera_offset[0])
-            cy = int(crater['y'] - camera_offset[1])
+        sprites = []
+        add_sprite = sprites.append
+        for crater in self.visible_decor(self.crater_grid, camera_offset, 100):
+            cx = int(crater['x'] - view_x)
+            cy = int(crater['y'] - view_y)
             if -100 < cx < SCREEN_WIDTH + 100 and -100 < cy < SCREEN_HEIGHT + 100:
-                # Outer crater ring (darker)
-                pygame.draw.circle(screen, crater['color'], (cx, cy), crater['radius'])
-                # Inner darker area
-                pygame.draw.circle(screen, (60, 50, 40), (cx, cy), int(crater['radius'] * 0.7))
-                # Scorched edge
-                pygame.draw.circle(screen, (40, 35, 30), (cx, cy), crater['radius'], 3)
-
-        # World boundary
-        pygame.draw.rect(screen, RED, (-camera_offset[0], -camera_offset[1], self.width, self.height), 5)
+                radius = crater['radius']
+                add_sprite((crater['sprite'], (cx - radius, cy - radius)))
+        screen.blits(sprites, doreturn=False)
+
+        # World boundary (skipped when the 5px border lies entirely off screen)
+        left = -camera_offset[0]
+        top = -camera_offset[1]
+        right = left + self.width
+        bottom = top + self.height
+        if (left < SCREEN_WIDTH and top < SCREEN_HEIGHT and right > 0 and bottom > 0 and
+                not (left <= -5 and top <= -5 and right >= SCREEN_WIDTH + 5 and bottom >= SCREEN_HEIGHT + 5)):
+            pygame.draw.rect(screen, RED, (left, top, self.width, self.height), 5)
 
         # Apply screen shake offset to camera
         shake_offset = (
@@ -3997,47 +4891,126 @@ class GameWorld:
         # Draw ground effects (debris, blood splatters) - uses shaken camera
         visual_effects.draw_ground_effects(screen, shake_offset)
 
+        # Everything below is culled against the screen before its draw call
+        cam_x, cam_y = shake_offset
+        right = cam_x + SCREEN_WIDTH
+        bottom = cam_y + SCREEN_HEIGHT
+
         # Draw heal zones
         for zone in self.heal_zones:
-            zone.draw(screen, shake_offset)
+            radius = zone.radius
+            if cam_x - radius < zone.x < right + radius and cam_y - radius < zone.y < bottom + radius:
+                zone.draw(screen, shake_offset)
 
-        # Draw walls
+        # Draw walls (their health bar sits 8px above the top edge)
         for wall in self.walls:
-            wall.draw(screen, shake_offset)
+            half_w = wall.width // 2
+            half_h = wall.height // 2 + 8
+            if cam_x - half_w < wall.x < right + half_w and cam_y - half_h < wall.y < bottom + half_h:
+                wall.draw(screen, shake_offset)
 
         # Draw bunker
         self.bunker.draw(screen, shake_offset)
 
-        # Draw pickups
+        # Draw pickups (Pickup.draw keeps its own 50px test; the 5px bob is
+        # added here so the outer test never drops one that would show)
         for pickup in self.pickups:
-            pickup.draw(screen, shake_offset)
+            if cam_x - 55 < pickup.x < right + 55 and cam_y - 55 < pickup.y < bottom + 55:
+                pickup.draw(screen, shake_offset)
 
-        # Draw shadows under zombies and players
+        visible_zombies = []
         for zombie in self.zombies:
-            visual_effects.draw_shadow(screen, zombie.x, zombie.y, zombie.size, shake_offset)
-        for player in self.players:
-            visual_effects.draw_shadow(screen, player.x, player.y, player.size, shake_offset)
+            reach = zombie.size * 2 + ZOMBIE_DRAW_MARGIN
+            if cam_x - reach < zombie.x < right + reach and cam_y - reach < zombie.y < bottom + reach:
+                visible_zombies.append(zombie)
+
+        # Draw shadows under zombies and players
+        visual_effects.draw_shadows(screen, visible_zombies, shake_offset)
+        visual_effects.draw_shadows(screen, self.players, shake_offset)
 
         # Draw zombies
-        for zombie in self.zombies:
+        for zombie in visible_zombies:
             zombie.draw(screen, shake_offset)
 
         # Draw players
         for player in self.players:
             player.draw(screen, shake_offset)
 
-        # Draw bullets
+        # Bullets: trails are lines drawn under one screen lock, heads are
+        # cached dots batched into one blits() call on top
+        heads = []
+        add_head = heads.append
+        draw_line = pygame.draw.line
+        screen.lock()
         for bullet in self.bullets:
-            bullet.draw(screen, shake_offset)
+            draw_x = int(bullet.x - cam_x)
+            draw_y = int(bullet.y - cam_y)
+            # Skip bullets whose trail (speed * trail_length long) and head
+            # both lie off screen
+            trail_length = bullet.trail_length
+            reach = bullet.speed * trail_length + 20
+            if not (-reach < draw_x < SCREEN_WIDTH + reach and -reach < draw_y < SCREEN_HEIGHT + reach):
+                continue
+            draw_line(screen, bullet.trail_color,
+                      (int(bullet.x - bullet.vx * trail_length - cam_x),
+                       int(bullet.y - bullet.vy * trail_length - cam_y)),
+                      (draw_x, draw_y), 2)
+            for sprite, radius in bullet.head:
+                add_head((sprite, (draw_x - radius, draw_y - radius)))
+        screen.unlock()
+        screen.blits(heads, doreturn=False)
 
         # Draw particles
-        for particle in self.particles:
-            particle.draw(screen, shake_offset)
+        self.particles.draw(screen, shake_offset)
 
         # Draw visual effects (muzzle flashes, bullet trails, blood particles)
         visual_effects.draw_effects(screen, shake_offset)
 
 
+# Wire format for one player's state: id, x, y, angle, health, class, shooting.
+# Quantized to 12 bytes: whole-pixel int16 coordinates (the world is 5000px),
+# angle in int16 ten-thousandths of a radian and health rounded up to an int16
+PLAYER_STATE = struct.Struct('<HhhhhB?')
+NET_ANGLE_SCALE = 10000
+# Host snapshots are a player count followed by that many PLAYER_STATE records
+SNAPSHOT_HEADER = struct.Struct('<H')
+NET_SEND_INTERVAL = 1 / 30  # State is sent at most 30 times a second
+NET_KEEPALIVE = 1.0  # An unchanged client state is still resent this often
+NET_POSITION_EPSILON = 0.5  # Pixels of movement below which a client state counts as unchanged
+NET_ANGLE_EPSILON = 0.01  # Radians of aim jitter below which a client state counts as unchanged
+NET_CLIENT_BACKLOG = 16 * 1024  # Bytes queued for a slow client before snapshots are dropped
+# Area of interest: a client is only sent players within this many pixels of
+# its own player on both axes - one screen beyond the edges of its view
+NET_INTEREST_RANGE_X = SCREEN_WIDTH
+NET_INTEREST_RANGE_Y = SCREEN_HEIGHT
+
+
+def pack_player_state(info):
+    # Aim keeps turning past +-pi for key-aimed players; wrap it into int16 range
+    angle = (info['angle'] + math.pi) % math.tau - math.pi
+    # Health rounds up so a player on a sliver of health never reads as dead
+    return PLAYER_STATE.pack(info['id'], round(info['x']), round(info['y']),
+                             round(angle * NET_ANGLE_SCALE), math.ceil(info['health']),
+                             info['player_class'], info['shooting'])
+
+
+def unpack_player_state(data, offset=0):
+    player_id, x, y, angle, health, player_class, shooting = PLAYER_STATE.unpack_from(data, offset)
+    return {'id': player_id, 'x': x, 'y': y, 'angle': angle / NET_ANGLE_SCALE, 'health': health,
+            'player_class': player_class, 'shooting': shooting}
+
+
+def player_state_changed(last, info):
+    """True if info differs from the last sent state by more than jitter."""
+    return (last is None
+            or abs(info['x'] - last['x']) > NET_POSITION_EPSILON
+            or abs(info['y'] - last['y']) > NET_POSITION_EPSILON
+            or abs(info['angle'] - last['angle']) > NET_ANGLE_EPSILON
+            or info['health'] != last['health']
+            or info['player_class'] != last['player_class']
+            or info['shooting'] != last['shooting'])
+
+
 class NetworkManager:
     """Handles online multiplayer networking."""
     def __init__(self):
@@ -4045,6 +5018,8 @@ class NetworkManager:
         self.is_host = False
         self.is_connected = False
         self.clients = []
+        self.client_buffers = {}  # client socket -> bytes queued but not yet sent
+        self.client_players = {}  # client socket -> id of the player it last reported
         self.server_thread = None
         self.receive_thread = None
         self.player_data = {}
@@ -4055,6 +5030,10 @@ class NetworkManager:
         self.host_ip = ""
         self.port = 5555
         self.room_code = ""
+        self.send_clock = NET_SEND_INTERVAL  # Game time since the last send tick; first call sends
+        self.idle_time = 0.0  # Game time since state actually went out
+        self.last_sent_state = None  # Last client state sent, to skip near-repeats
+        self.last_snapshots = {}  # client socket -> last snapshot queued, to skip exact repeats
 
     def host_game(self, port=5555):
         if not NETWORK_AVAILABLE:
@@ -4102,6 +5081,8 @@ class NetworkManager:
             return False
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Small state records must go out immediately, not wait for Nagle
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self.socket.connect((host_ip, port))
             self.is_host = False
             self.is_connected = True
@@ -4120,7 +5101,12 @@ class NetworkManager:
             try:
                 self.socket.settimeout(1.0)
                 client, addr = self.socket.accept()
-                self.clients.append(client)
+                client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                # Non-blocking, so one slow client can never stall the game loop
+                client.setblocking(False)
+                with self.lock:
+                    self.client_buffers[client] = bytearray()
+                    self.clients.append(client)
                 print(f"Client connected: {addr}")
 
                 # Start receive thread for this client
@@ -4132,28 +5118,99 @@ class NetworkManager:
                 break
 
     def _handle_client(self, client):
+        buffer = bytearray()  # Grows and drains in place as records arrive
+        record_size = PLAYER_STATE.size
+        # The socket is non-blocking, so wait for data with a selector
+        selector = selectors.DefaultSelector()
+        selector.register(client, selectors.EVENT_READ)
         while self.is_connected:
             try:
-                data = client.recv(4096)
-                if data:
+                if not selector.select(timeout=1.0):
+                    continue
+                try:
+                    data = client.recv(4096)
+                except BlockingIOError:
+                    continue
+                if not data:
+                    break  # Client disconnected
+                buffer += data
+                # TCP is a byte stream: consume every complete fixed-size record
+                complete = len(buffer) - len(buffer) % record_size
+                if complete:
                     with self.lock:
-                        player_info = pickle.loads(data)
-                        self.player_data[player_info['id']] = player_info
+                        for offset in range(0, complete, record_size):
+                            player_info = unpack_player_state(buffer, offset)
+                            self.player_data[player_info['id']] = player_info
+                        # Snapshots for this client are centred on its player
+                        self.client_players[client] = player_info['id']
+                    del buffer[:complete]
             except:
                 break
+        selector.close()
+
+        # Forget the client, so no more snapshots are built for it and the
+        # other clients stop receiving its player
+        with self.lock:
+            self.client_buffers.pop(client, None)
+            self.last_snapshots.pop(client, None)
+            player_id = self.client_players.pop(client, None)
+            if player_id is not None:
+                self.player_data.pop(player_id, None)
+            if client in self.clients:
+                self.clients.remove(client)
+        client.close()
 
     def _receive_data(self):
+        buffer = bytearray()  # Grows and drains in place as snapshots arrive
+        header_size = SNAPSHOT_HEADER.size
+        record_size = PLAYER_STATE.size
         while self.is_connected:
             try:
                 data = self.socket.recv(4096)
-                if data:
+                if not data:
+                    break  # Host closed the connection
+                buffer += data
+                # Apply every complete snapshot that has arrived
+                while len(buffer) >= header_size:
+                    count = SNAPSHOT_HEADER.unpack_from(buffer)[0]
+                    end = header_size + count * record_size
+                    if len(buffer) < end:
+                        break
+                    game_state = {}
+                    for offset in range(header_size, end, record_size):
+                        player_info = unpack_player_state(buffer, offset)
+                        game_state[player_info['id']] = player_info
                     with self.lock:
-                        game_state = pickle.loads(data)
                         self.player_data = game_state
+                    del buffer[:end]
             except:
                 break
 
-    def send_player_data(self, player):
+    def flush_clients(self):
+        """Send as much queued data to each client as its socket accepts right now."""
+        with self.lock:
+            pending = [(client, buffer) for client, buffer in self.client_buffers.items() if buffer]
+        for client, buffer in pending:
+            try:
+                sent = client.send(buffer)
+                del buffer[:sent]
+            except BlockingIOError:
+                pass  # Socket buffer full - try again next frame
+            except:
+                buffer.clear()
+
+    def send_player_data(self, player, dt):
+        # Drain anything a slow client still owes every frame, not just on send ticks
+        if self.is_host:
+            self.flush_clients()
+
+        # Fixed send tick driven by the frame time instead of one packet per frame
+        self.send_clock += dt
+        if self.send_clock < NET_SEND_INTERVAL:
+            return
+        self.idle_time += self.send_clock
+        self.send_clock = 0.0
+
         data = {
             'id': player.player_id,
             'x': player.x,
@@ -4166,15 +5223,51 @@ class NetworkManager:
 
         try:
             if self.is_host:
-                # Send to all clients
-                for client in self.clients:
-                    try:
-                        client.send(pickle.dumps(self.player_data))
-                    except:
-                        pass
+                # Send each client the players in its area of interest
+                with self.lock:
+                    player_data = self.player_data
+                    records = [(info['x'], info['y'], pack_player_state(info)) for info in player_data.values()]
+                    keepalive = self.idle_time >= NET_KEEPALIVE
+                    queued = False
+                    # Clients that see the same players share one encoded
+                    # snapshot (usually all of them, with everyone in view)
+                    shared = {}  # tuple of record indices -> snapshot bytes
+                    for client, buffer in self.client_buffers.items():
+                        viewer = player_data.get(self.client_players.get(client))
+                        if viewer is None:
+                            # Not reported its own player yet - send everyone
+                            relevant = tuple(range(len(records)))
+                        else:
+                            view_x = viewer['x']
+                            view_y = viewer['y']
+                            relevant = tuple(i for i, (x, y, _) in enumerate(records)
+                                             if -NET_INTEREST_RANGE_X < x - view_x < NET_INTEREST_RANGE_X
+                                             and -NET_INTEREST_RANGE_Y < y - view_y < NET_INTEREST_RANGE_Y)
+                        snapshot = shared.get(relevant)
+                        if snapshot is None:
+                            snapshot = SNAPSHOT_HEADER.pack(len(relevant)) + b''.join(records[i][2] for i in relevant)
+                            shared[relevant] = snapshot
+                        # Clients keep the last snapshot until a new one arrives, so
+                        # an unchanged view only goes out as a keepalive
+                        if snapshot == self.last_snapshots.get(client) and not keepalive:
+                            continue
+                        # Queue whole snapshots only, so framing survives; a client
+                        # that is far behind skips this one instead of growing the queue,
+                        # and only a snapshot actually queued counts as sent
+                        if len(buffer) < NET_CLIENT_BACKLOG:
+                            buffer += snapshot
+                            self.last_snapshots[client] = snapshot
+                            queued = True
+                    if not queued:
+                        return
+                self.flush_clients()
             else:
-                # Send to server
-                self.socket.send(pickle.dumps(data))
+                # Send to server, skipping states within jitter of the last one
+                if not player_state_changed(self.last_sent_state, data) and self.idle_time < NET_KEEPALIVE:
+                    return
+                self.socket.sendall(pack_player_state(data))
+                self.last_sent_state = data
+            self.idle_time = 0.0
         except:
             pass
 
@@ -4188,22 +5281,192 @@ class NetworkManager:
         self.is_connected = False
         if self.socket:
             self.socket.close()
-        for client in self.clients:
+        for client in list(self.clients):
             client.close()
 
 
+def build_health_bar_back():
+    """HUD health bar frame with its red empty track, blitted under the green fill."""
+    surface = pygame.Surface((250, 30))
+    surface.fill(DARK_GRAY)
+    pygame.draw.rect(surface, RED, (2, 2, 246, 26))
+    return surface
+
+
+def build_slot_frame(color):
+    """Outlined 60x60 weapon-slot box."""
+    surface = pygame.Surface((60, 60), pygame.SRCALPHA)
+    pygame.draw.rect(surface, color, (0, 0, 60, 60), 2)
+    return surface
+
+
+def build_minimap_background(world, size):
+    """Translucent minimap panel with its border and the bunker drawn in."""
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    surface.fill((30, 30, 30, 180))
+    scale = size / world.width
+    bunker_mx = int(world.bunker.x * scale)
+    bunker_my = int(world.bunker.y * scale)
+    bunker_mw = int(world.bunker.width * scale)
+    bunker_mh = int(world.bunker.height * scale)
+    pygame.draw.rect(surface, (100, 100, 100), (bunker_mx - bunker_mw//2, bunker_my - bunker_mh//2, bunker_mw, bunker_mh))
+    pygame.draw.rect(surface, WHITE, (0, 0, size, size), 2)
+    return optimize_surface(surface)
+
+
+def build_overlay(alpha):
+    """Full-screen black sheet for dimming the frame behind a menu or popup."""
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    surface.fill(BLACK)
+    surface.set_alpha(alpha)
+    return surface
+
+
+SLOT_SPRITES = {}  # (slot index, weapon name, selected) -> composed weapon slot
+
+
+def get_slot_sprite(number_font, index, name, selected):
+    """Weapon slot frame with its number and abbreviated weapon name drawn in."""
+    key = (index, name, selected)
+    sprite = SLOT_SPRITES.get(key)
+    if sprite is None:
+        color = YELLOW if selected else GRAY
+        name_text = FONT_18.render(name[:6], True, WHITE)
+        # Long names may overhang the 60px frame, as they did when drawn directly
+        sprite = pygame.Surface((max(60, 5 + name_text.get_width()), 60), pygame.SRCALPHA)
+        sprite.blit(SLOT_FRAME_SELECTED if selected else SLOT_FRAME, (0, 0))
+        sprite.blit(number_font.render(str(index + 1), True, color), (5, 5))
+        sprite.blit(name_text, (5, 35))
+        sprite = optimize_surface(sprite)
+        SLOT_SPRITES[key] = sprite
+    return sprite
+
+
+def build_crosshair():
+    """Mouse crosshair (ring plus four ticks) centered in a 31x31 sprite."""
+    surface = pygame.Surface((31, 31), pygame.SRCALPHA)
+    pygame.draw.circle(surface, WHITE, (15, 15), 10, 1)
+    pygame.draw.line(surface, WHITE, (0, 15), (10, 15), 2)
+    pygame.draw.line(surface, WHITE, (20, 15), (30, 15), 2)
+    pygame.draw.line(surface, WHITE, (15, 0), (15, 10), 2)
+    pygame.draw.line(surface, WHITE, (15, 20), (15, 30), 2)
+    return surface
+
+
+HEALTH_BAR_BACK = build_health_bar_back()
+SLOT_FRAME_SELECTED = build_slot_frame(YELLOW)
+SLOT_FRAME = build_slot_frame(GRAY)
+PAUSE_OVERLAY = build_overlay(150)
+GAME_OVER_OVERLAY = build_overlay(200)
+POPUP_OVERLAY = build_overlay(180)
+CROSSHAIR = build_crosshair()
+
+
+def optimize_module_sprites():
+    """Convert the sprites built at import, before the display existed, to its pixel format."""
+    global RELOADING_LABEL, BUNKER_LABEL, CRATE_LABEL, HEALTH_BAR_BACK, SLOT_FRAME_SELECTED, SLOT_FRAME
+    global PAUSE_OVERLAY, GAME_OVER_OVERLAY, POPUP_OVERLAY, CROSSHAIR
+    RELOADING_LABEL = optimize_surface(RELOADING_LABEL)
+    BUNKER_LABEL = optimize_surface(BUNKER_LABEL)
+    CRATE_LABEL = optimize_surface(CRATE_LABEL)
+    HEALTH_BAR_BACK = optimize_surface(HEALTH_BAR_BACK)
+    SLOT_FRAME_SELECTED = optimize_surface(SLOT_FRAME_SELECTED)
+    SLOT_FRAME = optimize_surface(SLOT_FRAME)
+    PAUSE_OVERLAY = optimize_surface(PAUSE_OVERLAY)
+    GAME_OVER_OVERLAY = optimize_surface(GAME_OVER_OVERLAY)
+    POPUP_OVERLAY = optimize_surface(POPUP_OVERLAY)
+    CROSSHAIR = optimize_surface(CROSSHAIR)
+    RELOAD_ARC_FRAMES[:] = [optimize_surface(frame) for frame in RELOAD_ARC_FRAMES]
+    for sprites in (PLAYER_ID_LABELS, WALL_PREVIEWS, ZOMBIE_EYE_SPRITES, CLASS_ICONS):
+        for key, sprite in sprites.items():
+            sprites[key] = optimize_surface(sprite)
+
+# Class select cards: class, title, accent color, description lines
+CLASS_CARDS = (
+    (PlayerClass.BUILDER, "BUILDER", ORANGE,
+     ("HP: 120 | Speed: Medium",
+      "Ability: Build Walls",
+      "Weapons: Nail Gun, Pistol",
+      "Defensive specialist")),
+    (PlayerClass.RANGER, "RANGER", GREEN,
+     ("HP: 100 | Speed: Fast",
+      "Ability: Rapid Fire",
+      "Weapons: Rifle, Pistol, Shotgun, Sniper",
+      "Ranged combat expert")),
+    (PlayerClass.HEALER, "HEALER", LIGHT_BLUE,
+     ("HP: 90 | Speed: Medium",
+      "Ability: Heal Zone",
+      "Weapons: Tranq Pistol, SMG",
+      "Team support")),
+    (PlayerClass.TANK, "TANK", RED,
+     ("HP: 180 | Speed: Slow",
+      "Ability: Ground Slam",
+      "Weapons: Minigun, RPG, Grenade Launcher",
+      "Heavy firepower"))
+)
+
+CLASS_CARD_WIDTH = 300
+CLASS_CARD_HEIGHT = 250
+CLASS_CARD_SPRITES = {}  # (class, pick state) -> pre-drawn class select card
+
+
+def get_class_card_sprite(name_font, desc_font, card, confirmed):
+    """Class select card; confirmed is None when no player has picked it."""
+    player_class, name, color, desc = card
+    key = (player_class, confirmed)
+    sprite = CLASS_CARD_SPRITES.get(key)
+    if sprite is None:
+        text_color = BLACK if confirmed else WHITE
+        desc_texts = [desc_font.render(line, True, text_color) for line in desc]
+        # Long description lines may run past the box edge, as they always have
+        width = max([CLASS_CARD_WIDTH] + [10 + text.get_width() for text in desc_texts])
+        sprite = pygame.Surface((width, CLASS_CARD_HEIGHT), pygame.SRCALPHA)
+        rect = (0, 0, CLASS_CARD_WIDTH, CLASS_CARD_HEIGHT)
+        if confirmed is None:
+            pygame.draw.rect(sprite, color, rect, 3)
+        else:
+            # Picked cards are filled solid; the screen has no alpha channel,
+            # so the fill was always opaque
+            pygame.draw.rect(sprite, color[:3], rect)
+        name_text = name_font.render(name, True, text_color)
+        sprite.blit(name_text, (CLASS_CARD_WIDTH//2 - name_text.get_width()//2, 20))
+        for k, text in enumerate(desc_texts):
+            sprite.blit(text, (10, 80 + k * 35))
+        sprite = optimize_surface(sprite)
+        CLASS_CARD_SPRITES[key] = sprite
+    return sprite
+
+
+MINIMAP_SIZE = 150  # Minimap panel edge in pixels
+# Minimap (color, radius) per zombie type; everything else is a small red dot
+MINIMAP_ZOMBIE_DOTS = {
+    "zombie_king": (PURPLE, 4),
+    "cage_walker": (ORANGE, 3),
+    "tank": ((150, 50, 50), 2),
+}
+MINIMAP_DEFAULT_DOT = (RED, 1)
+
+
 class Game:
     """Main game class."""
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        optimize_module_sprites()
         pygame.display.set_caption("Zombie Survival: Class Defense")
         self.clock = pygame.time.Clock()
         self.running = True
 
         # Start at account screen for all platforms
         self.state = GameState.ACCOUNT
+        self.drawn_state = None  # State shown by the last draw(), to spot transitions
 
         self.world = None
+        self.frozen_world = None  # Last world frame, reused while paused or game over
+        # Render interpolation: where the camera and players were before the last
+        # simulation step, and how far (0-1) the frame lies past that step
+        self.prev_camera = None
+        self.prev_positions = []
+        self.render_alpha = 1.0
         self.local_players = []
         self.camera_offset = [0, 0]
 
@@ -4216,6 +5479,7 @@ class Game:
         self.font_large = pygame.font.Font(None, 72)
         self.font_medium = pygame.font.Font(None, 48)
         self.font_small = pygame.font.Font(None, 32)
+        self.menu_blits = None  # Static main-menu text, laid out on first draw
 
         # Class selection (support up to 10 players)
         self.selected_class = [PlayerClass.RANGER] * 10
@@ -4233,6 +5497,11 @@ class Game:
         self.account_message = ""
         self.account_message_color = WHITE
 
+        # Mouse and keyboard state, sampled once per frame in run()
+        self.mouse_pos = (0, 0)
+        self.mouse_pressed = (False, False, False)
+        self.keys_pressed = NO_KEYS
+
         # Touch controls
         self.touch_enabled = True  # Always enable for web
         self.move_joystick = VirtualJoystick(120, SCREEN_HEIGHT - 120, 80)
@@ -4251,8 +5520,41 @@ class Game:
         self.weapon_popup_weapon = None
         self.weapon_popup_is_new = False
 
+        # Per-state draw and event handlers, looked up instead of walking an elif chain
+        # (states without an entry, e.g. WAVE_COMPLETE, draw and handle nothing)
+        self.draw_handlers = {
+            GameState.ACCOUNT: self.draw_account_screen,
+            GameState.REGISTER: self.draw_register_screen,
+            GameState.LOGIN: self.draw_login_screen,
+            GameState.MENU: self.draw_menu,
+            GameState.CLASS_SELECT: self.draw_class_select,
+            GameState.HOST_GAME: self.draw_host_screen,
+            GameState.JOIN_GAME: self.draw_join_screen,
+            GameState.PLAYING: self.draw_playing,
+            GameState.PAUSED: self.draw_paused_frame,
+            GameState.GAME_OVER: self.draw_game_over_frame,
+        }
+        self.event_handlers = {
+            GameState.ACCOUNT: self.handle_account_events,
+            GameState.REGISTER: self.handle_register_events,
+            GameState.LOGIN: self.handle_login_events,
+            GameState.MENU: self.handle_menu_events,
+            GameState.CLASS_SELECT: self.handle_class_select_events,
+            GameState.HOST_GAME: self.handle_host_events,
+            GameState.JOIN_GAME: self.handle_join_events,
+            GameState.PLAYING: self.handle_playing_events,
+            GameState.PAUSED: self.handle_paused_events,
+            GameState.GAME_OVER: self.handle_game_over_events,
+        }
+
     def reset_game(self):
         self.world = GameWorld()
+        self.frozen_world = None
+        self.prev_camera = None  # Nothing to interpolate from until the first step
+        self.minimap_background = build_minimap_background(self.world, MINIMAP_SIZE)
+        # Camera outline on the minimap; only its position changes per frame
+        scale = MINIMAP_SIZE / self.world.width
+        self.minimap_view = pygame.Rect(0, 0, int(SCREEN_WIDTH * scale), int(SCREEN_HEIGHT * scale))
         self.local_players = []
         self.class_confirmed = [False] * 4
 
@@ -4499,14 +5801,8 @@ class Game:
 
     def handle_menu_events(self, event):
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_1:
-                self.num_local_players = 1
-                self.state = GameState.CLASS_SELECT
-            elif event.key == pygame.K_2:
-                self.num_local_players = 2
-                self.state = GameState.CLASS_SELECT
-            elif event.key == pygame.K_3:
-                self.num_local_players = 3
+            if event.key in MENU_PLAYER_COUNT_KEYS:
+                self.num_local_players = MENU_PLAYER_COUNT_KEYS[event.key]
                 self.state = GameState.CLASS_SELECT
             elif event.key == pygame.K_h:
                 self.state = GameState.HOST_GAME
@@ -4680,7 +5976,6 @@ class Game:
             # Player 1 controls (WASD movement, Q/E weapons, Z ability)
             if len(self.local_players) > 0:
                 player = self.local_players[0]
-                player.keys_pressed.add(event.key)
 
                 if event.key == pygame.K_q:
                     player.switch_weapon(-1)  # Previous weapon
@@ -4714,9 +6009,7 @@ class Game:
             # Player 2 controls (IJKL movement, U/O weapons, M ability, 8/9 aim, Space shoot)
             if len(self.local_players) > 1:
                 player2 = self.local_players[1]
-                if event.key in [pygame.K_i, pygame.K_j, pygame.K_k, pygame.K_l, pygame.K_8, pygame.K_9]:
-                    player2.keys_pressed.add(event.key)
-                elif event.key == pygame.K_u:
+                if event.key == pygame.K_u:
                     player2.switch_weapon(-1)  # Previous weapon
                 elif event.key == pygame.K_o:
                     player2.switch_weapon(1)   # Next weapon
@@ -4729,9 +6022,7 @@ class Game:
             # Player 3 controls (TFGH movement, R/Y weapons, V ability, 6/7 aim, B shoot)
             if len(self.local_players) > 2:
                 player3 = self.local_players[2]
-                if event.key in [pygame.K_t, pygame.K_f, pygame.K_g, pygame.K_h, pygame.K_6, pygame.K_7]:
-                    player3.keys_pressed.add(event.key)
-                elif event.key == pygame.K_r:
+                if event.key == pygame.K_r:
                     player3.switch_weapon(-1)  # Previous weapon
                 elif event.key == pygame.K_y:
                     player3.switch_weapon(1)   # Next weapon
@@ -4742,14 +6033,9 @@ class Game:
                     player3.mouse_buttons[0] = True
 
         elif event.type == pygame.KEYUP:
-            if len(self.local_players) > 0:
-                player = self.local_players[0]
-                player.keys_pressed.discard(event.key)
-
             # Player 2 key up
             if len(self.local_players) > 1:
                 player2 = self.local_players[1]
-                player2.keys_pressed.discard(event.key)
                 # Stop shooting when spacebar released
                 if event.key == pygame.K_SPACE:
                     player2.mouse_buttons[0] = False
@@ -4757,7 +6043,6 @@ class Game:
             # Player 3 key up
             if len(self.local_players) > 2:
                 player3 = self.local_players[2]
-                player3.keys_pressed.discard(event.key)
                 # Stop shooting when B released
                 if event.key == pygame.K_b:
                     player3.mouse_buttons[0] = False
@@ -4841,10 +6126,12 @@ class Game:
 
     def update(self, dt):
         if self.state == GameState.PLAYING:
-            # Update mouse position for all local players
-            mouse_pos = pygame.mouse.get_pos()
+            # Hand this frame's mouse position and key states to all local players
+            mouse_pos = self.mouse_pos
+            keys = self.keys_pressed
             for player in self.local_players:
                 player.mouse_pos = mouse_pos
+                player.keys_pressed = keys
 
             # Handle touch controls for player 1
             if self.touch_enabled and len(self.local_players) > 0:
@@ -4870,7 +6157,7 @@ class Game:
                     player.mouse_buttons[0] = True
                 else:
                     # Only disable if no mouse click either
-                    if not pygame.mouse.get_pressed()[0]:
+                    if not self.mouse_pressed[0]:
                         player.mouse_buttons[0] = False
 
             # Update world (only if not showing weapon popup in solo mode)
@@ -4887,14 +6174,16 @@ class Game:
             # Always update visual effects (even during popup)
             visual_effects.update(dt)
 
+            # First alive local player; none left means everyone is dead
+            first_alive = None
+            for player in self.local_players:
+                if player.health > 0:
+                    first_alive = player
+                    break
+
             # Update camera to follow first alive player
             if self.local_players:
-                # Find first alive player to follow
-                camera_target = None
-                for player in self.local_players:
-                    if player.health > 0:
-                        camera_target = player
-                        break
+                camera_target = first_alive
 
                 # If all dead, follow first player's body
                 if camera_target is None:
@@ -4902,22 +6191,24 @@ class Game:
 
                 target_x = camera_target.x - SCREEN_WIDTH // 2
                 target_y = camera_target.y - SCREEN_HEIGHT // 2
-                self.camera_offset[0] += (target_x - self.camera_offset[0]) * 5 * dt
-                self.camera_offset[1] += (target_y - self.camera_offset[1]) * 5 * dt
+                # Exponential smoothing, so the follow speed doesn't depend on frame rate
+                follow = 1.0 - math.exp(-CAMERA_SMOOTHING * dt)
+                self.camera_offset[0] += (target_x - self.camera_offset[0]) * follow
+                self.camera_offset[1] += (target_y - self.camera_offset[1]) * follow
 
                 # Apply screen shake from player recoil
-                if camera_target.screen_shake > 0:
-                    shake_x = random.uniform(-camera_target.screen_shake, camera_target.screen_shake)
-                    shake_y = random.uniform(-camera_target.screen_shake, camera_target.screen_shake)
-                    self.camera_offset[0] += shake_x
-                    self.camera_offset[1] += shake_y
+                amp = camera_target.screen_shake
+                if amp > 0:
+                    rnd = random.random
+                    self.camera_offset[0] += (rnd() * 2 - 1) * amp
+                    self.camera_offset[1] += (rnd() * 2 - 1) * amp
 
                 # Clamp camera
                 self.camera_offset[0] = max(0, min(self.world.width - SCREEN_WIDTH, self.camera_offset[0]))
                 self.camera_offset[1] = max(0, min(self.world.height - SCREEN_HEIGHT, self.camera_offset[1]))
 
             # Check game over - all players dead OR bunker destroyed
-            all_dead = all(p.health <= 0 for p in self.local_players)
+            all_dead = first_alive is None
             bunker_destroyed = self.world.bunker.health <= 0
             if all_dead or bunker_destroyed:
                 # Save high score when game ends
@@ -4926,17 +6217,15 @@ class Game:
 
             # Network update
             if self.is_multiplayer and self.local_players:
-                self.network.send_player_data(self.local_players[0])
+                self.network.send_player_data(self.local_players[0], dt)
 
     def draw_account_screen(self):
         """Draw account/login screen with touch-friendly buttons."""
         self.screen.fill(BLACK)
 
         # Title
-        title = self.font_large.render("ZOMBIE SURVIVAL", True, RED)
-        subtitle = self.font_medium.render("Account", True, WHITE)
-        self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
-        self.screen.blit(subtitle, (SCREEN_WIDTH//2 - subtitle.get_width()//2, 160))
+        self.screen.blit(*centered_text(self.font_large, "ZOMBIE SURVIVAL", RED, 80))
+        self.screen.blit(*centered_text(self.font_medium, "Account", WHITE, 160))
 
         # Button dimensions
         btn_width = 300
@@ -4946,19 +6235,19 @@ class Game:
         # Register button (R key)
         pygame.draw.rect(self.screen, GREEN, (btn_x, 280, btn_width, btn_height), border_radius=10)
         pygame.draw.rect(self.screen, WHITE, (btn_x, 280, btn_width, btn_height), 3, border_radius=10)
-        reg_text = self.font_medium.render("REGISTER", True, BLACK)
+        reg_text = render_text(self.font_medium, "REGISTER", BLACK)
         self.screen.blit(reg_text, (btn_x + btn_width//2 - reg_text.get_width()//2, 295))
 
         # Login button (L key)
         pygame.draw.rect(self.screen, BLUE, (btn_x, 380, btn_width, btn_height), border_radius=10)
         pygame.draw.rect(self.screen, WHITE, (btn_x, 380, btn_width, btn_height), 3, border_radius=10)
-        login_text = self.font_medium.render("LOGIN", True, WHITE)
+        login_text = render_text(self.font_medium, "LOGIN", WHITE)
         self.screen.blit(login_text, (btn_x + btn_width//2 - login_text.get_width()//2, 395))
 
         # Guest button (ESC key)
         pygame.draw.rect(self.screen, GRAY, (btn_x, 480, btn_width, btn_height), border_radius=10)
         pygame.draw.rect(self.screen, WHITE, (btn_x, 480, btn_width, btn_height), 3, border_radius=10)
-        guest_text = self.font_medium.render("GUEST", True, WHITE)
+        guest_text = render_text(self.font_medium, "GUEST", WHITE)
         self.screen.blit(guest_text, (btn_x + btn_width//2 - guest_text.get_width()//2, 495))
 
         # Instructions underneath
@@ -4969,40 +6258,37 @@ class Game:
         ]
         y = 600
         for inst in instructions:
-            text = self.font_small.render(inst, True, GRAY)
-            self.screen.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, y))
+            self.screen.blit(*centered_text(self.font_small, inst, GRAY, y))
             y += 35
 
         # Show message if any
         if self.account_message:
-            msg_text = self.font_small.render(self.account_message, True, self.account_message_color)
-            self.screen.blit(msg_text, (SCREEN_WIDTH//2 - msg_text.get_width()//2, 230))
+            self.screen.blit(*centered_text(self.font_small, self.account_message, self.account_message_color, 230))
 
     def draw_register_screen(self):
         """Draw registration screen."""
         self.screen.fill(BLACK)
 
         # Title
-        title = self.font_large.render("REGISTER", True, GREEN)
-        self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 100))
+        self.screen.blit(*centered_text(self.font_large, "REGISTER", GREEN, 100))
 
         btn_width = 300
         btn_height = 60
         btn_x = SCREEN_WIDTH // 2 - btn_width // 2
 
         # Username label
-        label = self.font_small.render("Username:", True, WHITE)
+        label = render_text(self.font_small, "Username:", WHITE)
         self.screen.blit(label, (btn_x, 250))
 
         # Username input field
         field_color = YELLOW if self.account_input_field == "username" else WHITE
         pygame.draw.rect(self.screen, DARK_GRAY, (btn_x, 280, btn_width, btn_height))
         pygame.draw.rect(self.screen, field_color, (btn_x, 280, btn_width, btn_height), 3)
-        user_text = self.font_medium.render(self.username_input, True, WHITE)
+        user_text = render_text(self.font_medium, self.username_input, WHITE)
         self.screen.blit(user_text, (btn_x + 10, 290))
 
         # Password label
-        label = self.font_small.render("Password:", True, WHITE)
+        label = render_text(self.font_small, "Password:", WHITE)
         self.screen.blit(label, (btn_x, 350))
 
         # Password input field (show asterisks)
@@ -5010,18 +6296,18 @@ class Game:
         pygame.draw.rect(self.screen, DARK_GRAY, (btn_x, 380, btn_width, btn_height))
         pygame.draw.rect(self.screen, field_color, (btn_x, 380, btn_width, btn_height), 3)
         pass_display = "*" * len(self.password_input)
-        pass_text = self.font_medium.render(pass_display, True, WHITE)
+        pass_text = render_text(self.font_medium, pass_display, WHITE)
         self.screen.blit(pass_text, (btn_x + 10, 390))
 
         # Submit button
         pygame.draw.rect(self.screen, GREEN, (btn_x, 470, btn_width, 70), border_radius=10)
         pygame.draw.rect(self.screen, WHITE, (btn_x, 470, btn_width, 70), 3, border_radius=10)
-        submit_text = self.font_medium.render("CREATE ACCOUNT", True, BLACK)
+        submit_text = render_text(self.font_medium, "CREATE ACCOUNT", BLACK)
         self.screen.blit(submit_text, (btn_x + btn_width//2 - submit_text.get_width()//2, 485))
 
         # Back button
         pygame.draw.rect(self.screen, GRAY, (btn_x, 560, btn_width, 50), border_radius=10)
-        back_text = self.font_small.render("BACK (ESC)", True, WHITE)
+        back_text = render_text(self.font_small, "BACK (ESC)", WHITE)
         self.screen.blit(back_text, (btn_x + btn_width//2 - back_text.get_width()//2, 570))
 
         # Instructions
@@ -5031,14 +6317,12 @@ class Game:
         ]
         y = 650
         for inst in instructions:
-            text = self.font_small.render(inst, True, GRAY)
-            self.screen.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, y))
+            self.screen.blit(*centered_text(self.font_small, inst, GRAY, y))
             y += 30
 
         # Show message
         if self.account_message:
-            msg_text = self.font_small.render(self.account_message, True, self.account_message_color)
-            self.screen.blit(msg_text, (SCREEN_WIDTH//2 - msg_text.get_width()//2, 180))
+            self.screen.blit(*centered_text(self.font_small, self.account_message, self.account_message_color, 180))
 
         # Draw virtual keyboard
         self.virtual_keyboard.draw(self.screen, self.font_small)
@@ -5048,26 +6332,25 @@ class Game:
         self.screen.fill(BLACK)
 
         # Title
-        title = self.font_large.render("LOGIN", True, BLUE)
-        self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 100))
+        self.screen.blit(*centered_text(self.font_large, "LOGIN", BLUE, 100))
 
         btn_width = 300
         btn_height = 60
         btn_x = SCREEN_WIDTH // 2 - btn_width // 2
 
         # Username label
-        label = self.font_small.render("Username:", True, WHITE)
+        label = render_text(self.font_small, "Username:", WHITE)
         self.screen.blit(label, (btn_x, 250))
 
         # Username input field
         field_color = YELLOW if self.account_input_field == "username" else WHITE
         pygame.draw.rect(self.screen, DARK_GRAY, (btn_x, 280, btn_width, btn_height))
         pygame.draw.rect(self.screen, field_color, (btn_x, 280, btn_width, btn_height), 3)
-        user_text = self.font_medium.render(self.username_input, True, WHITE)
+        user_text = render_text(self.font_medium, self.username_input, WHITE)
         self.screen.blit(user_text, (btn_x + 10, 290))
 
         # Password label
-        label = self.font_small.render("Password:", True, WHITE)
+        label = render_text(self.font_small, "Password:", WHITE)
         self.screen.blit(label, (btn_x, 350))
 
         # Password input field
@@ -5075,18 +6358,18 @@ class Game:
         pygame.draw.rect(self.screen, DARK_GRAY, (btn_x, 380, btn_width, btn_height))
         pygame.draw.rect(self.screen, field_color, (btn_x, 380, btn_width, btn_height), 3)
         pass_display = "*" * len(self.password_input)
-        pass_text = self.font_medium.render(pass_display, True, WHITE)
+        pass_text = render_text(self.font_medium, pass_display, WHITE)
         self.screen.blit(pass_text, (btn_x + 10, 390))
 
         # Submit button
         pygame.draw.rect(self.screen, BLUE, (btn_x, 470, btn_width, 70), border_radius=10)
         pygame.draw.rect(self.screen, WHITE, (btn_x, 470, btn_width, 70), 3, border_radius=10)
-        submit_text = self.font_medium.render("LOGIN", True, WHITE)
+        submit_text = render_text(self.font_medium, "LOGIN", WHITE)
         self.screen.blit(submit_text, (btn_x + btn_width//2 - submit_text.get_width()//2, 485))
 
         # Back button
         pygame.draw.rect(self.screen, GRAY, (btn_x, 560, btn_width, 50), border_radius=10)
-        back_text = self.font_small.render("BACK (ESC)", True, WHITE)
+        back_text = render_text(self.font_small, "BACK (ESC)", WHITE)
         self.screen.blit(back_text, (btn_x + btn_width//2 - back_text.get_width()//2, 570))
 
         # Instructions
@@ -5096,38 +6379,26 @@ class Game:
         ]
         y = 650
         for inst in instructions:
-            text = self.font_small.render(inst, True, GRAY)
-            self.screen.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, y))
+            self.screen.blit(*centered_text(self.font_small, inst, GRAY, y))
             y += 30
 
         # Show message
         if self.account_message:
-            msg_text = self.font_small.render(self.account_message, True, self.account_message_color)
-            self.screen.blit(msg_text, (SCREEN_WIDTH//2 - msg_text.get_width()//2, 180))
+            self.screen.blit(*centered_text(self.font_small, self.account_message, self.account_message_color, 180))
 
         # Draw virtual keyboard
         self.virtual_keyboard.draw(self.screen, self.font_small)
 
-    def draw_menu(self):
-        self.screen.fill(BLACK)
+    def build_menu_blits(self):
+        """Lay out the static main-menu text once as a blits() sequence."""
+        blits = []
 
-        # Title
-        title = self.font_large.render("ZOMBIE SURVIVAL", True, RED)
-        subtitle = self.font_medium.render("Class Defense", True, WHITE)
-        self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 100))
-        self.screen.blit(subtitle, (SCREEN_WIDTH//2 - subtitle.get_width()//2, 180))
+        def centered(text, y):
+            blits.append((text, (SCREEN_WIDTH//2 - text.get_width()//2, y)))
 
-        # Show logged in user info
-        user_text = f"Logged in as: {account_manager.current_user}"
-        if account_manager.is_guest:
-            user_text += " (Guest - progress won't save)"
-        user_render = self.font_small.render(user_text, True, GREEN if not account_manager.is_guest else YELLOW)
-        self.screen.blit(user_render, (SCREEN_WIDTH//2 - user_render.get_width()//2, 230))
-
-        # Show coins and high score
-        coins_text = f"Coins: ${account_manager.user_data.get('coins', 0)} | High Score: Wave {account_manager.user_data.get('high_score', 0)}"
-        coins_render = self.font_small.render(coins_text, True, YELLOW)
-        self.screen.blit(coins_render, (SCREEN_WIDTH//2 - coins_render.get_width()//2, 260))
+        # Title
+        centered(render_text(self.font_large, "ZOMBIE SURVIVAL", RED), 100)
+        centered(render_text(self.font_medium, "Class Defense", WHITE), 180)
 
         # Menu options
         options = [
@@ -5146,8 +6417,7 @@ class Game:
         y = 320
         for option, color in options:
             if option:
-                text = self.font_small.render(option, True, color)
-                self.screen.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, y))
+                centered(render_text(self.font_small, option, color), y)
             y += 45
 
         # Instructions
@@ -5159,372 +6429,277 @@ class Game:
         ]
         y = SCREEN_HEIGHT - 150
         for inst in instructions:
-            text = self.font_small.render(inst, True, GRAY)
-            self.screen.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, y))
+            centered(render_text(self.font_small, inst, GRAY), y)
             y += 30
+        return blits
 
-    def draw_class_select(self):
-        self.screen.fill(DARK_GRAY)
+    def draw_menu(self):
+        self.screen.fill(BLACK)
 
-        title = self.font_large.render("SELECT YOUR CLASS", True, WHITE)
-        self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 50))
-
-        classes = [
-            (PlayerClass.BUILDER, "BUILDER", ORANGE,
-             ["HP: 120 | Speed: Medium",
-              "Ability: Build Walls",
-              "Weapons: Nail Gun, Pistol",
-              "Defensive specialist"]),
-            (PlayerClass.RANGER, "RANGER", GREEN,
-             ["HP: 100 | Speed: Fast",
-              "Ability: Rapid Fire",
-              "Weapons: Rifle, Pistol, Shotgun, Sniper",
-              "Ranged combat expert"]),
-            (PlayerClass.HEALER, "HEALER", LIGHT_BLUE,
-             ["HP: 90 | Speed: Medium",
-              "Ability: Heal Zone",
-              "Weapons: Tranq Pistol, SMG",
-              "Team support"]),
-            (PlayerClass.TANK, "TANK", RED,
-             ["HP: 180 | Speed: Slow",
-              "Ability: Ground Slam",
-              "Weapons: Minigun, RPG, Grenade Launcher",
-              "Heavy firepower"])
-        ]
+        # Title, options and controls never change, so they are laid out once
+        if self.menu_blits is None:
+            self.menu_blits = self.build_menu_blits()
+        self.screen.blits(self.menu_blits, doreturn=False)
 
-        box_width = 300
-        box_height = 250
-        start_x = (SCREEN_WIDTH - box_width * 4 - 60) // 2
+        # Show logged in user info
+        user_text = f"Logged in as: {account_manager.current_user}"
+        if account_manager.is_guest:
+            user_text += " (Guest - progress won't save)"
+        self.screen.blit(*centered_text(self.font_small, user_text, GREEN if not account_manager.is_guest else YELLOW, 230))
 
-        for i, (pc, name, color, desc) in enumerate(classes):
-            x = start_x + i * (box_width + 20)
-            y = 180
+        # Show coins and high score
+        coins_text = f"Coins: ${account_manager.user_data.get('coins', 0)} | High Score: Wave {account_manager.user_data.get('high_score', 0)}"
+        self.screen.blit(*centered_text(self.font_small, coins_text, YELLOW, 260))
 
-            # Box
-            rect = pygame.Rect(x, y, box_width, box_height)
-            pygame.draw.rect(self.screen, color, rect, 3)
+    def draw_class_select(self):
+        self.screen.fill(DARK_GRAY)
+
+        self.screen.blit(*centered_text(self.font_large, "SELECT YOUR CLASS", WHITE, 50))
+
+        start_x = (SCREEN_WIDTH - CLASS_CARD_WIDTH * 4 - 60) // 2
+        y = 180
+        cards = []
+        for i, card in enumerate(CLASS_CARDS):
+            x = start_x + i * (CLASS_CARD_WIDTH + 20)
+            pc, color = card[0], card[2]
 
             # Highlight if selected
+            confirmed = None
             for p_idx in range(self.num_local_players):
                 if self.selected_class[p_idx] == pc:
-                    if self.class_confirmed[p_idx]:
-                        pygame.draw.rect(self.screen, color, rect)
-                        text_color = BLACK
-                    else:
-                        pygame.draw.rect(self.screen, (*color[:3], 100), rect)
-                        text_color = WHITE
-
+                    confirmed = self.class_confirmed[p_idx]
                     # Player indicator
-                    p_text = self.font_small.render(f"P{p_idx + 1}", True, WHITE if self.class_confirmed[p_idx] else color)
-                    self.screen.blit(p_text, (x + box_width//2 - p_text.get_width()//2, y + box_height + 10))
+                    p_text = render_text(self.font_small, f"P{p_idx + 1}", WHITE if confirmed else color)
+                    cards.append((p_text, (x + CLASS_CARD_WIDTH//2 - p_text.get_width()//2, y + CLASS_CARD_HEIGHT + 10)))
                     break
-            else:
-                text_color = WHITE
-
-            # Class name
-            name_text = self.font_medium.render(name, True, text_color)
-            self.screen.blit(name_text, (x + box_width//2 - name_text.get_width()//2, y + 20))
 
-            # Description
-            dy = 80
-            for line in desc:
-                desc_text = self.font_small.render(line, True, text_color)
-                self.screen.blit(desc_text, (x + 10, y + dy))
-                dy += 35
+            # Box, class name and description, pre-drawn per pick state
+            cards.append((get_class_card_sprite(self.font_medium, self.font_small, card, confirmed), (x, y)))
+        self.screen.blits(cards, doreturn=False)
 
         # Instructions
         inst_y = SCREEN_HEIGHT - 140
         if self.num_local_players >= 1:
-            inst1 = self.font_small.render("P1: A/D to select, SPACE to confirm", True, WHITE)
-            self.screen.blit(inst1, (SCREEN_WIDTH//2 - inst1.get_width()//2, inst_y))
+            self.screen.blit(*centered_text(self.font_small, "P1: A/D to select, SPACE to confirm", WHITE, inst_y))
         if self.num_local_players >= 2:
-            inst2 = self.font_small.render("P2: J/L to select, ENTER to confirm", True, WHITE)
-            self.screen.blit(inst2, (SCREEN_WIDTH//2 - inst2.get_width()//2, inst_y + 30))
+            self.screen.blit(*centered_text(self.font_small, "P2: J/L to select, ENTER to confirm", WHITE, inst_y + 30))
         if self.num_local_players >= 3:
-            inst3 = self.font_small.render("P3: F/H to select, TAB to confirm", True, WHITE)
-            self.screen.blit(inst3, (SCREEN_WIDTH//2 - inst3.get_width()//2, inst_y + 60))
+            self.screen.blit(*centered_text(self.font_small, "P3: F/H to select, TAB to confirm", WHITE, inst_y + 60))
 
     def draw_host_screen(self):
         self.screen.fill(BLACK)
 
-        title = self.font_large.render("HOST GAME", True, GREEN)
-        self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 150))
+        self.screen.blit(*centered_text(self.font_large, "HOST GAME", GREEN, 150))
 
         # Check if networking is available (not in web browser)
         if not NETWORK_AVAILABLE:
             # Web version - networking not supported
-            error_text = self.font_medium.render("Online multiplayer not available", True, RED)
-            self.screen.blit(error_text, (SCREEN_WIDTH//2 - error_text.get_width()//2, 300))
+            self.screen.blit(*centered_text(self.font_medium, "Online multiplayer not available", RED, 300))
 
-            reason_text = self.font_small.render("Web browsers cannot host game servers", True, YELLOW)
-            self.screen.blit(reason_text, (SCREEN_WIDTH//2 - reason_text.get_width()//2, 360))
+            self.screen.blit(*centered_text(self.font_small, "Web browsers cannot host game servers", YELLOW, 360))
 
-            tip_text = self.font_small.render("Use local co-op (2-3 players) instead!", True, WHITE)
-            self.screen.blit(tip_text, (SCREEN_WIDTH//2 - tip_text.get_width()//2, 420))
+            self.screen.blit(*centered_text(self.font_small, "Use local co-op (2-3 players) instead!", WHITE, 420))
 
-            tip2_text = self.font_small.render("Or download the desktop version for online play", True, GRAY)
-            self.screen.blit(tip2_text, (SCREEN_WIDTH//2 - tip2_text.get_width()//2, 460))
+            self.screen.blit(*centered_text(self.font_small, "Or download the desktop version for online play", GRAY, 460))
         elif self.network.is_host:
             # Room code (big and prominent)
-            code_label = self.font_medium.render("ROOM CODE:", True, YELLOW)
-            self.screen.blit(code_label, (SCREEN_WIDTH//2 - code_label.get_width()//2, 250))
+            self.screen.blit(*centered_text(self.font_medium, "ROOM CODE:", YELLOW, 250))
 
-            code_text = self.font_large.render(self.network.room_code, True, GREEN)
-            self.screen.blit(code_text, (SCREEN_WIDTH//2 - code_text.get_width()//2, 300))
+            self.screen.blit(*centered_text(self.font_large, self.network.room_code, GREEN, 300))
 
             # IP and Port (smaller, below)
-            ip_text = self.font_small.render(f"IP: {self.network.host_ip}", True, GRAY)
-            port_text = self.font_small.render(f"Port: {self.network.port}", True, GRAY)
-
-            self.screen.blit(ip_text, (SCREEN_WIDTH//2 - ip_text.get_width()//2, 400))
-            self.screen.blit(port_text, (SCREEN_WIDTH//2 - port_text.get_width()//2, 430))
+            self.screen.blit(*centered_text(self.font_small, f"IP: {self.network.host_ip}", GRAY, 400))
+            self.screen.blit(*centered_text(self.font_small, f"Port: {self.network.port}", GRAY, 430))
 
             # Waiting message
-            waiting = self.font_medium.render(f"Waiting for players... ({len(self.network.clients)} connected)", True, YELLOW)
-            self.screen.blit(waiting, (SCREEN_WIDTH//2 - waiting.get_width()//2, 500))
+            self.screen.blit(*centered_text(self.font_medium, f"Waiting for players... ({len(self.network.clients)} connected)", YELLOW, 500))
 
             # Share instructions
-            share_text = self.font_small.render("Share the ROOM CODE with friends to join!", True, WHITE)
-            self.screen.blit(share_text, (SCREEN_WIDTH//2 - share_text.get_width()//2, 550))
+            self.screen.blit(*centered_text(self.font_small, "Share the ROOM CODE with friends to join!", WHITE, 550))
         else:
-            inst = self.font_medium.render("Press ENTER to start hosting", True, WHITE)
-            self.screen.blit(inst, (SCREEN_WIDTH//2 - inst.get_width()//2, 400))
+            self.screen.blit(*centered_text(self.font_medium, "Press ENTER to start hosting", WHITE, 400))
 
-        back = self.font_small.render("Press ESC to go back", True, GRAY)
-        self.screen.blit(back, (SCREEN_WIDTH//2 - back.get_width()//2, SCREEN_HEIGHT - 100))
+        self.screen.blit(*centered_text(self.font_small, "Press ESC to go back", GRAY, SCREEN_HEIGHT - 100))
 
     def draw_join_screen(self):
         self.screen.fill(BLACK)
 
-        title = self.font_large.render("JOIN GAME", True, BLUE)
-        self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 200))
+        self.screen.blit(*centered_text(self.font_large, "JOIN GAME", BLUE, 200))
 
         # Check if networking is available (not in web browser)
         if not NETWORK_AVAILABLE:
             # Web version - networking not supported
-            error_text = self.font_medium.render("Online multiplayer not available", True, RED)
-            self.screen.blit(error_text, (SCREEN_WIDTH//2 - error_text.get_width()//2, 300))
+            self.screen.blit(*centered_text(self.font_medium, "Online multiplayer not available", RED, 300))
 
-            reason_text = self.font_small.render("Web browsers cannot connect to game servers", True, YELLOW)
-            self.screen.blit(reason_text, (SCREEN_WIDTH//2 - reason_text.get_width()//2, 360))
+            self.screen.blit(*centered_text(self.font_small, "Web browsers cannot connect to game servers", YELLOW, 360))
 
-            tip_text = self.font_small.render("Use local co-op (2-3 players) instead!", True, WHITE)
-            self.screen.blit(tip_text, (SCREEN_WIDTH//2 - tip_text.get_width()//2, 420))
+            self.screen.blit(*centered_text(self.font_small, "Use local co-op (2-3 players) instead!", WHITE, 420))
 
-            tip2_text = self.font_small.render("Or download the desktop version for online play", True, GRAY)
-            self.screen.blit(tip2_text, (SCREEN_WIDTH//2 - tip2_text.get_width()//2, 460))
+            self.screen.blit(*centered_text(self.font_small, "Or download the desktop version for online play", GRAY, 460))
         else:
-            inst = self.font_medium.render("Enter Host IP Address:", True, WHITE)
-            self.screen.blit(inst, (SCREEN_WIDTH//2 - inst.get_width()//2, 350))
+            self.screen.blit(*centered_text(self.font_medium, "Enter Host IP Address:", WHITE, 350))
 
             # IP input box
             box_rect = pygame.Rect(SCREEN_WIDTH//2 - 150, 420, 300, 50)
             pygame.draw.rect(self.screen, WHITE, box_rect, 2)
 
-            ip_display = self.font_medium.render(self.ip_input + "_", True, WHITE)
+            ip_display = render_text(self.font_medium, self.ip_input + "_", WHITE)
             self.screen.blit(ip_display, (box_rect.x + 10, box_rect.y + 10))
 
-            enter_inst = self.font_small.render("Press ENTER to connect", True, YELLOW)
-            self.screen.blit(enter_inst, (SCREEN_WIDTH//2 - enter_inst.get_width()//2, 500))
+            self.screen.blit(*centered_text(self.font_small, "Press ENTER to connect", YELLOW, 500))
 
-        back = self.font_small.render("Press ESC to go back", True, GRAY)
-        self.screen.blit(back, (SCREEN_WIDTH//2 - back.get_width()//2, SCREEN_HEIGHT - 100))
+        self.screen.blit(*centered_text(self.font_small, "Press ESC to go back", GRAY, SCREEN_HEIGHT - 100))
 
-    def draw_hud(self):
+    def draw_hud(self, crosshair=True):
         if not self.local_players:
             return
 
         player = self.local_players[0]
+        # Bind the hot attributes once; the minimap loops below run per zombie
+        screen = self.screen
+        world = self.world
+        font_small = self.font_small
 
-        # Health bar
-        pygame.draw.rect(self.screen, DARK_GRAY, (20, 20, 250, 30))
-        pygame.draw.rect(self.screen, RED, (22, 22, 246, 26))
+        # Health bar (frame and empty track are pre-drawn)
+        screen.blit(HEALTH_BAR_BACK, (20, 20))
         health_width = (player.health / player.max_health) * 246
-        pygame.draw.rect(self.screen, GREEN, (22, 22, health_width, 26))
-        health_text = self.font_small.render(f"HP: {int(player.health)}/{player.max_health}", True, WHITE)
-        self.screen.blit(health_text, (25, 55))
+        pygame.draw.rect(screen, GREEN, (22, 22, health_width, 26))
+
+        # Static text, slot and crosshair sprites go out in one blits() call
+        hud = []
+        add = hud.append
+        add((render_text(font_small, f"HP: {int(player.health)}/{player.max_health}", WHITE), (25, 55)))
 
         # Ammo
         weapon = player.current_weapon
-        ammo_text = self.font_medium.render(f"{weapon.name}", True, WHITE)
-        ammo_count = self.font_medium.render(f"{player.current_ammo} / {player.reserve_ammo}", True, YELLOW if player.current_ammo > 0 else RED)
-        self.screen.blit(ammo_text, (20, 90))
-        self.screen.blit(ammo_count, (20, 130))
+        add((render_text(self.font_medium, f"{weapon.name}", WHITE), (20, 90)))
+        add((render_text(self.font_medium, f"{player.current_ammo} / {player.reserve_ammo}", YELLOW if player.current_ammo > 0 else RED), (20, 130)))
 
         if player.is_reloading:
-            reload_text = self.font_small.render("RELOADING...", True, ORANGE)
-            self.screen.blit(reload_text, (20, 170))
+            add((render_text(font_small, "RELOADING...", ORANGE), (20, 170)))
 
         # Ability cooldown
-        ability_text = self.font_small.render(f"Ability (Z): ", True, WHITE)
-        self.screen.blit(ability_text, (20, 200))
+        add((render_text(font_small, f"Ability (Z): ", WHITE), (20, 200)))
         if player.ability_cooldown > 0:
-            cd_text = self.font_small.render(f"{player.ability_cooldown:.1f}s", True, RED)
+            cd_text = render_text(font_small, f"{player.ability_cooldown:.1f}s", RED)
         else:
-            cd_text = self.font_small.render("READY", True, GREEN)
-        self.screen.blit(cd_text, (140, 200))
+            cd_text = render_text(font_small, "READY", GREEN)
+        add((cd_text, (140, 200)))
 
         # Wave info
-        wave_text = self.font_medium.render(f"Wave: {self.world.current_wave}", True, WHITE)
-        self.screen.blit(wave_text, (SCREEN_WIDTH - 200, 20))
+        add((render_text(self.font_medium, f"Wave: {world.current_wave}", WHITE), (SCREEN_WIDTH - 200, 20)))
 
-        zombies_text = self.font_small.render(f"Zombies: {len(self.world.zombies)}", True, RED)
-        self.screen.blit(zombies_text, (SCREEN_WIDTH - 200, 60))
+        add((render_text(font_small, f"Zombies: {len(world.zombies)}", RED), (SCREEN_WIDTH - 200, 60)))
 
-        score_text = self.font_small.render(f"Score: {self.world.score}", True, YELLOW)
-        self.screen.blit(score_text, (SCREEN_WIDTH - 200, 90))
+        add((render_text(font_small, f"Score: {world.score}", YELLOW), (SCREEN_WIDTH - 200, 90)))
 
-        kills_text = self.font_small.render(f"Kills: {self.world.kills}", True, WHITE)
-        self.screen.blit(kills_text, (SCREEN_WIDTH - 200, 120))
+        add((render_text(font_small, f"Kills: {world.kills}", WHITE), (SCREEN_WIDTH - 200, 120)))
 
         # Coins - gold display
-        coins_text = self.font_small.render(f"$ {player.coins}", True, (255, 215, 0))
-        self.screen.blit(coins_text, (SCREEN_WIDTH - 200, 150))
+        add((render_text(font_small, f"$ {player.coins}", (255, 215, 0)), (SCREEN_WIDTH - 200, 150)))
 
         # Wave countdown
-        if not self.world.wave_active:
-            countdown = self.font_large.render(f"Next wave in: {self.world.wave_cooldown:.1f}", True, YELLOW)
-            self.screen.blit(countdown, (SCREEN_WIDTH//2 - countdown.get_width()//2, 100))
+        if not world.wave_active:
+            add(centered_text(self.font_large, f"Next wave in: {world.wave_cooldown:.1f}", YELLOW, 100))
 
-        # Weapon slots
+        # Weapon slots: one pre-composed sprite per slot
         slot_y = SCREEN_HEIGHT - 80
-        for i, weap in enumerate(player.weapons):
-            box_color = YELLOW if i == player.current_weapon_index else GRAY
-            pygame.draw.rect(self.screen, box_color, (20 + i * 70, slot_y, 60, 60), 2)
-            slot_text = self.font_small.render(str(i + 1), True, box_color)
-            self.screen.blit(slot_text, (25 + i * 70, slot_y + 5))
-
-            # Weapon name (abbreviated)
-            name_abbr = weap.name[:6]
-            name_text = pygame.font.Font(None, 18).render(name_abbr, True, WHITE)
-            self.screen.blit(name_text, (25 + i * 70, slot_y + 35))
+        current = player.current_weapon_index
+        hud.extend((get_slot_sprite(font_small, i, weap.name, i == current), (20 + i * 70, slot_y))
+                   for i, weap in enumerate(player.weapons))
 
         # Class indicator
-        class_names = {
-            PlayerClass.BUILDER: "BUILDER",
-            PlayerClass.RANGER: "RANGER",
-            PlayerClass.HEALER: "HEALER",
-            PlayerClass.TANK: "TANK"
-        }
-        class_text = self.font_medium.render(class_names[player.player_class], True, player.color)
-        self.screen.blit(class_text, (SCREEN_WIDTH//2 - class_text.get_width()//2, SCREEN_HEIGHT - 50))
+        add(centered_text(self.font_medium, HUD_CLASS_NAMES[player.player_class], player.color, SCREEN_HEIGHT - 50))
 
         # Bunker hint
-        if self.world.bunker.is_player_inside(player):
-            hint = self.font_small.render("Press B to change class", True, YELLOW)
-            self.screen.blit(hint, (SCREEN_WIDTH//2 - hint.get_width()//2, SCREEN_HEIGHT - 80))
+        if world.bunker.is_player_inside(player):
+            add(centered_text(font_small, "Press B to change class", YELLOW, SCREEN_HEIGHT - 80))
 
         # Crosshair
-        mouse_pos = pygame.mouse.get_pos()
-        pygame.draw.circle(self.screen, WHITE, mouse_pos, 10, 1)
-        pygame.draw.line(self.screen, WHITE, (mouse_pos[0] - 15, mouse_pos[1]), (mouse_pos[0] - 5, mouse_pos[1]), 2)
-        pygame.draw.line(self.screen, WHITE, (mouse_pos[0] + 5, mouse_pos[1]), (mouse_pos[0] + 15, mouse_pos[1]), 2)
-        pygame.draw.line(self.screen, WHITE, (mouse_pos[0], mouse_pos[1] - 15), (mouse_pos[0], mouse_pos[1] - 5), 2)
-        pygame.draw.line(self.screen, WHITE, (mouse_pos[0], mouse_pos[1] + 5), (mouse_pos[0], mouse_pos[1] + 15), 2)
+        if crosshair:
+            mouse_x, mouse_y = self.mouse_pos
+            add((CROSSHAIR, (mouse_x - 15, mouse_y - 15)))
+        screen.blits(hud, doreturn=False)
 
         # Draw minimap (bottom-right corner)
-        minimap_size = 150
+        minimap_size = MINIMAP_SIZE
         minimap_x = SCREEN_WIDTH - minimap_size - 20
         minimap_y = SCREEN_HEIGHT - minimap_size - 100
-        scale = minimap_size / self.world.width
-
-        # Minimap background
-        minimap_bg = pygame.Surface((minimap_size, minimap_size))
-        minimap_bg.fill((30, 30, 30))
-        minimap_bg.set_alpha(180)
-        self.screen.blit(minimap_bg, (minimap_x, minimap_y))
-
-        # Minimap border
-        pygame.draw.rect(self.screen, WHITE, (minimap_x, minimap_y, minimap_size, minimap_size), 2)
-
-        # Draw bunker on minimap
-        bunker_mx = int(minimap_x + self.world.bunker.x * scale)
-        bunker_my = int(minimap_y + self.world.bunker.y * scale)
-        bunker_mw = int(self.world.bunker.width * scale)
-        bunker_mh = int(self.world.bunker.height * scale)
-        pygame.draw.rect(self.screen, (100, 100, 100), (bunker_mx - bunker_mw//2, bunker_my - bunker_mh//2, bunker_mw, bunker_mh))
-
-        # Draw zombies on minimap (red dots)
-        for zombie in self.world.zombies:
-            zx = int(minimap_x + zombie.x * scale)
-            zy = int(minimap_y + zombie.y * scale)
-            # Make sure dot is within minimap bounds
-            if minimap_x <= zx <= minimap_x + minimap_size and minimap_y <= zy <= minimap_y + minimap_size:
-                # Different colors for different zombie types
-                if zombie.zombie_type == "zombie_king":
-                    pygame.draw.circle(self.screen, PURPLE, (zx, zy), 4)
-                elif zombie.zombie_type == "cage_walker":
-                    pygame.draw.circle(self.screen, ORANGE, (zx, zy), 3)
-                elif zombie.zombie_type == "tank":
-                    pygame.draw.circle(self.screen, (150, 50, 50), (zx, zy), 2)
-                else:
-                    pygame.draw.circle(self.screen, RED, (zx, zy), 1)
+        scale = minimap_size / world.width
+
+        # Minimap background, border and bunker (pre-drawn per world)
+        screen.blit(self.minimap_background, (minimap_x, minimap_y))
+
+        # Draw zombies on minimap (red dots), batched into one blits() call
+        dots = []
+        minimap_right = minimap_x + minimap_size
+        minimap_bottom = minimap_y + minimap_size
+        zombies = world.zombies
+        if NUMPY_AVAILABLE and zombies:
+            # Project and clip every zombie in one vectorized pass; map() with
+            # attrgetter keeps the per-zombie gathers out of the interpreter loop
+            n = len(zombies)
+            zx = (minimap_x + np.fromiter(map(attrgetter('x'), zombies), np.float64, n) * scale).astype(np.int32)
+            zy = (minimap_y + np.fromiter(map(attrgetter('y'), zombies), np.float64, n) * scale).astype(np.int32)
+            radius = np.fromiter(map(attrgetter('minimap_radius'), zombies), np.int32, n)
+            inside = (zx >= minimap_x) & (zx <= minimap_right) & (zy >= minimap_y) & (zy <= minimap_bottom)
+            sprites = map(attrgetter('minimap_sprite'), compress(zombies, inside.tolist()))
+            dots.extend(zip(sprites, zip((zx - radius)[inside].tolist(), (zy - radius)[inside].tolist())))
+        else:
+            add_dot = dots.append
+            for zombie in zombies:
+                zx = int(minimap_x + zombie.x * scale)
+                zy = int(minimap_y + zombie.y * scale)
+                # Make sure dot is within minimap bounds
+                if minimap_x <= zx <= minimap_right and minimap_y <= zy <= minimap_bottom:
+                    radius = zombie.minimap_radius
+                    add_dot((zombie.minimap_sprite, (zx - radius, zy - radius)))
 
         # Draw players on minimap (colored dots)
-        for p in self.world.players:
-            px = int(minimap_x + p.x * scale)
-            py = int(minimap_y + p.y * scale)
-            pygame.draw.circle(self.screen, p.color, (px, py), 4)
-            pygame.draw.circle(self.screen, WHITE, (px, py), 4, 1)
+        dots.extend((get_marker_sprite(p.color), (int(minimap_x + p.x * scale) - 4, int(minimap_y + p.y * scale) - 4))
+                    for p in world.players)
+        screen.blits(dots, doreturn=False)
 
         # Draw camera view rectangle
-        cam_x = int(minimap_x + self.camera_offset[0] * scale)
-        cam_y = int(minimap_y + self.camera_offset[1] * scale)
-        cam_w = int(SCREEN_WIDTH * scale)
-        cam_h = int(SCREEN_HEIGHT * scale)
-        pygame.draw.rect(self.screen, (255, 255, 255, 100), (cam_x, cam_y, cam_w, cam_h), 1)
+        view = self.minimap_view
+        view.topleft = (int(minimap_x + self.camera_offset[0] * scale),
+                        int(minimap_y + self.camera_offset[1] * scale))
+        pygame.draw.rect(screen, (255, 255, 255, 100), view, 1)
 
         # Minimap label
-        map_label = pygame.font.Font(None, 18).render("MAP", True, WHITE)
-        self.screen.blit(map_label, (minimap_x + minimap_size//2 - map_label.get_width()//2, minimap_y - 15))
+        map_label = render_text(FONT_18, "MAP", WHITE)
+        screen.blit(map_label, (minimap_x + minimap_size//2 - map_label.get_width()//2, minimap_y - 15))
 
         # Draw touch controls
         if self.touch_enabled:
-            self.move_joystick.draw(self.screen)
-            self.aim_joystick.draw(self.screen)
-            self.shoot_button.draw(self.screen, self.font_small)
-            self.ability_button.draw(self.screen, self.font_small)
-            self.weapon_prev_button.draw(self.screen, self.font_small)
-            self.weapon_next_button.draw(self.screen, self.font_small)
-            self.reload_button.draw(self.screen, self.font_small)
+            self.move_joystick.draw(screen)
+            self.aim_joystick.draw(screen)
+            self.shoot_button.draw(screen, font_small)
+            self.ability_button.draw(screen, font_small)
+            self.weapon_prev_button.draw(screen, font_small)
+            self.weapon_next_button.draw(screen, font_small)
+            self.reload_button.draw(screen, font_small)
 
     def draw_paused(self):
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill(BLACK)
-        overlay.set_alpha(150)
-        self.screen.blit(overlay, (0, 0))
-
-        paused = self.font_large.render("PAUSED", True, WHITE)
-        self.screen.blit(paused, (SCREEN_WIDTH//2 - paused.get_width()//2, SCREEN_HEIGHT//2 - 100))
-
-        resume = self.font_medium.render("Press ESC to resume", True, WHITE)
-        quit_text = self.font_medium.render("Press Q to quit to menu", True, WHITE)
-        self.screen.blit(resume, (SCREEN_WIDTH//2 - resume.get_width()//2, SCREEN_HEIGHT//2))
-        self.screen.blit(quit_text, (SCREEN_WIDTH//2 - quit_text.get_width()//2, SCREEN_HEIGHT//2 + 50))
+        # Semi-transparent overlay, then the centered text, in one blits() call
+        self.screen.blits([
+            (PAUSE_OVERLAY, (0, 0)),
+            centered_text(self.font_large, "PAUSED", WHITE, SCREEN_HEIGHT//2 - 100),
+            centered_text(self.font_medium, "Press ESC to resume", WHITE, SCREEN_HEIGHT//2),
+            centered_text(self.font_medium, "Press Q to quit to menu", WHITE, SCREEN_HEIGHT//2 + 50),
+        ], doreturn=False)
 
     def draw_game_over(self):
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill(BLACK)
-        overlay.set_alpha(200)
-        self.screen.blit(overlay, (0, 0))
-
-        game_over = self.font_large.render("GAME OVER", True, RED)
-        self.screen.blit(game_over, (SCREEN_WIDTH//2 - game_over.get_width()//2, SCREEN_HEIGHT//2 - 150))
-
-        wave_text = self.font_medium.render(f"Survived {self.world.current_wave} waves", True, WHITE)
-        score_text = self.font_medium.render(f"Final Score: {self.world.score}", True, YELLOW)
-        kills_text = self.font_medium.render(f"Total Kills: {self.world.kills}", True, WHITE)
-
-        self.screen.blit(wave_text, (SCREEN_WIDTH//2 - wave_text.get_width()//2, SCREEN_HEIGHT//2 - 50))
-        self.screen.blit(score_text, (SCREEN_WIDTH//2 - score_text.get_width()//2, SCREEN_HEIGHT//2))
-        self.screen.blit(kills_text, (SCREEN_WIDTH//2 - kills_text.get_width()//2, SCREEN_HEIGHT//2 + 50))
-
-        retry = self.font_small.render("Press R to retry", True, WHITE)
-        menu = self.font_small.render("Press ESC for menu", True, WHITE)
-        self.screen.blit(retry, (SCREEN_WIDTH//2 - retry.get_width()//2, SCREEN_HEIGHT//2 + 150))
-        self.screen.blit(menu, (SCREEN_WIDTH//2 - menu.get_width()//2, SCREEN_HEIGHT//2 + 190))
+        # Semi-transparent overlay, then the centered text, in one blits() call
+        self.screen.blits([
+            (GAME_OVER_OVERLAY, (0, 0)),
+            centered_text(self.font_large, "GAME OVER", RED, SCREEN_HEIGHT//2 - 150),
+            centered_text(self.font_medium, f"Survived {self.world.current_wave} waves", WHITE, SCREEN_HEIGHT//2 - 50),
+            centered_text(self.font_medium, f"Final Score: {self.world.score}", YELLOW, SCREEN_HEIGHT//2),
+            centered_text(self.font_medium, f"Total Kills: {self.world.kills}", WHITE, SCREEN_HEIGHT//2 + 50),
+            centered_text(self.font_small, "Press R to retry", WHITE, SCREEN_HEIGHT//2 + 150),
+            centered_text(self.font_small, "Press ESC for menu", WHITE, SCREEN_HEIGHT//2 + 190),
+        ], doreturn=False)
 
     def draw_weapon_popup(self):
         """Draw weapon pickup popup with rarity background."""
@@ -5544,10 +6719,7 @@ class Game:
         rarity_name, rarity_color = get_weapon_rarity(weapon_key) if weapon_key else ("Unknown", (150, 150, 150))
 
         # Semi-transparent dark overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill(BLACK)
-        overlay.set_alpha(180)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(POPUP_OVERLAY, (0, 0))
 
         # Popup box dimensions
         popup_width = 450
@@ -5573,22 +6745,19 @@ class Game:
             title_text = "AMMO REFILLED"
             title_color = (100, 255, 100)
 
-        title = self.font_large.render(title_text, True, title_color)
-        self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, popup_y + 20))
+        self.screen.blit(*centered_text(self.font_large, title_text, title_color, popup_y + 20))
 
         # Weapon name
-        weapon_name = self.font_medium.render(weapon.name, True, WHITE)
-        self.screen.blit(weapon_name, (SCREEN_WIDTH//2 - weapon_name.get_width()//2, popup_y + 90))
+        self.screen.blit(*centered_text(self.font_medium, weapon.name, WHITE, popup_y + 90))
 
         # Rarity label
-        rarity_label = self.font_small.render(rarity_name.upper(), True, rarity_color)
-        self.screen.blit(rarity_label, (SCREEN_WIDTH//2 - rarity_label.get_width()//2, popup_y + 140))
+        self.screen.blit(*centered_text(self.font_small, rarity_name.upper(), rarity_color, popup_y + 140))
 
         # Weapon stats
         stats_y = popup_y + 180
-        damage_text = self.font_small.render(f"Damage: {weapon.damage}", True, WHITE)
-        fire_rate_text = self.font_small.render(f"Fire Rate: {weapon.fire_rate}/s", True, WHITE)
-        ammo_text = self.font_small.render(f"Ammo: {weapon.max_ammo}", True, WHITE)
+        damage_text = render_text(self.font_small, f"Damage: {weapon.damage}", WHITE)
+        fire_rate_text = render_text(self.font_small, f"Fire Rate: {weapon.fire_rate}/s", WHITE)
+        ammo_text = render_text(self.font_small, f"Ammo: {weapon.max_ammo}", WHITE)
 
         self.screen.blit(damage_text, (popup_x + 40, stats_y))
         self.screen.blit(fire_rate_text, (popup_x + 40, stats_y + 30))
@@ -5602,74 +6771,131 @@ class Game:
 
         pygame.draw.rect(self.screen, GREEN, (btn_x, btn_y, btn_width, btn_height), border_radius=10)
         pygame.draw.rect(self.screen, WHITE, (btn_x, btn_y, btn_width, btn_height), 3, border_radius=10)
-        ok_text = self.font_medium.render("OK", True, BLACK)
+        ok_text = render_text(self.font_medium, "OK", BLACK)
         self.screen.blit(ok_text, (btn_x + btn_width//2 - ok_text.get_width()//2, btn_y + btn_height//2 - ok_text.get_height()//2))
 
         # Store button rect for click detection
         self.weapon_popup_btn_rect = pygame.Rect(btn_x, btn_y, btn_width, btn_height)
 
     def draw(self):
-        if self.state == GameState.ACCOUNT:
-            self.draw_account_screen()
-        elif self.state == GameState.REGISTER:
-            self.draw_register_screen()
-        elif self.state == GameState.LOGIN:
-            self.draw_login_screen()
-        elif self.state == GameState.MENU:
-            self.draw_menu()
-        elif self.state == GameState.CLASS_SELECT:
-            self.draw_class_select()
-        elif self.state == GameState.HOST_GAME:
-            self.draw_host_screen()
-        elif self.state == GameState.JOIN_GAME:
-            self.draw_join_screen()
-        elif self.state == GameState.PLAYING:
-            self.world.draw(self.screen, self.camera_offset)
-            self.draw_hud()
-            # Draw weapon popup on top if active
-            if self.weapon_popup_active:
-                self.draw_weapon_popup()
-        elif self.state == GameState.PAUSED:
-            self.world.draw(self.screen, self.camera_offset)
-            self.draw_hud()
-            self.draw_paused()
-        elif self.state == GameState.GAME_OVER:
-            self.world.draw(self.screen, self.camera_offset)
-            self.draw_game_over()
+        draw_state = self.draw_handlers.get(self.state)
+        if draw_state is not None:
+            draw_state()
 
+        # Full-frame present: the camera scrolls and nearly every pixel changes,
+        # so a dirty-rect display.update(rects) would only add per-rect overhead
         pygame.display.flip()
 
+    def store_previous_positions(self):
+        """Remember the camera and player positions before a simulation step."""
+        self.prev_camera = (self.camera_offset[0], self.camera_offset[1])
+        self.prev_positions = [(p, p.x, p.y) for p in self.world.players] if self.world else []
+
+    def draw_playing(self):
+        self.frozen_world = None
+        if self.prev_camera is None:
+            self.world.draw(self.screen, self.camera_offset)
+        else:
+            # Draw the camera and players between their last two steps; the
+            # players' simulated positions are put back straight after
+            alpha = self.render_alpha
+            prev_x, prev_y = self.prev_camera
+            camera = (prev_x + (self.camera_offset[0] - prev_x) * alpha,
+                      prev_y + (self.camera_offset[1] - prev_y) * alpha)
+            moved = []
+            for p, prev_x, prev_y in self.prev_positions:
+                x, y = p.x, p.y
+                moved.append((p, x, y))
+                p.x = prev_x + (x - prev_x) * alpha
+                p.y = prev_y + (y - prev_y) * alpha
+            self.world.draw(self.screen, camera)
+            for p, x, y in moved:
+                p.x = x
+                p.y = y
+        self.draw_hud()
+        # Draw weapon popup on top if active
+        if self.weapon_popup_active:
+            self.draw_weapon_popup()
+
+    def draw_paused_frame(self):
+        # The HUD can't change while paused, so it is frozen with the world;
+        # only the crosshair still follows the mouse
+        self.draw_frozen_world(with_hud=True)
+        mouse_x, mouse_y = self.mouse_pos
+        self.screen.blit(CROSSHAIR, (mouse_x - 15, mouse_y - 15))
+        self.draw_paused()
+
+    def draw_game_over_frame(self):
+        # Nothing on the game-over screen changes, so the overlay and final
+        # stats are baked into the frozen frame along with the world
+        self.draw_frozen_world(overlay=self.draw_game_over)
+
+    def draw_frozen_world(self, with_hud=False, overlay=None):
+        """Draw the world once when play stops (paused/game over), then reuse that frame.
+
+        with_hud and overlay (a draw method) add static layers to the frozen frame.
+        """
+        if self.frozen_world is None:
+            self.world.draw(self.screen, self.camera_offset)
+            if with_hud:
+                self.draw_hud(crosshair=False)
+            if overlay is not None:
+                overlay()
+            self.frozen_world = self.screen.copy()
+        else:
+            self.screen.blit(self.frozen_world, (0, 0))
+
     async def run(self):
+        sim_time = 0.0  # Frame time not yet simulated
+        last_time = time.perf_counter()
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
-
-            for event in pygame.event.get():
+            self.clock.tick(FPS)
+            # Measure the frame with perf_counter rather than tick()'s whole
+            # milliseconds, so simulated time keeps pace with real time at any
+            # frame rate. Cap it so one stall can't tunnel bullets through
+            # zombies or teleport everything across the map
+            now = time.perf_counter()
+            sim_time += min(now - last_time, MAX_FRAME_DT)
+            last_time = now
+
+            # Look the handler up once per frame; it only changes again if an
+            # event switches state partway through the queue
+            state = self.state
+            handle_event = self.event_handlers.get(state)
+            events = pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
 
-                if self.state == GameState.ACCOUNT:
-                    self.handle_account_events(event)
-                elif self.state == GameState.REGISTER:
-                    self.handle_register_events(event)
-                elif self.state == GameState.LOGIN:
-                    self.handle_login_events(event)
-                elif self.state == GameState.MENU:
-                    self.handle_menu_events(event)
-                elif self.state == GameState.CLASS_SELECT:
-                    self.handle_class_select_events(event)
-                elif self.state == GameState.HOST_GAME:
-                    self.handle_host_events(event)
-                elif self.state == GameState.JOIN_GAME:
-                    self.handle_join_events(event)
-                elif self.state == GameState.PLAYING:
-                    self.handle_playing_events(event)
-                elif self.state == GameState.PAUSED:
-                    self.handle_paused_events(event)
-                elif self.state == GameState.GAME_OVER:
-                    self.handle_game_over_events(event)
-
-            self.update(dt)
-            self.draw()
+                if self.state is not state:
+                    state = self.state
+                    handle_event = self.event_handlers.get(state)
+                if handle_event is not None:
+                    handle_event(event)
+
+            # Snapshot the mouse once per frame; update and draw both read it
+            # so the crosshair always matches the aim the simulation used.
+            # Held keys come from one get_pressed() array rather than sets
+            # kept in sync with KEYDOWN/KEYUP events
+            self.mouse_pos = pygame.mouse.get_pos()
+            self.mouse_pressed = pygame.mouse.get_pressed()
+            self.keys_pressed = pygame.key.get_pressed()
+
+            # Fixed-step simulation: the world advances in identical FIXED_DT
+            # ticks whatever the frame rate, so motion and timers don't drift
+            # with frame time and every peer steps the same way
+            while sim_time >= FIXED_DT:
+                self.store_previous_positions()
+                self.update(FIXED_DT)
+                sim_time -= FIXED_DT
+            # Frames rarely land on a step boundary (and below 60 FPS take one or
+            # two steps by turns), so draw the remainder as a blend of the last two
+            self.render_alpha = sim_time / FIXED_DT
+
+            # Idle frames on static screens keep the last flipped image
+            if events or self.state in LIVE_DRAW_STATES or self.state is not self.drawn_state:
+                self.draw()
+                self.drawn_state = self.state
 
             await asyncio.sleep(0)  # Required for Pygbag
 